@@ -0,0 +1,302 @@
+"""
+Asyncio execution core for account health updates
+"""
+import asyncio
+import logging
+import threading
+import time
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from hexbytes import HexBytes
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
+from web3._utils.error_formatters_utils import raise_contract_logic_error_on_revert
+
+from .config_loader import ChainConfig
+from .contract_registry import CallCodec, ContractRegistry
+from .pyth_cache import PythUpdateCache
+
+logger = logging.getLogger("liquidation_bot")
+
+
+def to_bytes_list(update_data: List[str]) -> List[bytes]:
+    """
+    Convert hex encoded update data to bytes for the ABI encoder.
+    """
+    return [bytes.fromhex(data.removeprefix("0x")) for data in update_data]
+
+
+class AsyncEngine:
+    """
+    Runs account health updates as coroutines on a dedicated event loop thread.
+
+    RPC calls go through AsyncWeb3 with precompiled call codecs, and Hermes requests through
+    an aiohttp session. Instead of holding an OS thread per in-flight request, concurrency is
+    bounded by a semaphore of ASYNC_MAX_IN_FLIGHT requests. Work without an async
+    implementation (liquidation simulation and execution) runs on a small thread pool.
+    """
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, config: ChainConfig):
+        self.config = config
+        self.max_in_flight = config.ASYNC_MAX_IN_FLIGHT
+        self.blocking_executor = ThreadPoolExecutor(max_workers=config.ASYNC_BLOCKING_WORKERS)
+
+        self.loop = asyncio.new_event_loop()
+        self.semaphore = asyncio.Semaphore(self.max_in_flight)
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.w3 = AsyncWeb3(AsyncHTTPProvider(config.RPC_URL))
+        self.mainnet_w3 = AsyncWeb3(AsyncHTTPProvider(config.mainnet_w3.provider.endpoint_uri))
+        self.pyth_flights: Dict[Tuple[str, ...], asyncio.Task] = {}
+
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+        self.thread = threading.Thread(target=self.run_loop, daemon=True)
+        self.thread.start()
+        self.run(self.open_session())
+
+    @staticmethod
+    def get_instance(config: ChainConfig) -> "AsyncEngine":
+        """
+        Get the async engine for the chain of the given config.
+        """
+        with AsyncEngine._instances_lock:
+            if config.CHAIN_ID not in AsyncEngine._instances:
+                AsyncEngine._instances[config.CHAIN_ID] = AsyncEngine(config)
+            return AsyncEngine._instances[config.CHAIN_ID]
+
+    def run_loop(self) -> None:
+        """
+        Run the event loop, should be run in a standalone thread.
+        """
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    async def open_session(self) -> None:
+        """
+        Open a shared aiohttp session sized for ASYNC_MAX_IN_FLIGHT connections,
+        used for both RPC and HTTP API requests.
+        """
+        connector = aiohttp.TCPConnector(limit=self.max_in_flight)
+        self.session = aiohttp.ClientSession(connector=connector,
+                                             timeout=aiohttp.ClientTimeout(total=30))
+        await self.w3.provider.cache_async_session(self.session)
+        await self.mainnet_w3.provider.cache_async_session(self.session)
+
+    def submit(self, coroutine: Coroutine) -> Future:
+        """
+        Schedule a coroutine on the engine loop from any thread.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def run(self, coroutine: Coroutine) -> Any:
+        """
+        Run a coroutine on the engine loop and wait for its result.
+        Must not be called from the engine loop itself.
+        """
+        return self.submit(coroutine).result()
+
+    async def run_blocking(self, function: Callable, *args) -> Any:
+        """
+        Run a blocking function on the engine's thread pool.
+        """
+        return await self.loop.run_in_executor(self.blocking_executor, function, *args)
+
+    def stop(self) -> None:
+        """
+        Close the session and stop the event loop.
+        """
+        if self.session is not None:
+            self.run(self.session.close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.blocking_executor.shutdown(wait=False)
+
+    async def call(self, address: str, codec: CallCodec, *args, value: int = 0,
+                   w3: Optional[AsyncWeb3] = None) -> Tuple[Any, ...]:
+        """
+        Make an eth_call using a precompiled codec, within the in-flight limit.
+        The request goes straight to the provider, skipping the middleware and result
+        formatters of AsyncWeb3, which cost more CPU than the call itself.
+        Reverts raise the same exceptions as a web3 contract call.
+
+        Args:
+            address (str): The address of the contract.
+            codec (CallCodec): Codec of the function to call.
+            *args: Function arguments.
+            value (int, optional): Value to send with the call. Defaults to 0.
+            w3 (Optional[AsyncWeb3]): Web3 instance to call through, defaults to the chain's.
+
+        Returns:
+            Tuple[Any, ...]: The decoded return values.
+        """
+        transaction = {"to": address, "data": "0x" + codec.encode(*args).hex()}
+        if value:
+            transaction["value"] = hex(value)
+
+        async with self.semaphore:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                response = await (w3 or self.w3).provider.make_request(
+                    "eth_call", [transaction, "latest"])
+            finally:
+                self.in_flight -= 1
+
+        if "error" in response:
+            raise_contract_logic_error_on_revert(response)
+            raise ValueError(response["error"])
+        return codec.decode(HexBytes(response["result"]))
+
+    async def get_json(self, url: str, params: Any) -> Dict[str, Any]:
+        """
+        Make a GET request to an HTTP API within the in-flight limit.
+        """
+        async with self.semaphore:
+            async with self.session.get(url, params=params) as response:
+                response.raise_for_status()
+                return await response.json()
+
+    async def get_pyth_update_data(self, feed_ids: List[str]) -> List[str]:
+        """
+        Get Pyth update data, served from the per chain update cache when fresh.
+        Concurrent requests for the same feeds share a single Hermes request.
+        """
+        cache = PythUpdateCache.get_instance(self.config)
+        key = cache.get_key(feed_ids)
+        update_data = cache.get_cached_update_data(key)
+        if update_data is not None:
+            return update_data
+
+        task = self.pyth_flights.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.fetch_pyth_update_data(key))
+            self.pyth_flights[key] = task
+            task.add_done_callback(lambda _: self.pyth_flights.pop(key, None))
+        return await task
+
+    async def fetch_pyth_update_data(self, key: Tuple[str, ...]) -> List[str]:
+        """
+        Fetch the latest update data for the feeds from Hermes and store it in the cache.
+        """
+        logger.info("AsyncEngine: Getting update data for feeds: %s", key)
+        api_return_data = await self.get_json(
+            f"{self.config.PYTH_HERMES_URL}/v2/updates/price/latest",
+            [("ids[]", feed_id) for feed_id in key])
+
+        update_data = ["0x" + data for data in api_return_data["binary"]["data"]]
+        PythUpdateCache.get_instance(self.config).store_update_data(key, update_data)
+        return update_data
+
+    async def get_pyth_update_fee(self, update_data: List[str]) -> int:
+        """
+        Get the Pyth update fee for update data, served from the per chain update cache.
+        """
+        cache = PythUpdateCache.get_instance(self.config)
+        fee = cache.get_cached_update_fee(update_data)
+        if fee is None:
+            (fee,) = await self.call(
+                self.config.PYTH,
+                ContractRegistry.get_codec(self.config.PYTH_ABI_PATH, "getUpdateFee"),
+                to_bytes_list(update_data))
+            cache.store_update_fee(update_data, fee)
+        return fee
+
+    async def get_account_values_with_pyth_batch_simulation(self, vault, account_address: str,
+                                                            feed_ids: List[str]
+                                                            ) -> Tuple[int, int]:
+        """
+        Get account liquidity by simulating a Pyth price update followed by
+        an account status query through the liquidator contract.
+        """
+        update_data = await self.get_pyth_update_data(feed_ids)
+        update_fee = await self.get_pyth_update_fee(update_data)
+
+        result = await self.call(
+            self.config.liquidator.address,
+            ContractRegistry.get_codec(self.config.LIQUIDATOR_ABI_PATH,
+                                       "simulatePythUpdateAndGetAccountStatus"),
+            to_bytes_list(update_data), update_fee, vault.address, account_address,
+            value=update_fee)
+        return result[0], result[1]
+
+    async def get_account_liquidity(self, vault, account_address: str,
+                                    ignored_errors: Tuple[str, ...]) -> Tuple[int, int, int]:
+        """
+        Async counterpart of Vault.get_account_liquidity, with the same error handling.
+
+        Args:
+            vault (Vault): The controller vault.
+            account_address (str): The address of the account to check.
+            ignored_errors (Tuple[str, ...]): Error selectors that mean the account has no
+                position, which are not logged.
+
+        Returns:
+            Tuple[int, int, int]: A tuple containing (balance, collateral_value, liability_value).
+        """
+        account_address = Web3.to_checksum_address(account_address)
+        try:
+            (balance,) = await self.call(vault.address, vault.get_codec("balanceOf"),
+                                         account_address)
+        except Exception as ex: # pylint: disable=broad-except
+            logger.error("AsyncEngine: Failed to get balance for account %s: %s",
+                         account_address, ex, exc_info=True)
+            return (0, 0, 0)
+
+        try:
+            if (time.time() - vault.last_pyth_feed_ids_update >
+                self.config.PYTH_CACHE_REFRESH):
+                await self.run_blocking(vault.refresh_pyth_feed_ids)
+
+            if len(vault.pyth_feed_ids) > 0:
+                collateral_value, liability_value = (
+                    await self.get_account_values_with_pyth_batch_simulation(
+                        vault, account_address, vault.pyth_feed_ids))
+            else:
+                (collateral_value, liability_value) = await self.call(
+                    vault.address, vault.get_codec("accountLiquidity"), account_address, True)
+        except Exception as ex: # pylint: disable=broad-except
+            if not ex.args or ex.args[0] not in ignored_errors:
+                logger.error("AsyncEngine: Failed to get account liquidity"
+                             " for account %s: %s", account_address, ex, exc_info=True)
+            return (balance, 0, 0)
+
+        return (balance, collateral_value, liability_value)
+
+    async def get_usd_quotes(self, units_of_account: List[str]) -> Dict[str, int]:
+        """
+        Get the USD price of 10**18 units of account for WETH and BTC denominated vaults.
+        """
+        quote_codec = ContractRegistry.get_codec(self.config.ORACLE_ABI_PATH, "getQuote")
+        usd_quotes = {}
+        if self.config.WETH in units_of_account:
+            (usd_quotes[self.config.WETH],) = await self.call(
+                self.config.MAINNET_ETH_ADAPTER, quote_codec, 10**18,
+                self.config.MAINNET_ETH_ADDRESS, self.config.USD, w3=self.mainnet_w3)
+        if self.config.BTC in units_of_account:
+            (usd_quotes[self.config.BTC],) = await self.call(
+                self.config.MAINNET_BTC_ADAPTER, quote_codec, 10**18,
+                self.config.BTC, self.config.USD, w3=self.mainnet_w3)
+        return usd_quotes
+
+    async def update_liquidity(self, account, ignored_errors: Tuple[str, ...]) -> float:
+        """
+        Async counterpart of Account.update_liquidity.
+        Updates the account's liquidity and next scheduled update.
+
+        Returns:
+            float: The updated health score of the account.
+        """
+        if account.controller.metadata is None:
+            await self.run_blocking(account.controller.get_metadata)
+
+        liquidity = await self.get_account_liquidity(account.controller, account.address,
+                                                     ignored_errors)
+        usd_quotes = await self.get_usd_quotes([account.controller.unit_of_account])
+        account.set_liquidity(*liquidity, usd_quotes=usd_quotes)
+        account.get_time_of_next_update()
+        return account.current_health_score
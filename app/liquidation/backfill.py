@@ -0,0 +1,236 @@
+"""
+Concurrent historical log backfill with adaptive block range sizes
+"""
+import logging
+import threading
+import time
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .config_loader import ChainConfig
+
+logger = logging.getLogger("liquidation_bot")
+
+# Fragments of provider error messages meaning the requested range or result set is too large
+RANGE_ERROR_MESSAGES = ("block range", "range too large", "too many results", "response size",
+                        "query returned more than", "is limited to", "exceed maximum",
+                        "exceeds max")
+
+
+def is_range_error(ex: Exception) -> bool:
+    """
+    Check whether an eth_getLogs error means the block range should be split.
+    """
+    message = str(ex).lower()
+    return any(fragment in message for fragment in RANGE_ERROR_MESSAGES)
+
+
+class LogBackfill:
+    """
+    Fetches logs for a block range in chunks on up to BACKFILL_MAX_CONCURRENCY threads,
+    and applies them strictly in block order.
+
+    The chunk size starts at BATCH_SIZE and adapts to the provider: a chunk failing with a
+    range or result size error is split in half and the chunk size shrinks, while chunks
+    returning fewer than half of BACKFILL_TARGET_LOGS logs grow it, within
+    [BACKFILL_MIN_CHUNK, BACKFILL_MAX_CHUNK], and never back above a rejected size.
+    Fetched chunks are buffered until every block before them has been applied, so the
+    checkpoint callback always sees a contiguous prefix of the range and an interrupted
+    backfill resumes from the last checkpoint.
+    Ranges can also be applied newest first, for consumers that only need the latest log
+    per key.
+
+    The fetch function returns the items to apply for a range along with the number of
+    raw logs the provider returned, which drives the chunk size even when the items are
+    decoded or deduplicated.
+    """
+    def __init__(self, config: ChainConfig,
+                 fetch: Callable[[int, int], Tuple[List[Any], int]],
+                 apply: Callable[[int, int, List[Any]], None],
+                 checkpoint: Optional[Callable[[int], None]] = None):
+        self.config = config
+        self.fetch = fetch
+        self.apply = apply
+        self.checkpoint = checkpoint
+
+        self.max_concurrency = config.BACKFILL_MAX_CONCURRENCY
+        self.min_chunk = config.BACKFILL_MIN_CHUNK
+        self.max_chunk = config.BACKFILL_MAX_CHUNK
+        self.target_logs = config.BACKFILL_TARGET_LOGS
+        self.chunk_size = min(max(config.BATCH_SIZE, self.min_chunk), self.max_chunk)
+
+        self.lock = threading.Lock()
+        self.start_block = 0
+        self.end_block = 0
+        self.applied_block = 0
+        self.start_time = 0
+        self.logs_applied = 0
+        self.range_errors = 0
+        self.running = False
+        self.reverse = False
+
+    def run(self, start_block: int, end_block: int, reverse: bool = False) -> int:
+        """
+        Fetch and apply all logs from start_block to end_block, inclusive.
+
+        Args:
+            start_block (int): First block to fetch.
+            end_block (int): Last block to fetch.
+            reverse (bool, optional): Apply chunks from end_block down to start_block
+                instead. Logs within a chunk are still in block order. Defaults to False.
+
+        Returns:
+            int: The last block applied, the lowest one in reverse.
+        """
+        self.start_block = start_block
+        self.end_block = end_block
+        self.reverse = reverse
+        self.applied_block = end_block + 1 if reverse else start_block - 1
+        self.start_time = time.time()
+        self.logs_applied = 0
+        self.running = True
+
+        next_block = end_block if reverse else start_block
+        next_apply_block = next_block
+        last_checkpoint = time.time()
+        # First block to be applied (the end block in reverse) -> (other end block, items,
+        # raw log count) of fetched chunks waiting for earlier chunks
+        fetched: Dict[int, Tuple[int, List[Any], int]] = {}
+        futures: Dict[Future, Tuple[int, int, int]] = {}
+        retry_ranges: List[Tuple[int, int, int]] = []
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            try:
+                while start_block <= next_apply_block <= end_block:
+                    # Don't run too far ahead of the first unapplied chunk
+                    while (len(futures) < self.max_concurrency and
+                           len(fetched) < 4 * self.max_concurrency and
+                           (retry_ranges or start_block <= next_block <= end_block)):
+                        if retry_ranges:
+                            chunk = retry_ranges.pop()
+                        elif reverse:
+                            chunk_start = max(next_block - self.chunk_size + 1, start_block)
+                            chunk = (chunk_start, next_block, 0)
+                            next_block = chunk_start - 1
+                        else:
+                            chunk_end = min(next_block + self.chunk_size - 1, end_block)
+                            chunk = (next_block, chunk_end, 0)
+                            next_block = chunk_end + 1
+                        futures[executor.submit(self.fetch, chunk[0], chunk[1])] = chunk
+                        time.sleep(self.config.BATCH_INTERVAL)
+
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        chunk_start, chunk_end, attempt = futures.pop(future)
+                        try:
+                            items, num_logs = future.result()
+                        except Exception as ex: # pylint: disable=broad-except
+                            retry_ranges.extend(
+                                self.handle_fetch_error(chunk_start, chunk_end, attempt, ex))
+                            continue
+                        self.adapt_chunk_size(chunk_end - chunk_start + 1, num_logs)
+                        if reverse:
+                            fetched[chunk_end] = (chunk_start, items, num_logs)
+                        else:
+                            fetched[chunk_start] = (chunk_end, items, num_logs)
+
+                    while next_apply_block in fetched:
+                        last_block, items, num_logs = fetched.pop(next_apply_block)
+                        self.apply(min(next_apply_block, last_block),
+                                   max(next_apply_block, last_block), items)
+                        with self.lock:
+                            self.applied_block = last_block
+                            self.logs_applied += num_logs
+                        next_apply_block = last_block - 1 if reverse else last_block + 1
+
+                    if (self.checkpoint is not None and
+                        time.time() - last_checkpoint > self.config.BACKFILL_CHECKPOINT_INTERVAL):
+                        self.checkpoint(self.applied_block)
+                        last_checkpoint = time.time()
+                        self.log_progress()
+            finally:
+                self.running = False
+                for future in futures:
+                    future.cancel()
+                # Also checkpoint on errors, so a retried backfill resumes after the applied blocks
+                if self.checkpoint is not None:
+                    self.checkpoint(self.applied_block)
+                self.log_progress()
+
+        return self.applied_block
+
+    def handle_fetch_error(self, chunk_start: int, chunk_end: int, attempt: int,
+                           ex: Exception) -> List[Tuple[int, int, int]]:
+        """
+        Get the ranges to retry after a failed fetch.
+        Range errors split the chunk in half, other errors retry it after RETRY_DELAY,
+        up to NUM_RETRIES times.
+
+        Returns:
+            List[Tuple[int, int, int]]: (start block, end block, attempt) of ranges to fetch.
+        """
+        if is_range_error(ex) and chunk_end > chunk_start:
+            with self.lock:
+                self.range_errors += 1
+                self.chunk_size = max(self.min_chunk, (chunk_end - chunk_start + 1) // 2)
+                # Don't grow back to a size the provider rejected
+                self.max_chunk = min(self.max_chunk, self.chunk_size)
+            middle = (chunk_start + chunk_end) // 2
+            logger.info("LogBackfill: Range %s to %s too large, splitting, chunk size now %s",
+                        chunk_start, chunk_end, self.chunk_size)
+            # Retried ranges are popped from the end, fetch the half applied first first
+            halves = [(middle + 1, chunk_end, 0), (chunk_start, middle, 0)]
+            return halves[::-1] if self.reverse else halves
+
+        if attempt + 1 >= self.config.NUM_RETRIES:
+            raise RuntimeError(f"Failed to fetch logs for blocks {chunk_start} to {chunk_end} "
+                               f"after {attempt + 1} attempts") from ex
+
+        logger.warning("LogBackfill: Failed to fetch blocks %s to %s (attempt %s/%s): %s",
+                       chunk_start, chunk_end, attempt + 1, self.config.NUM_RETRIES, ex)
+        time.sleep(self.config.RETRY_DELAY)
+        return [(chunk_start, chunk_end, attempt + 1)]
+
+    def adapt_chunk_size(self, chunk_blocks: int, num_logs: int) -> None:
+        """
+        Grow the chunk size after sparse chunks and shrink it after dense ones,
+        aiming at BACKFILL_TARGET_LOGS logs per request.
+        """
+        with self.lock:
+            if num_logs > self.target_logs:
+                self.chunk_size = max(self.min_chunk, chunk_blocks // 2)
+            elif num_logs < self.target_logs // 2 and chunk_blocks >= self.chunk_size:
+                self.chunk_size = min(self.max_chunk, self.chunk_size * 2)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get backfill progress metrics.
+        """
+        with self.lock:
+            applied_blocks = (self.end_block - self.applied_block + 1 if self.reverse else
+                              self.applied_block - self.start_block + 1)
+            elapsed = time.time() - self.start_time if self.start_time else 0
+            return {
+                "running": self.running,
+                "start_block": self.start_block,
+                "end_block": self.end_block,
+                "applied_block": self.applied_block,
+                "remaining_blocks": max(self.end_block - self.start_block + 1 - applied_blocks,
+                                        0),
+                "blocks_per_second": applied_blocks / elapsed if elapsed > 0 else 0.0,
+                "logs_applied": self.logs_applied,
+                "chunk_size": self.chunk_size,
+                "range_errors": self.range_errors,
+            }
+
+    def log_progress(self) -> None:
+        """
+        Log backfill progress and throughput.
+        """
+        metrics = self.get_metrics()
+        logger.info("LogBackfill: Applied up to block %s, %s blocks remaining, %s logs, "
+                    "%.1f blocks per second, chunk size %s",
+                    metrics["applied_block"], metrics["remaining_blocks"],
+                    metrics["logs_applied"], metrics["blocks_per_second"],
+                    metrics["chunk_size"])
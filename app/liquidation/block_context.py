@@ -0,0 +1,195 @@
+"""
+Per chain gas price, base fee and gas estimate context, refreshed once per block
+"""
+import logging
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from web3 import Web3
+
+from .config_loader import ChainConfig
+from .utils import SingleFlight
+
+logger = logging.getLogger("liquidation_bot")
+
+# Max number of gas estimates kept, across the blocks they were made in
+MAX_CACHED_ESTIMATES = 1024
+
+# Max number of refreshes per read while new heads keep arriving
+MAX_REFRESH_ATTEMPTS = 3
+
+
+class BlockContext:
+    """
+    Holds the base fee and gas price of the current block, so simulations within a block
+    share them instead of each querying the RPC.
+
+    New heads reported through on_new_head mark the context stale, and it is refreshed on
+    the next read, so blocks without simulations cost no requests. Without head
+    notifications the context is refreshed once it is older than BLOCK_CONTEXT_MAX_AGE
+    seconds. Concurrent refreshes share a single set of requests.
+
+    Gas estimates are memoized per block and transaction, keyed on a hash of the sender,
+    target, value and calldata.
+    """
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, config: ChainConfig):
+        self.config = config
+        self.lock = threading.Lock()
+        self.refresh_flight = SingleFlight()
+        self.estimate_flight = SingleFlight()
+
+        self.block_number = 0
+        self.base_fee = 0
+        self.gas_price = 0
+        self.updated_at = 0
+        self.stale = True
+        # Set when the block number and base fee came from a head not refreshed yet
+        self.head_pending = False
+        self.estimates: "OrderedDict[Tuple[int, bytes], int]" = OrderedDict()
+
+        self.refreshes = 0
+        self.estimate_hits = 0
+        self.estimate_misses = 0
+
+    @staticmethod
+    def get_instance(config: ChainConfig) -> "BlockContext":
+        """
+        Get the block context for the chain of the given config.
+        """
+        with BlockContext._instances_lock:
+            if config.CHAIN_ID not in BlockContext._instances:
+                BlockContext._instances[config.CHAIN_ID] = BlockContext(config)
+            return BlockContext._instances[config.CHAIN_ID]
+
+    def on_new_head(self, number: int, base_fee: Optional[int] = None) -> None:
+        """
+        Record a new head, marking the gas price for refresh on the next read.
+
+        Args:
+            number (int): Block number of the head.
+            base_fee (Optional[int]): Base fee of the head, if known.
+        """
+        with self.lock:
+            if number <= self.block_number:
+                return
+            self.block_number = number
+            if base_fee is not None:
+                self.base_fee = base_fee
+                self.head_pending = True
+            self.stale = True
+
+    def invalidate(self) -> None:
+        """
+        Mark the context for refresh on the next read, e.g. after sending a transaction.
+        """
+        with self.lock:
+            self.stale = True
+
+    def get(self) -> Dict[str, int]:
+        """
+        Get the context of the current block, refreshing it first if needed.
+
+        Returns:
+            Dict[str, int]: Block number, base fee and gas price.
+        """
+        if self.stale or time.time() - self.updated_at > self.config.BLOCK_CONTEXT_MAX_AGE:
+            # A head arriving during a refresh leaves the context stale, refresh again so the
+            # gas price matches the returned block
+            for _ in range(MAX_REFRESH_ATTEMPTS):
+                self.refresh_flight.do("refresh", self.refresh)
+                if not self.stale:
+                    break
+
+        with self.lock:
+            return {
+                "block_number": self.block_number,
+                "base_fee": self.base_fee,
+                "gas_price": self.gas_price,
+            }
+
+    def refresh(self) -> None:
+        """
+        Fetch the gas price, and the latest block unless a head notification already gave
+        its number and base fee.
+        """
+        with self.lock:
+            head = self.block_number
+            head_pending = self.head_pending
+
+        w3 = self.config.w3
+        block = None if head_pending else w3.eth.get_block("latest")
+        gas_price = w3.eth.gas_price
+
+        with self.lock:
+            self.gas_price = gas_price
+            self.refreshes += 1
+            if self.block_number > head:
+                # A newer head arrived meanwhile, the context stays stale until the next
+                # refresh fetches its gas price
+                return
+            if block is not None and block["number"] >= self.block_number:
+                self.block_number = block["number"]
+                self.base_fee = block.get("baseFeePerGas", 0)
+            self.head_pending = False
+            self.updated_at = time.time()
+            self.stale = False
+
+    def estimate_gas(self, transaction: Dict[str, Any]) -> int:
+        """
+        Estimate the gas of a transaction, memoized for the current block.
+
+        Args:
+            transaction (Dict[str, Any]): Transaction to estimate. Any gas limit set on it
+                is ignored.
+
+        Returns:
+            int: The estimated gas.
+        """
+        block_number = self.get()["block_number"]
+        transaction = {key: value for key, value in transaction.items() if key != "gas"}
+        key = (block_number, self.get_transaction_hash(transaction))
+
+        with self.lock:
+            if key in self.estimates:
+                self.estimate_hits += 1
+                return self.estimates[key]
+            self.estimate_misses += 1
+
+        gas = self.estimate_flight.do(key, self.config.w3.eth.estimate_gas, transaction)
+        with self.lock:
+            self.estimates[key] = gas
+            while len(self.estimates) > MAX_CACHED_ESTIMATES:
+                self.estimates.popitem(last=False)
+        return gas
+
+    @staticmethod
+    def get_transaction_hash(transaction: Dict[str, Any]) -> bytes:
+        """
+        Hash the fields of a transaction that determine its gas usage.
+        """
+        data = transaction.get("data", "0x")
+        return Web3.keccak(text="|".join((
+            str(transaction.get("from", "")).lower(),
+            str(transaction.get("to", "")).lower(),
+            str(transaction.get("value", 0)),
+            data if isinstance(data, str) else Web3.to_hex(data),
+        )))
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get the current block context and counts of refreshes and gas estimate cache hits.
+        """
+        return {
+            "block_number": self.block_number,
+            "base_fee": self.base_fee,
+            "gas_price": self.gas_price,
+            "refreshes": self.refreshes,
+            "estimate_hits": self.estimate_hits,
+            "estimate_misses": self.estimate_misses,
+        }
@@ -2,7 +2,7 @@ from typing import Dict, List
 from concurrent.futures import ThreadPoolExecutor
 from web3 import Web3
 
-from .liquidation_bot import AccountMonitor, EVCListener, logger
+from .liquidation_bot import AccountMonitor, EVCListener, SmartUpdateListener, logger
 from .config_loader import load_chain_config, ChainConfig
 
 class ChainManager:
@@ -16,6 +16,7 @@ class ChainManager:
         self.configs: Dict[int, ChainConfig] = {}
         self.monitors: Dict[int, AccountMonitor] = {}
         self.evc_listeners: Dict[int, EVCListener] = {}
+        self.smart_update_listeners: Dict[int, SmartUpdateListener] = {}
         self.web3s: Dict[int, Web3] = {}
 
         self._initialize_chains()
@@ -42,6 +43,9 @@ class ChainManager:
             listener = EVCListener(monitor, config)
             self.evc_listeners[chain_id] = listener
 
+            if config.SMART_UPDATE_ENABLED:
+                self.smart_update_listeners[chain_id] = SmartUpdateListener(monitor, config)
+
     def start(self):
         """Start all chain monitors and evc_listeners"""
         with ThreadPoolExecutor() as executor:
@@ -61,8 +65,14 @@ class ChainManager:
                 for chain_id in self.chain_ids
             ]
 
+            # Start smart update listeners
+            smart_update_futures = [
+                executor.submit(self._run_smart_update_listener, chain_id)
+                for chain_id in self.smart_update_listeners
+            ]
+
             # Wait for all to complete (they shouldn't unless there's an error)
-            for future in monitor_futures + listener_futures:
+            for future in monitor_futures + listener_futures + smart_update_futures:
                 try:
                     future.result()
                 except Exception as e: # pylint: disable=broad-except
@@ -78,7 +88,16 @@ class ChainManager:
         listener = self.evc_listeners[chain_id]
         listener.start_event_monitoring()
 
+    def _run_smart_update_listener(self, chain_id: int):
+        """Run a single chain's smart update listener"""
+        listener = self.smart_update_listeners[chain_id]
+        listener.start_price_monitoring()
+
     def stop(self):
         """Stop all chain instances"""
+        for listener in self.smart_update_listeners.values():
+            listener.stop()
+        for listener in self.evc_listeners.values():
+            listener.stop()
         for monitor in self.monitors.values():
             monitor.stop()
\ No newline at end of file
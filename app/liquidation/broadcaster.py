@@ -0,0 +1,198 @@
+"""
+Fan-out broadcast of signed transactions to several RPC endpoints and relays
+"""
+import logging
+import threading
+import time
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Tuple
+
+import requests
+
+from web3 import Web3
+
+from .config_loader import ChainConfig
+
+logger = logging.getLogger("liquidation_bot")
+
+# Send errors meaning the endpoint already has the transaction
+ALREADY_KNOWN_MESSAGES = ("already known", "known transaction", "already imported",
+                          "already exists", "already in mempool")
+
+
+def is_already_known(error: Any) -> bool:
+    """
+    Check if a send error means the endpoint already has the transaction.
+    """
+    message = str(error).lower()
+    return any(fragment in message for fragment in ALREADY_KNOWN_MESSAGES)
+
+
+def send_raw_transaction(config: ChainConfig, raw_transaction: bytes) -> str:
+    """
+    Send a signed transaction through the chain's Broadcaster with BROADCAST_ENABLED,
+    otherwise through the chain's web3 provider.
+
+    Returns:
+        str: The transaction hash.
+    """
+    if config.BROADCAST_ENABLED:
+        return Broadcaster.get_instance(config).send_raw_transaction(raw_transaction)
+    return config.w3.eth.send_raw_transaction(raw_transaction).hex()
+
+
+class EndpointStats:
+    """
+    Send counters and latencies of one broadcast endpoint.
+    """
+    def __init__(self):
+        self.sent = 0
+        self.accepted = 0
+        self.first = 0
+        self.errors = 0
+        self.last_latency = None
+        self.average_latency = None
+
+    def record(self, latency: float, accepted: bool) -> None:
+        """
+        Record the outcome and latency of a send, keeping a moving average latency.
+        """
+        self.sent += 1
+        if accepted:
+            self.accepted += 1
+        else:
+            self.errors += 1
+        self.last_latency = latency
+        if self.average_latency is None:
+            self.average_latency = latency
+        else:
+            self.average_latency = 0.8 * self.average_latency + 0.2 * latency
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sent": self.sent,
+            "accepted": self.accepted,
+            "first": self.first,
+            "errors": self.errors,
+            "last_latency": self.last_latency,
+            "average_latency": self.average_latency,
+        }
+
+
+class Broadcaster:
+    """
+    Sends signed raw transactions to the chain's RPC_URL and every endpoint in the
+    comma separated env var named by the chain's BROADCAST_NAME (public RPCs, private
+    relays) at the same time.
+
+    The send returns as soon as one endpoint accepts the transaction, and the remaining
+    sends finish in the background to record their latency. "Already known" errors count
+    as accepted, since they mean the transaction reached that endpoint through another
+    path. If no endpoint accepts it, the first error is raised.
+    """
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, config: ChainConfig, endpoints: List[str]):
+        self.config = config
+        self.endpoints = list(dict.fromkeys(endpoints))
+        self.executor = ThreadPoolExecutor(max_workers=max(4, 2 * len(self.endpoints)))
+        self.lock = threading.Lock()
+        self.stats = {endpoint: EndpointStats() for endpoint in self.endpoints}
+        self.request_id = 0
+
+    @staticmethod
+    def get_instance(config: ChainConfig) -> "Broadcaster":
+        """
+        Get the broadcaster for the chain of the given config.
+        """
+        with Broadcaster._instances_lock:
+            if config.CHAIN_ID not in Broadcaster._instances:
+                Broadcaster._instances[config.CHAIN_ID] = Broadcaster(
+                    config, [config.RPC_URL] + config.BROADCAST_URLS)
+            return Broadcaster._instances[config.CHAIN_ID]
+
+    def send_raw_transaction(self, raw_transaction: bytes) -> str:
+        """
+        Broadcast a signed transaction to all endpoints.
+
+        Args:
+            raw_transaction (bytes): The signed transaction.
+
+        Returns:
+            str: The transaction hash.
+        """
+        tx_hash = Web3.to_hex(Web3.keccak(raw_transaction))
+        raw_hex = Web3.to_hex(raw_transaction)
+        with self.lock:
+            self.request_id += 1
+            request_id = self.request_id
+
+        futures = {self.executor.submit(self.send, endpoint, raw_hex, request_id): endpoint
+                   for endpoint in self.endpoints}
+        errors = []
+        not_done = set(futures)
+        while not_done:
+            done, not_done = wait(not_done, timeout=self.config.BROADCAST_TIMEOUT,
+                                  return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                accepted, latency, error = future.result()
+                if accepted:
+                    with self.lock:
+                        self.stats[futures[future]].first += 1
+                    logger.info("Broadcaster: Transaction %s first accepted by %s in %.3fs",
+                                tx_hash, self.get_endpoint_name(futures[future]), latency)
+                    return tx_hash
+                errors.append(error)
+
+        raise ValueError(errors[0] if errors else
+                         f"No endpoint accepted transaction {tx_hash} within "
+                         f"{self.config.BROADCAST_TIMEOUT} seconds")
+
+    def send(self, endpoint: str, raw_hex: str, request_id: int) -> Tuple[bool, float, Any]:
+        """
+        Send eth_sendRawTransaction to one endpoint.
+
+        Returns:
+            Tuple[bool, float, Any]: Whether the endpoint accepted the transaction, the
+            request latency in seconds and the error if it did not.
+        """
+        start = time.monotonic()
+        error = None
+        try:
+            response = requests.post(endpoint, json={
+                "jsonrpc": "2.0", "id": request_id,
+                "method": "eth_sendRawTransaction", "params": [raw_hex],
+            }, timeout=self.config.BROADCAST_TIMEOUT)
+            response.raise_for_status()
+            error = response.json().get("error")
+        except Exception as ex: # pylint: disable=broad-except
+            error = ex
+        latency = time.monotonic() - start
+
+        accepted = error is None or is_already_known(error)
+        with self.lock:
+            self.stats[endpoint].record(latency, accepted)
+        if not accepted:
+            logger.warning("Broadcaster: %s rejected transaction: %s",
+                           self.get_endpoint_name(endpoint), error)
+        return accepted, latency, error
+
+    def get_endpoint_name(self, endpoint: str) -> str:
+        """
+        Get the host of an endpoint URL, leaving out paths and query strings with API keys,
+        numbered by the endpoint's position so URLs on the same host stay apart.
+        """
+        host = endpoint.split("://", 1)[-1].split("/", 1)[0].split("?", 1)[0]
+        return f"{host}#{self.endpoints.index(endpoint)}"
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get send counts, first acceptances and latencies per endpoint host.
+        """
+        with self.lock:
+            return {self.get_endpoint_name(endpoint): stats.to_dict()
+                    for endpoint, stats in self.stats.items()}
@@ -3,11 +3,13 @@ Config Loader module - part of multi chain refactor
 """
 import os
 import yaml
-import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 from web3 import Web3
 
+from .contract_registry import load_abi
+from .rpc_pool import RPCPoolProvider
+
 
 class Web3Singleton:
     """
@@ -30,6 +32,26 @@ class Web3Singleton:
 
         return Web3Singleton._instances[url]
 
+    @staticmethod
+    def get_pool_instance(rpc_urls: List[str], config: "ChainConfig") -> Web3:
+        """
+        Set up a Web3 instance routing requests over a pool of RPC URLs,
+        shared by all chains using the same list of URLs.
+        """
+        key = ",".join(rpc_urls)
+        if key not in Web3Singleton._instances:
+            Web3Singleton._instances[key] = Web3(RPCPoolProvider(
+                rpc_urls,
+                latency_window=config.RPC_POOL_LATENCY_WINDOW,
+                max_error_rate=config.RPC_POOL_MAX_ERROR_RATE,
+                max_block_lag=config.RPC_POOL_MAX_BLOCK_LAG,
+                head_probe_interval=config.RPC_POOL_HEAD_PROBE_INTERVAL,
+                hedge_enabled=config.RPC_HEDGE_ENABLED,
+                hedge_percentile=config.RPC_HEDGE_PERCENTILE,
+                hedge_min_delay=config.RPC_HEDGE_MIN_DELAY))
+        return Web3Singleton._instances[key]
+
+
 def setup_w3(rpc_url: Optional[str] = None) -> Web3:
     """
     Get the Web3 instance from the singleton class
@@ -56,39 +78,54 @@ class ChainConfig:
         # Load global EOA settings
         self.LIQUIDATOR_EOA = os.getenv("LIQUIDATOR_EOA")
         self.LIQUIDATOR_EOA_PRIVATE_KEY = os.getenv("LIQUIDATOR_PRIVATE_KEY")
+        # Optional extra liquidator keys, comma separated, to send liquidations in parallel
+        self.LIQUIDATOR_EOA_PRIVATE_KEYS = [key.strip() for key in
+                                            os.getenv("LIQUIDATOR_PRIVATE_KEYS", "").split(",")
+                                            if key.strip()]
         self.SWAP_API_URL = os.getenv("SWAP_API_URL")
         self.SLACK_URL = os.getenv("SLACK_WEBHOOK_URL")
         self.RISK_DASHBOARD_URL = os.getenv("RISK_DASHBOARD_URL")
 
-        # Load chain-specific RPC from env using RPC_NAME from config
-        self.RPC_URL = os.getenv(self._chain["RPC_NAME"])
-        if not self.RPC_URL:
+        # Load chain-specific RPC from env using RPC_NAME from config, which can hold
+        # several comma separated URLs. The first one is used for submissions
+        self.RPC_URLS = [url.strip() for url in os.getenv(self._chain["RPC_NAME"], "").split(",")
+                         if url.strip()]
+        if not self.RPC_URLS:
             raise ValueError(f"Missing RPC URL for {self._chain["name"]}. "
                            f"Env var {self._chain["RPC_NAME"]} not found")
+        self.RPC_URL = self.RPC_URLS[0]
+
+        # Optional WebSocket endpoint for event subscriptions, from WS_NAME in config
+        self.WS_URL = os.getenv(self._chain.get("WS_NAME", ""))
+
+        # Extra endpoints and relays that signed transactions are broadcast to, comma
+        # separated in the env var named by BROADCAST_NAME in config
+        self.BROADCAST_URLS = [url.strip() for url in
+                               os.getenv(self._chain.get("BROADCAST_NAME", ""), "").split(",")
+                               if url.strip()]
 
-        self.w3 = setup_w3(self.RPC_URL)
-        self.mainnet_w3 = setup_w3(os.getenv("MAINNET_RPC_URL"))
+        if self.RPC_POOL_ENABLED and len(self.RPC_URLS) > 1:
+            self.w3 = Web3Singleton.get_pool_instance(self.RPC_URLS, self)
+        else:
+            self.w3 = setup_w3(self.RPC_URL)
+        mainnet_rpc_url = os.getenv("MAINNET_RPC_URL")
+        self.mainnet_w3 = setup_w3(mainnet_rpc_url.split(",")[0].strip()
+                                   if mainnet_rpc_url else None)
 
         # Set chain-specific paths
         self.LOGS_PATH = f"{self._global["LOGS_PATH"]}/{self._chain["name"]}_monitor.log"
         self.SAVE_STATE_PATH = f"{self._global["SAVE_STATE_PATH"]}/{self._chain["name"]}_state.json"
 
-        with open(self._global["EVC_ABI_PATH"], "r", encoding="utf-8") as file:
-            interface = json.load(file)
-        abi = interface["abi"]
+        abi = load_abi(self._global["EVC_ABI_PATH"])
 
         self.evc = self.w3.eth.contract(address=self.EVC, abi=abi)
 
-        with open(self._global["ORACLE_ABI_PATH"], "r", encoding="utf-8") as file:
-            interface = json.load(file)
-        abi = interface["abi"]
+        abi = load_abi(self._global["ORACLE_ABI_PATH"])
 
         self.eth_oracle = self.mainnet_w3.eth.contract(address=self._global["MAINNET_ETH_ADAPTER"], abi=abi)
         self.btc_oracle = self.mainnet_w3.eth.contract(address=self._global["MAINNET_BTC_ADAPTER"], abi=abi)
 
-        with open(global_config["LIQUIDATOR_ABI_PATH"], "r", encoding="utf-8") as file:
-            interface = json.load(file)
-        abi = interface["abi"]
+        abi = load_abi(global_config["LIQUIDATOR_ABI_PATH"])
 
         self.liquidator = self.w3.eth.contract(address=self._chain["contracts"]["LIQUIDATOR_CONTRACT"], abi=abi)
 
@@ -0,0 +1,173 @@
+"""
+Contract registry with cached ABIs, contract instances and precompiled call codecs
+"""
+import json
+import threading
+
+from typing import Any, Dict, List, Tuple
+
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
+from eth_abi.encoding import TupleEncoder
+from eth_abi.registry import registry as abi_registry
+from eth_utils import function_abi_to_4byte_selector
+from web3 import Web3
+from web3.contract import Contract
+
+_abi_cache: Dict[str, List[Dict[str, Any]]] = {}
+_abi_cache_lock = threading.Lock()
+
+
+def load_abi(abi_path: str) -> List[Dict[str, Any]]:
+    """
+    Load the ABI from a compiled contract JSON file, parsing each file only once.
+
+    Args:
+        abi_path (str): Path to the ABI JSON file.
+
+    Returns:
+        List[Dict[str, Any]]: The contract ABI.
+    """
+    abi = _abi_cache.get(abi_path)
+    if abi is None:
+        with _abi_cache_lock:
+            abi = _abi_cache.get(abi_path)
+            if abi is None:
+                with open(abi_path, "r", encoding="utf-8") as file:
+                    interface = json.load(file)
+                abi = interface["abi"]
+                _abi_cache[abi_path] = abi
+    return abi
+
+
+def _collapse_type(abi_param: Dict[str, Any]) -> str:
+    """
+    Get the canonical type string of an ABI parameter, expanding tuples.
+    """
+    abi_type = abi_param["type"]
+    if abi_type.startswith("tuple"):
+        components = ",".join(_collapse_type(component)
+                              for component in abi_param["components"])
+        array_suffix = abi_type[len("tuple"):]
+        return f"({components}){array_suffix}"
+    return abi_type
+
+
+class CallCodec:
+    """
+    Precompiled selector, encoder and decoder for a single contract function.
+    Skips web3's per call function resolution, argument normalization and validation.
+    """
+    def __init__(self, function_abi: Dict[str, Any]):
+        self.name = function_abi["name"]
+        self.selector = function_abi_to_4byte_selector(function_abi)
+        self.input_types = [_collapse_type(param) for param in function_abi["inputs"]]
+        self.output_types = [_collapse_type(param) for param in function_abi["outputs"]]
+
+        self._encoder = TupleEncoder(encoders=[abi_registry.get_encoder(input_type)
+                                               for input_type in self.input_types])
+        self._decoder = TupleDecoder(decoders=[abi_registry.get_decoder(output_type)
+                                               for output_type in self.output_types])
+        self._checksum_outputs = [output_type == "address" for output_type in self.output_types]
+
+    def encode(self, *args) -> bytes:
+        """
+        Encode calldata for the function.
+        """
+        return self.selector + self._encoder(args)
+
+    def decode(self, data: bytes) -> Tuple[Any, ...]:
+        """
+        Decode the return data of the function.
+        Address outputs are returned checksummed, as web3 does.
+        """
+        values = self._decoder(ContextFramesBytesIO(data))
+        if any(self._checksum_outputs):
+            values = tuple(Web3.to_checksum_address(value) if is_address else value
+                           for value, is_address in zip(values, self._checksum_outputs))
+        return values
+
+
+class ContractRegistry:
+    """
+    Registry of contract instances per Web3 instance.
+    ABIs are parsed once, contract objects are cached by (address, ABI path)
+    and call codecs are cached by (ABI path, function name).
+    """
+    _instances: Dict[int, "ContractRegistry"] = {}
+    _codecs: Dict[Tuple[str, str], CallCodec] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, w3: Web3):
+        self.w3 = w3
+        self.contracts: Dict[Tuple[str, str], Contract] = {}
+
+    @staticmethod
+    def get_instance(w3: Web3) -> "ContractRegistry":
+        """
+        Get the contract registry for a Web3 instance.
+        """
+        contract_registry = ContractRegistry._instances.get(id(w3))
+        if contract_registry is None:
+            with ContractRegistry._lock:
+                contract_registry = ContractRegistry._instances.setdefault(
+                    id(w3), ContractRegistry(w3))
+        return contract_registry
+
+    def get_contract(self, address: str, abi_path: str) -> Contract:
+        """
+        Get a cached contract instance.
+
+        Args:
+            address (str): The address of the contract.
+            abi_path (str): Path to the ABI JSON file.
+
+        Returns:
+            Contract: Web3 contract instance.
+        """
+        key = (address, abi_path)
+        contract = self.contracts.get(key)
+        if contract is None:
+            contract = self.w3.eth.contract(address=address, abi=load_abi(abi_path))
+            self.contracts[key] = contract
+        return contract
+
+    @staticmethod
+    def get_codec(abi_path: str, function_name: str) -> CallCodec:
+        """
+        Get the precompiled codec for a function of an ABI.
+        Overloaded functions are not supported, the first match is used.
+
+        Args:
+            abi_path (str): Path to the ABI JSON file.
+            function_name (str): Name of the function.
+
+        Returns:
+            CallCodec: Precompiled codec for the function.
+        """
+        key = (abi_path, function_name)
+        codec = ContractRegistry._codecs.get(key)
+        if codec is None:
+            function_abi = next(entry for entry in load_abi(abi_path)
+                                if entry["type"] == "function" and entry["name"] == function_name)
+            codec = CallCodec(function_abi)
+            ContractRegistry._codecs[key] = codec
+        return codec
+
+    def call(self, address: str, codec: CallCodec, *args,
+             block_identifier: Any = "latest") -> Tuple[Any, ...]:
+        """
+        Make an eth_call using a precompiled codec.
+        Reverts raise the same exceptions as a web3 contract call.
+
+        Args:
+            address (str): The address of the contract.
+            codec (CallCodec): Codec of the function to call.
+            *args: Function arguments.
+            block_identifier (Any, optional): Block to call at. Defaults to "latest".
+
+        Returns:
+            Tuple[Any, ...]: The decoded return values.
+        """
+        return_data = self.w3.eth.call({"to": address, "data": codec.encode(*args)},
+                                       block_identifier)
+        return codec.decode(return_data)
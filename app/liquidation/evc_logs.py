@@ -0,0 +1,94 @@
+"""
+Raw eth_getLogs ingestion of EVC account events with direct topic decoding
+"""
+import functools
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from web3 import Web3
+
+# Topics of the EVC events touching an account's controller or collaterals,
+# all indexed by account followed by the controller or collateral vault
+EVC_EVENT_TOPICS = {
+    "AccountStatusCheck": Web3.to_hex(Web3.keccak(text="AccountStatusCheck(address,address)")),
+    "ControllerStatus": Web3.to_hex(Web3.keccak(text="ControllerStatus(address,address,bool)")),
+    "CollateralStatus": Web3.to_hex(Web3.keccak(text="CollateralStatus(address,address,bool)")),
+}
+
+ACCOUNT_STATUS_CHECK_TOPIC = EVC_EVENT_TOPICS["AccountStatusCheck"]
+CONTROLLER_STATUS_TOPIC = EVC_EVENT_TOPICS["ControllerStatus"]
+COLLATERAL_STATUS_TOPIC = EVC_EVENT_TOPICS["CollateralStatus"]
+
+
+@functools.lru_cache(maxsize=65536)
+def topic_to_address(topic: str) -> str:
+    """
+    Get the checksum address from an indexed address topic.
+    Cached, as the same accounts and vaults appear in many logs.
+    """
+    return Web3.to_checksum_address("0x" + topic[-40:])
+
+
+def get_raw_logs(w3: Web3, address: str, topics: List[str],
+                 start_block: int, end_block: int) -> List[Dict[str, Any]]:
+    """
+    Call eth_getLogs straight on the provider, without web3's filter building and
+    log formatting, for logs matching any of the given event topics.
+
+    Args:
+        w3 (Web3): Web3 instance to request through.
+        address (str): Address of the emitting contract.
+        topics (List[str]): Hex encoded event topics to match.
+        start_block (int): The starting block number.
+        end_block (int): The ending block number.
+
+    Returns:
+        List[Dict[str, Any]]: Raw logs, with hex string fields.
+    """
+    response = w3.provider.make_request("eth_getLogs", [{
+        "address": address,
+        "topics": [topics],
+        "fromBlock": hex(start_block),
+        "toBlock": hex(end_block),
+    }])
+    if "error" in response:
+        raise ValueError(response["error"])
+    return response["result"]
+
+
+def decode_account_events(logs: List[Dict[str, Any]]) -> List[Tuple[str, Optional[str]]]:
+    """
+    Decode raw EVC account event logs into the accounts they touch, deduplicated.
+
+    AccountStatusCheck and enabling a controller give the account's controller. Disabling
+    a controller and collateral changes give None, meaning the account should be
+    re-evaluated with the controller it is already tracked with.
+
+    Args:
+        logs (List[Dict[str, Any]]): Raw logs in block order.
+
+    Returns:
+        List[Tuple[str, Optional[str]]]: (account, controller) of the last event of each
+        account that carries a controller, or (account, None) if none does, in the order
+        of each account's last event.
+    """
+    controllers: Dict[str, Optional[str]] = {}
+    for log in logs:
+        if log.get("removed"):
+            continue
+        topics = log["topics"]
+        topic = topics[0]
+        account = topic_to_address(topics[1])
+
+        controller = None
+        if topic == ACCOUNT_STATUS_CHECK_TOPIC:
+            controller = topic_to_address(topics[2])
+        elif topic == CONTROLLER_STATUS_TOPIC and int(log["data"], 16):
+            controller = topic_to_address(topics[2])
+        elif topic not in (CONTROLLER_STATUS_TOPIC, COLLATERAL_STATUS_TOPIC):
+            continue
+
+        previous = controllers.pop(account, None)
+        controllers[account] = controller if controller is not None else previous
+
+    return list(controllers.items())
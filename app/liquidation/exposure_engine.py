@@ -0,0 +1,266 @@
+"""
+In memory exposure engine estimating account health scores with vectorized math
+"""
+import logging
+import threading
+import time
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from web3 import Web3
+
+from .config_loader import ChainConfig
+from .contract_registry import ContractRegistry
+from .multicall import Multicall
+
+logger = logging.getLogger("liquidation_bot")
+
+# Amount of base token units quoted to derive the price of a single unit
+QUOTE_AMOUNT = 10**18
+
+# LTVs are expressed in basis points
+LTV_SCALE = 10**4
+
+# (oracle, base, quote) addresses of a price column
+PriceColumn = Tuple[str, str, str]
+
+
+class ExposureEngine:
+    """
+    Keeps the positions of all tracked accounts in NumPy arrays and recomputes every
+    account's health score from a price vector in a few vectorized operations.
+
+    Collateral positions are stored as flat (account, price column, balance * LTV) entries,
+    liabilities as one (price column, debt) pair per account. Prices are indexed by
+    (oracle, base, unit of account), and collateral is priced as vault shares through the
+    controller's oracle, the same way accountLiquidity values it on chain.
+    Scores are estimates meant to pick which accounts need an authoritative on chain check.
+    """
+    def __init__(self, config: ChainConfig):
+        self.config = config
+        self.multicall = Multicall(config)
+        self.lock = threading.Lock()
+
+        self.account_index: Dict[str, int] = {}
+        self.addresses: List[str] = []
+        self.column_index: Dict[PriceColumn, int] = {}
+        self.columns: List[PriceColumn] = []
+        self.prices = np.zeros(0)
+
+        self.entry_account = np.zeros(0, dtype=np.int64)
+        self.entry_column = np.zeros(0, dtype=np.int64)
+        self.entry_weight = np.zeros(0)
+        self.liability_column = np.zeros(0, dtype=np.int64)
+        self.liability_amount = np.zeros(0)
+
+        # (controller, collateral) -> liquidation LTV in basis points
+        self.ltvs: Dict[Tuple[str, str], int] = {}
+        self.last_sync = 0
+
+    def sync_accounts(self, accounts: Iterable) -> None:
+        """
+        Load the positions of the given accounts from chain and rebuild the arrays.
+        Collaterals, balances, debts and LTVs are fetched through Multicall3.
+
+        Args:
+            accounts (Iterable[Account]): Accounts to track, with their controller vault.
+        """
+        start_time = time.time()
+        accounts = [account for account in accounts if account.controller is not None]
+
+        evc_codec = ContractRegistry.get_codec(self.config.EVC_ABI_PATH, "getCollaterals")
+        debt_codec = ContractRegistry.get_codec(self.config.EVAULT_ABI_PATH, "debtOf")
+        balance_codec = ContractRegistry.get_codec(self.config.EVAULT_ABI_PATH, "balanceOf")
+        ltv_codec = ContractRegistry.get_codec(self.config.EVAULT_ABI_PATH, "LTVLiquidation")
+
+        calls = []
+        for account in accounts:
+            address = Web3.to_checksum_address(account.address)
+            calls.append((self.config.EVC, evc_codec.encode(address)))
+            calls.append((account.controller.address, debt_codec.encode(address)))
+        results = self.multicall.aggregate(calls)
+
+        positions = []
+        balance_calls = []
+        ltv_pairs = set()
+        for i, account in enumerate(accounts):
+            collaterals_result, debt_result = results[2 * i], results[2 * i + 1]
+            if not (collaterals_result and collaterals_result[0] and
+                    debt_result and debt_result[0]):
+                continue
+            (collaterals,) = evc_codec.decode(collaterals_result[1])
+            (debt,) = debt_codec.decode(debt_result[1])
+            positions.append((account, collaterals, debt))
+
+            address = Web3.to_checksum_address(account.address)
+            for collateral in collaterals:
+                balance_calls.append((collateral, balance_codec.encode(address)))
+                if (account.controller.address, collateral) not in self.ltvs:
+                    ltv_pairs.add((account.controller.address, collateral))
+
+        ltv_pairs = list(ltv_pairs)
+        ltv_calls = [(controller, ltv_codec.encode(collateral))
+                     for controller, collateral in ltv_pairs]
+        results = self.multicall.aggregate(balance_calls + ltv_calls)
+        balance_results, ltv_results = results[:len(balance_calls)], results[len(balance_calls):]
+
+        for pair, result in zip(ltv_pairs, ltv_results):
+            if result and result[0]:
+                (self.ltvs[pair],) = ltv_codec.decode(result[1])
+
+        account_index = {}
+        column_index = {}
+        columns = []
+        entry_account, entry_column, entry_weight = [], [], []
+        liability_column, liability_amount = [], []
+
+        def get_column(column: PriceColumn) -> int:
+            if column not in column_index:
+                column_index[column] = len(columns)
+                columns.append(column)
+            return column_index[column]
+
+        balance_results = iter(balance_results)
+        for account, collaterals, debt in positions:
+            controller = account.controller
+            index = len(account_index)
+            account_index[account.address] = index
+
+            liability_column.append(get_column((controller.oracle_address,
+                                                controller.underlying_asset_address,
+                                                controller.unit_of_account)))
+            liability_amount.append(float(debt))
+
+            for collateral in collaterals:
+                result = next(balance_results)
+                ltv = self.ltvs.get((controller.address, collateral), 0)
+                if not (result and result[0]) or ltv == 0:
+                    continue
+                (balance,) = balance_codec.decode(result[1])
+                if balance == 0:
+                    continue
+                entry_account.append(index)
+                entry_column.append(get_column((controller.oracle_address, collateral,
+                                                controller.unit_of_account)))
+                entry_weight.append(float(balance) * ltv / LTV_SCALE)
+
+        prices = self.fetch_prices(columns, self.get_price_map())
+
+        with self.lock:
+            self.account_index = account_index
+            self.addresses = list(account_index)
+            self.column_index = column_index
+            self.columns = columns
+            self.prices = prices
+            self.entry_account = np.array(entry_account, dtype=np.int64)
+            self.entry_column = np.array(entry_column, dtype=np.int64)
+            self.entry_weight = np.array(entry_weight, dtype=np.float64)
+            self.liability_column = np.array(liability_column, dtype=np.int64)
+            self.liability_amount = np.array(liability_amount, dtype=np.float64)
+        self.last_sync = time.time()
+
+        logger.info("ExposureEngine: Synced %s accounts, %s collateral positions and "
+                    "%s price columns in %.2f seconds", len(account_index), len(entry_account),
+                    len(columns), time.time() - start_time)
+
+    def get_price_map(self) -> Dict[PriceColumn, float]:
+        """
+        Get the current price of each column.
+        """
+        with self.lock:
+            return dict(zip(self.columns, self.prices.tolist()))
+
+    def fetch_prices(self, columns: List[PriceColumn],
+                     previous_prices: Dict[PriceColumn, float]) -> np.ndarray:
+        """
+        Quote the price of a single unit of each column's base in its unit of account.
+        Columns whose quote fails keep their previous price, or NaN if they have none.
+
+        Args:
+            columns (List[PriceColumn]): Price columns to quote.
+            previous_prices (Dict[PriceColumn, float]): Prices to fall back to.
+
+        Returns:
+            np.ndarray: Price per unit of each column, in column order.
+        """
+        quote_codec = ContractRegistry.get_codec(self.config.ORACLE_ABI_PATH, "getQuote")
+        calls = [(oracle, quote_codec.encode(QUOTE_AMOUNT, base, quote))
+                 for oracle, base, quote in columns]
+        results = self.multicall.aggregate(calls)
+
+        prices = np.full(len(columns), np.nan)
+        for i, (column, result) in enumerate(zip(columns, results)):
+            if result and result[0]:
+                (quote,) = quote_codec.decode(result[1])
+                prices[i] = quote / QUOTE_AMOUNT
+            else:
+                prices[i] = previous_prices.get(column, np.nan)
+        return prices
+
+    def refresh_prices(self) -> None:
+        """
+        Re-quote every price column, e.g. after an oracle update.
+        """
+        with self.lock:
+            columns = list(self.columns)
+        prices = self.fetch_prices(columns, self.get_price_map())
+
+        with self.lock:
+            if self.columns == columns:
+                self.prices = prices
+
+    def get_health_scores(self, prices: Optional[np.ndarray] = None) -> Dict[str, float]:
+        """
+        Estimate the health score of every tracked account.
+
+        Args:
+            prices (Optional[np.ndarray]): Price vector to score against,
+                defaults to the last quoted prices.
+
+        Returns:
+            Dict[str, float]: Estimated health score by account address. Accounts without
+            debt score inf, accounts with an unknown price score NaN.
+        """
+        with self.lock:
+            if prices is None:
+                prices = self.prices
+            health_scores = self.score(prices)
+            addresses = self.addresses
+        return dict(zip(addresses, health_scores.tolist()))
+
+    def score(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Compute the health score of every account from a price vector.
+        Must be called with the lock held.
+        """
+        num_accounts = len(self.addresses)
+        collateral_value = np.bincount(self.entry_account,
+                                       weights=self.entry_weight * prices[self.entry_column],
+                                       minlength=num_accounts)
+        liability_value = self.liability_amount * prices[self.liability_column]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.liability_amount > 0,
+                            collateral_value / liability_value, np.inf)
+
+    def get_accounts_below(self, health_margin: float,
+                           prices: Optional[np.ndarray] = None) -> List[str]:
+        """
+        Get accounts whose estimated health score is below the margin or unknown.
+
+        Args:
+            health_margin (float): Health score under which an account needs an on chain check.
+            prices (Optional[np.ndarray]): Price vector to score against,
+                defaults to the last quoted prices.
+
+        Returns:
+            List[str]: Addresses of the accounts to check.
+        """
+        with self.lock:
+            if prices is None:
+                prices = self.prices
+            health_scores = self.score(prices)
+            addresses = self.addresses
+        return [addresses[i] for i in np.flatnonzero(~(health_scores >= health_margin))]
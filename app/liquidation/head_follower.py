@@ -0,0 +1,113 @@
+"""
+Chain head tracking with reorg detection over a ring buffer of recent block hashes
+"""
+import logging
+import threading
+
+from collections import OrderedDict
+from typing import Optional
+
+from web3 import Web3
+
+from .config_loader import ChainConfig
+
+logger = logging.getLogger("liquidation_bot")
+
+
+class HeadFollower:
+    """
+    Remembers the hashes of the last REORG_BUFFER_SIZE blocks seen and checks every new
+    head against them.
+
+    A head whose parent hash differs from the known hash of its parent block, or a known
+    block whose canonical hash changed, means a reorg. The follower then walks back through
+    canonical hashes until it reaches a block it still agrees with, and reports the first
+    block of the reorged range so it can be scanned again.
+    """
+    def __init__(self, config: ChainConfig, w3: Web3):
+        self.config = config
+        self.w3 = w3
+        self.buffer_size = config.REORG_BUFFER_SIZE
+        self.lock = threading.Lock()
+        # block number -> block hash, oldest first
+        self.blocks: "OrderedDict[int, str]" = OrderedDict()
+
+        self.head = 0
+        self.reorgs = 0
+        self.deepest_reorg = 0
+
+    def update(self, number: int, block_hash: str, parent_hash: str) -> Optional[int]:
+        """
+        Record a new head.
+
+        Args:
+            number (int): Block number of the head.
+            block_hash (str): Hex hash of the head.
+            parent_hash (str): Hex hash of the head's parent.
+
+        Returns:
+            Optional[int]: First block of the reorged range if a reorg was detected, else None.
+        """
+        block_hash, parent_hash = block_hash.lower(), parent_hash.lower()
+        with self.lock:
+            fork_block = None
+            if self.blocks:
+                last_number = next(reversed(self.blocks))
+                if number - 1 in self.blocks and self.blocks[number - 1] != parent_hash:
+                    fork_block = self.find_fork(number - 1)
+                elif number in self.blocks and self.blocks[number] != block_hash:
+                    fork_block = number
+                elif (number > last_number + 1 and
+                      self.get_canonical_hash(last_number) != self.blocks[last_number]):
+                    # Blocks were skipped since the last head, check the last known one
+                    fork_block = self.find_fork(last_number)
+
+            if fork_block is not None:
+                self.reorgs += 1
+                self.deepest_reorg = max(self.deepest_reorg, self.head - fork_block + 1)
+                logger.warning("HeadFollower: Reorg detected at head %s, blocks from %s "
+                               "were replaced", number, fork_block)
+
+            # Drop hashes from the head onwards, they belong to the previous chain
+            for stale in [n for n in self.blocks if n >= number]:
+                del self.blocks[stale]
+            self.blocks[number] = block_hash
+            self.head = number
+            while len(self.blocks) > self.buffer_size:
+                self.blocks.popitem(last=False)
+            return fork_block
+
+    def find_fork(self, number: int) -> int:
+        """
+        Walk back through known blocks from the given one until a known hash matches the
+        canonical chain, replacing outdated hashes on the way. Blocks between two known
+        blocks are not checked, so the fork is reported right after the last matching one.
+        Must be called with the lock held.
+
+        Returns:
+            int: The first block that may differ from the known chain.
+        """
+        fork_block = number
+        for known in sorted((n for n in self.blocks if n <= number), reverse=True):
+            canonical_hash = self.get_canonical_hash(known)
+            if canonical_hash == self.blocks[known]:
+                return known + 1
+            self.blocks[known] = canonical_hash
+            fork_block = known
+        return fork_block
+
+    def get_canonical_hash(self, number: int) -> str:
+        """
+        Get the hash of a block on the node's current canonical chain.
+        """
+        return Web3.to_hex(self.w3.eth.get_block(number)["hash"]).lower()
+
+    def get_metrics(self):
+        """
+        Get head and reorg metrics.
+        """
+        return {
+            "head": self.head,
+            "reorgs": self.reorgs,
+            "deepest_reorg": self.deepest_reorg,
+        }
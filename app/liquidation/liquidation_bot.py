@@ -1,21 +1,20 @@
 """
 EVault Liquidation Bot
 """
+import functools
 import threading
 import random
 import time
-import queue
 import os
 import json
 import sys
 import math
 
-from concurrent.futures import ThreadPoolExecutor
-from typing import Tuple, Dict, Any, Optional
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Tuple, Dict, Any, Callable, Optional, List, Set
 
 from web3 import Web3
-from web3.logs import DISCARD
-
 
 from app.liquidation.utils import (setup_logger,
                    create_contract_instance,
@@ -29,7 +28,37 @@ from app.liquidation.utils import (setup_logger,
                    get_eth_usd_quote,
                    get_btc_usd_quote)
 
+from app.liquidation.async_engine import AsyncEngine
+from app.liquidation.backfill import LogBackfill
 from app.liquidation.config_loader import ChainConfig
+from app.liquidation.contract_registry import ContractRegistry
+from app.liquidation.evc_logs import (EVC_EVENT_TOPICS,
+                                      decode_account_events,
+                                      get_raw_logs,
+                                      topic_to_address)
+from app.liquidation.block_context import BlockContext
+from app.liquidation.broadcaster import Broadcaster, send_raw_transaction
+from app.liquidation.exposure_engine import ExposureEngine
+from app.liquidation.head_follower import HeadFollower
+from app.liquidation.multicall import Multicall
+from app.liquidation.nonce_manager import EOAPool, LiquidatorSigner, is_nonce_too_low
+from app.liquidation.price_events import (PriceSource,
+                                          PRICE_UPDATE_TOPICS,
+                                          decode_price_log,
+                                          get_source_emitter,
+                                          chainlink_source,
+                                          pyth_source,
+                                          redstone_core_source,
+                                          redstone_source)
+from app.liquidation.prescreen import ProfitPrescreen
+from app.liquidation.pyth_cache import PythUpdateCache
+from app.liquidation.pyth_stream import PythStream
+from app.liquidation.quote_cache import QuoteCache
+from app.liquidation.receipt_tracker import PendingLiquidation, ReceiptTracker
+from app.liquidation.rpc_pool import RPCPoolProvider
+from app.liquidation.scheduler import AccountScheduler
+from app.liquidation.state_journal import StateJournal
+from app.liquidation.ws_subscriber import WebSocketSubscriber
 
 ### ENVIRONMENT & CONFIG SETUP ###
 logger = setup_logger()
@@ -38,28 +67,119 @@ sys.excepthook = global_exception_handler
 
 ### MAIN CODE ###
 
+# Errors returned by accountLiquidity that indicate the account has no position to track
+# E_NoLiability() and E_NotController()
+ACCOUNT_LIQUIDITY_IGNORED_ERRORS = ("0x43855d0f", "0x6d588708")
+
 class Vault:
     """
     Represents a vault in the EVK System.
     This class provides methods to interact with a specific vault contract.
-    This does not need to be serialized as it does not store any state
+    Immutable vault metadata is fetched lazily on first access, or can be passed in
+    from the VaultRegistry, which persists it in the state file.
+    Vaults should be obtained through VaultRegistry.get_vault so instances are shared.
     """
-    def __init__(self, address, config: ChainConfig):
+    # (metadata key, function name) for the immutable vault metadata
+    METADATA_CALLS = (
+        ("asset", "asset"),
+        ("name", "name"),
+        ("symbol", "symbol"),
+        ("unit_of_account", "unitOfAccount"),
+        ("oracle", "oracle"),
+    )
+
+    def __init__(self, address, config: ChainConfig, metadata: Optional[Dict[str, str]] = None):
         self.config = config
-        
+
         self.address = address
         self.instance = create_contract_instance(address, self.config.EVAULT_ABI_PATH, self.config)
+        self.contract_registry = ContractRegistry.get_instance(self.config.w3)
 
-        self.underlying_asset_address = self.instance.functions.asset().call()
-        self.vault_name = self.instance.functions.name().call()
-        self.vault_symbol = self.instance.functions.symbol().call()
-
-        self.unit_of_account = self.instance.functions.unitOfAccount().call()
-        self.oracle_address = self.instance.functions.oracle().call()
+        self.metadata = metadata
+        self.metadata_lock = threading.Lock()
 
         self.pyth_feed_ids = []
+        self.oracle_adapters = {}
         self.last_pyth_feed_ids_update = 0
 
+    def get_metadata(self) -> Dict[str, str]:
+        """
+        Return the immutable metadata of the vault, fetching it if it has not been loaded yet.
+
+        Returns:
+            Dict[str, str]: Vault asset, name, symbol, unit of account and oracle.
+        """
+        if self.metadata is None:
+            with self.metadata_lock:
+                if self.metadata is None:
+                    self.metadata = {
+                        key: self.call(function_name)[0]
+                        for key, function_name in Vault.METADATA_CALLS
+                    }
+        return self.metadata
+
+    def get_metadata_calls(self) -> List[Tuple[str, bytes]]:
+        """
+        Build the metadata calls for this vault, for use in a multicall.
+
+        Returns:
+            List[Tuple[str, bytes]]: (target, calldata) tuples in METADATA_CALLS order.
+        """
+        return [(self.address, self.get_codec(function_name).encode())
+                for _, function_name in Vault.METADATA_CALLS]
+
+    def set_metadata_from_results(self, results: List[Optional[Tuple[bool, bytes]]]) -> bool:
+        """
+        Set the vault metadata from the multicall results of get_metadata_calls.
+
+        Args:
+            results (List[Optional[Tuple[bool, bytes]]]): Multicall results for the vault.
+
+        Returns:
+            bool: True if all metadata calls succeeded and the metadata was set.
+        """
+        metadata = {}
+        for (key, function_name), result in zip(Vault.METADATA_CALLS, results):
+            if result is None or not result[0]:
+                return False
+            (metadata[key],) = self.get_codec(function_name).decode(result[1])
+
+        with self.metadata_lock:
+            self.metadata = metadata
+        return True
+
+    def get_codec(self, function_name: str):
+        """
+        Get the precompiled call codec for a vault function.
+        """
+        return ContractRegistry.get_codec(self.config.EVAULT_ABI_PATH, function_name)
+
+    def call(self, function_name: str, *args) -> Tuple[Any, ...]:
+        """
+        Call a vault function through its precompiled codec, skipping web3 function resolution.
+        """
+        return self.contract_registry.call(self.address, self.get_codec(function_name), *args)
+
+    @property
+    def underlying_asset_address(self) -> str:
+        return self.get_metadata()["asset"]
+
+    @property
+    def vault_name(self) -> str:
+        return self.get_metadata()["name"]
+
+    @property
+    def vault_symbol(self) -> str:
+        return self.get_metadata()["symbol"]
+
+    @property
+    def unit_of_account(self) -> str:
+        return self.get_metadata()["unit_of_account"]
+
+    @property
+    def oracle_address(self) -> str:
+        return self.get_metadata()["oracle"]
+
     def get_account_liquidity(self, account_address: str) -> Tuple[int, int]:
         """
         Get liquidity metrics for a given account.
@@ -71,17 +191,14 @@ class Vault:
             Tuple[int, int]: A tuple containing (collateral_value, liability_value).
         """
         try:
-            balance = self.instance.functions.balanceOf(
-                Web3.to_checksum_address(account_address)).call()
+            (balance,) = self.call("balanceOf", Web3.to_checksum_address(account_address))
         except Exception as ex: # pylint: disable=broad-except
             logger.error("Vault: Failed to get balance for account %s: %s",
                          account_address, ex, exc_info=True)
             return (0, 0, 0)
 
         try:
-            if time.time() - self.last_pyth_feed_ids_update > self.config.PYTH_CACHE_REFRESH:
-                self.pyth_feed_ids = PullOracleHandler.get_feed_ids(self, self.config)
-                self.last_pyth_feed_ids_update = time.time()
+            self.refresh_pyth_feed_ids()
 
             if len(self.pyth_feed_ids) > 0:
                 logger.info("Vault: Pyth Oracle found for vault %s, "
@@ -90,12 +207,13 @@ class Vault:
                     self, account_address, self.pyth_feed_ids, self.config)
             else:
                 logger.info("Vault: Getting account liquidity normally for vault %s", self.address)
-                (collateral_value, liability_value) = self.instance.functions.accountLiquidity(
+                (collateral_value, liability_value) = self.call(
+                    "accountLiquidity",
                     Web3.to_checksum_address(account_address),
                     True
-                ).call()
+                )
         except Exception as ex: # pylint: disable=broad-except
-            if ex.args[0] != "0x43855d0f" and ex.args[0] != "0x6d588708":
+            if ex.args[0] not in ACCOUNT_LIQUIDITY_IGNORED_ERRORS:
                 logger.error("Vault: Failed to get account liquidity"
                             " for account %s: Contract error - %s",
                             account_address, ex)
@@ -104,6 +222,76 @@ class Vault:
 
         return (balance, collateral_value, liability_value)
 
+    def refresh_pyth_feed_ids(self) -> None:
+        """
+        Refresh the cached oracle adapters and list of Pyth feed IDs used by this vault,
+        if the cache has expired.
+        """
+        if time.time() - self.last_pyth_feed_ids_update > self.config.PYTH_CACHE_REFRESH:
+            try:
+                self.oracle_adapters = PullOracleHandler.get_oracle_adapters(self, self.config)
+                self.pyth_feed_ids = PullOracleHandler.get_pyth_feed_ids(
+                    self, self.oracle_adapters, self.config)
+            except Exception as ex: # pylint: disable=broad-except
+                logger.error("Vault: Error resolving oracle adapters for %s: %s",
+                             self.address, ex, exc_info=True)
+            self.last_pyth_feed_ids_update = time.time()
+
+            if self.config.PYTH_STREAM_ENABLED and self.pyth_feed_ids:
+                PythStream.get_instance(self.config).add_feed_ids(self.pyth_feed_ids)
+
+    def get_account_liquidity_calls(self, account_address: str) -> List[Tuple[str, bytes]]:
+        """
+        Build the balanceOf and accountLiquidity calls for an account, for use in a multicall.
+
+        Args:
+            account_address (str): The address of the account to check.
+
+        Returns:
+            List[Tuple[str, bytes]]: (target, calldata) tuples for balanceOf and accountLiquidity.
+        """
+        account_address = Web3.to_checksum_address(account_address)
+        return [
+            (self.address, self.get_codec("balanceOf").encode(account_address)),
+            (self.address, self.get_codec("accountLiquidity").encode(account_address, True))
+        ]
+
+    def decode_account_liquidity_results(self, account_address: str,
+                                         balance_result: Tuple[bool, bytes],
+                                         liquidity_result: Tuple[bool, bytes]
+                                         ) -> Tuple[int, int, int]:
+        """
+        Decode the multicall results of the calls built by get_account_liquidity_calls.
+        Mirrors the error handling of get_account_liquidity for each sub-call.
+
+        Args:
+            account_address (str): The address of the account the calls were made for.
+            balance_result (Tuple[bool, bytes]): (success, return data) of balanceOf.
+            liquidity_result (Tuple[bool, bytes]): (success, return data) of accountLiquidity.
+
+        Returns:
+            Tuple[int, int, int]: A tuple containing (balance, collateral_value, liability_value).
+        """
+        balance_success, balance_data = balance_result
+        if not balance_success:
+            logger.error("Vault: Failed to get balance for account %s: reverted with %s",
+                         account_address, "0x" + balance_data.hex())
+            return (0, 0, 0)
+        (balance,) = self.get_codec("balanceOf").decode(balance_data)
+
+        liquidity_success, liquidity_data = liquidity_result
+        if not liquidity_success:
+            error_selector = "0x" + liquidity_data[:4].hex()
+            if error_selector not in ACCOUNT_LIQUIDITY_IGNORED_ERRORS:
+                logger.error("Vault: Failed to get account liquidity"
+                            " for account %s: Contract error - %s",
+                            account_address, "0x" + liquidity_data.hex())
+            return (balance, 0, 0)
+        (collateral_value, liability_value) = self.get_codec("accountLiquidity").decode(
+            liquidity_data)
+
+        return (balance, collateral_value, liability_value)
+
     def check_liquidation(self,
                           borower_address: str,
                           collateral_address: str,
@@ -135,11 +323,12 @@ class Vault:
                 self.config
                 )
         else:
-            (max_repay, seized_collateral) = self.instance.functions.checkLiquidation(
+            (max_repay, seized_collateral) = self.call(
+                "checkLiquidation",
                 Web3.to_checksum_address(liquidator_address),
                 Web3.to_checksum_address(borower_address),
                 Web3.to_checksum_address(collateral_address)
-                ).call()
+                )
         return (max_repay, seized_collateral)
 
     def convert_to_assets(self, amount: int) -> int:
@@ -152,7 +341,8 @@ class Vault:
         Returns:
             int: The amount of underlying assets.
         """
-        return self.instance.functions.convertToAssets(amount).call()
+        (assets,) = self.call("convertToAssets", amount)
+        return assets
 
     def get_ltv_list(self):
         """
@@ -160,6 +350,113 @@ class Vault:
         """
         return self.instance.functions.LTVList().call()
 
+class VaultRegistry:
+    """
+    Per chain registry of Vault instances.
+    Hands out one shared Vault per address and fetches the immutable
+    metadata of new vaults in batches through Multicall3.
+    """
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, config: ChainConfig):
+        self.config = config
+        self.vaults = {}
+        self.lock = threading.Lock()
+        self.multicall = Multicall(config)
+
+    @staticmethod
+    def get_instance(config: ChainConfig) -> "VaultRegistry":
+        """
+        Get the vault registry for the chain of the given config.
+        """
+        with VaultRegistry._instances_lock:
+            if config.CHAIN_ID not in VaultRegistry._instances:
+                VaultRegistry._instances[config.CHAIN_ID] = VaultRegistry(config)
+            return VaultRegistry._instances[config.CHAIN_ID]
+
+    def get_vault(self, address: str) -> Vault:
+        """
+        Get the shared Vault instance for an address, creating it if needed.
+        Metadata is not fetched here, it is loaded on first access.
+
+        Args:
+            address (str): The address of the vault.
+
+        Returns:
+            Vault: The shared vault instance.
+        """
+        address = Web3.to_checksum_address(address)
+        with self.lock:
+            vault = self.vaults.get(address)
+            if vault is None:
+                vault = Vault(address, self.config)
+                self.vaults[address] = vault
+        return vault
+
+    def get_vaults(self, addresses: List[str]) -> Dict[str, Vault]:
+        """
+        Get the shared Vault instances for a list of addresses,
+        fetching the metadata of any new vaults in a single batch.
+
+        Args:
+            addresses (List[str]): The addresses of the vaults.
+
+        Returns:
+            Dict[str, Vault]: Vaults keyed by the addresses passed in.
+        """
+        vaults = {address: self.get_vault(address) for address in addresses}
+        self.hydrate(list(vaults.values()))
+        return vaults
+
+    def hydrate(self, vaults: List[Vault]) -> None:
+        """
+        Fetch metadata for all vaults in the list that do not have it yet, in one multicall.
+        Vaults that fail in the batch are left to fetch their metadata lazily.
+
+        Args:
+            vaults (List[Vault]): Vaults to load metadata for.
+        """
+        missing = [vault for vault in vaults if vault.metadata is None]
+        if not missing:
+            return
+
+        calls = []
+        for vault in missing:
+            calls.extend(vault.get_metadata_calls())
+        results = self.multicall.aggregate(calls)
+
+        num_calls = len(Vault.METADATA_CALLS)
+        for i, vault in enumerate(missing):
+            if not vault.set_metadata_from_results(results[i * num_calls:(i + 1) * num_calls]):
+                logger.warning("VaultRegistry: Failed to batch load metadata for vault %s",
+                               vault.address)
+
+        logger.info("VaultRegistry: Loaded metadata for %s vaults", len(missing))
+
+    def to_dict(self) -> Dict[str, Optional[Dict[str, str]]]:
+        """
+        Return the metadata of all known vaults, keyed by vault address.
+        """
+        with self.lock:
+            vaults = list(self.vaults.values())
+        return {vault.address: vault.metadata for vault in vaults}
+
+    def load(self, vault_metadata: Dict[str, Any]) -> None:
+        """
+        Load vaults from saved state.
+        Supports the legacy format where only the vault address was saved.
+
+        Args:
+            vault_metadata (Dict[str, Any]): Saved metadata (or address) keyed by vault address.
+        """
+        for address, metadata in vault_metadata.items():
+            vault = self.get_vault(address)
+            if isinstance(metadata, dict) and vault.metadata is None:
+                vault.metadata = metadata
+
+        self.hydrate(list(self.vaults.values()))
+
 class Account:
     """
     Represents an account in the EVK System.
@@ -168,10 +465,13 @@ class Account:
     liquidation simulations, and scheduling of updates. It also provides
     methods for serialization and deserialization of account data.
     """
-    def __init__(self, address, controller: Vault, config: ChainConfig):
+    def __init__(self, address, controller: Vault, config: ChainConfig,
+                 owner: Optional[str] = None, subaccount_number: Optional[int] = None):
         self.config = config
         self.address = address
-        self.owner, self.subaccount_number = EVCListener.get_account_owner_and_subaccount_number(self.address, config)
+        if owner is None:
+            owner, subaccount_number = EVCListener.get_account_owner_and_subaccount_number(self.address, config)
+        self.owner, self.subaccount_number = owner, subaccount_number
         self.controller = controller
         self.time_of_next_update = time.time()
         self.current_health_score = math.inf
@@ -202,10 +502,32 @@ class Account:
 
         balance, collateral_value, liability_value = self.controller.get_account_liquidity(
             self.address)
+
+        return self.set_liquidity(balance, collateral_value, liability_value)
+
+    def set_liquidity(self, balance: int, collateral_value: int, liability_value: int,
+                      usd_quotes: Optional[Dict[str, int]] = None) -> float:
+        """
+        Update the account's balance, value borrowed and health score
+        from already fetched liquidity values.
+
+        Args:
+            balance (int): The account's balance in the controller vault.
+            collateral_value (int): Risk adjusted collateral value in the unit of account.
+            liability_value (int): Liability value in the unit of account.
+            usd_quotes (Optional[Dict[str, int]]): Optional USD price of 10**18 units of
+                account, keyed by unit of account, to avoid a quote per account.
+
+        Returns:
+            float: The current health score of the account.
+        """
         self.balance = balance
 
         self.value_borrowed = liability_value
-        if self.controller.unit_of_account == self.config.WETH:
+        if usd_quotes and self.controller.unit_of_account in usd_quotes:
+            self.value_borrowed = (liability_value *
+                                   usd_quotes[self.controller.unit_of_account] // 10**18)
+        elif self.controller.unit_of_account == self.config.WETH:
             logger.info("Account: Getting a quote for %s WETH, unit of account %s",
                         liability_value, self.controller.unit_of_account)
             self.value_borrowed = get_eth_usd_quote(liability_value, self.config)
@@ -308,13 +630,17 @@ class Account:
             "address": self.address,
             "controller_address": self.controller.address,
             "time_of_next_update": self.time_of_next_update,
-            "current_health_score": self.current_health_score
+            "current_health_score": self.current_health_score,
+            "owner": self.owner,
+            "subaccount_number": self.subaccount_number,
+            "value_borrowed": self.value_borrowed
         }
 
     @staticmethod
     def from_dict(data: Dict[str, Any], vaults: Dict[str, Vault], config: ChainConfig) -> "Account":
         """
         Create an Account object from a dictionary representation.
+        The account owner is only queried for accounts saved without it.
 
         Args:
             data (Dict[str, Any]): The dictionary representation of the account.
@@ -325,11 +651,13 @@ class Account:
         """
         controller = vaults.get(data["controller_address"])
         if not controller:
-            controller = Vault(data["controller_address"], config)
+            controller = VaultRegistry.get_instance(config).get_vault(data["controller_address"])
             vaults[data["controller_address"]] = controller
-        account = Account(address=data["address"], controller=controller, config=config)
+        account = Account(address=data["address"], controller=controller, config=config,
+                          owner=data.get("owner"), subaccount_number=data.get("subaccount_number"))
         account.time_of_next_update = data["time_of_next_update"]
         account.current_health_score = data["current_health_score"]
+        account.value_borrowed = data.get("value_borrowed", 0)
         return account
 
 class AccountMonitor:
@@ -346,9 +674,35 @@ class AccountMonitor:
         self.config = config
         self.accounts = {}
         self.vaults = {}
-        self.update_queue = queue.PriorityQueue()
+        self.vault_registry = VaultRegistry.get_instance(config)
+        self.update_queue = AccountScheduler()
         self.condition = threading.Condition()
         self.executor = ThreadPoolExecutor(max_workers=32)
+        self.async_engine = None
+        if config.EXECUTION_ENGINE == "async":
+            self.async_engine = AsyncEngine.get_instance(config)
+        elif config.EXECUTION_ENGINE != "threaded":
+            raise ValueError(f"Unknown execution engine {config.EXECUTION_ENGINE}")
+        self.multicall = Multicall(config)
+
+        # address -> whether another update was requested while in flight
+        self.in_flight_updates: Dict[str, bool] = {}
+        self.in_flight_lock = threading.Lock()
+        self.coalesced_updates = 0
+        self.follow_up_updates = 0
+
+        # Accounts with a liquidation sent and not settled yet, which are neither simulated
+        # nor liquidated again until the ReceiptTracker reports the outcome
+        self.pending_liquidations: Set[str] = set()
+        self.pending_liquidations_lock = threading.Lock()
+
+        self.backfill = None
+
+        self.journal = None
+        if config.STATE_JOURNAL_ENABLED:
+            self.journal = StateJournal(config, config.SAVE_STATE_PATH)
+            self.journal.open()
+
         self.running = True
         self.latest_block = 0
         self.last_saved_block = 0
@@ -375,26 +729,26 @@ class AccountMonitor:
 
         while self.running:
             with self.condition:
-                while self.update_queue.empty():
+                head = self.update_queue.peek()
+                if head is None:
                     logger.info("AccountMonitor: Waiting for queue to be non-empty.")
                     self.condition.wait()
-
-                next_update_time, address = self.update_queue.get()
-
-                # check for special value that indicates
-                # account should be skipped & removed from queue
-                if next_update_time == -1:
-                    logger.info("AccountMonitor: %s has no position,"
-                                " skipping and removing from queue", address)
                     continue
 
+                next_update_time, address = head
                 current_time = time.time()
                 if next_update_time > current_time:
-                    self.update_queue.put((next_update_time, address))
                     self.condition.wait(next_update_time - current_time)
                     continue
 
-                self.executor.submit(self.update_account_liquidity, address)
+                if self.config.BATCH_HEALTH_SWEEP:
+                    # Take every account that is already due into the same batch
+                    due_addresses = self.update_queue.pop_due(current_time)
+                    self.executor.submit(self.batch_update_account_liquidity, due_addresses)
+                    continue
+
+                for address in self.update_queue.pop_due(current_time, limit=1):
+                    self.submit_account_update(address)
 
 
     def update_account_on_status_check_event(self, address: str, vault_address: str) -> None:
@@ -408,7 +762,7 @@ class AccountMonitor:
 
         # If the vault is not already tracked in the list, create it
         if vault_address not in self.vaults:
-            self.vaults[vault_address] = Vault(vault_address, self.config)
+            self.vaults[vault_address] = self.vault_registry.get_vault(vault_address)
             logger.info("AccountMonitor: Vault %s added to vault list.", vault_address)
 
         vault = self.vaults[vault_address]
@@ -429,9 +783,111 @@ class AccountMonitor:
 
         self.update_account_liquidity(address)
 
+    def add_accounts(self, controllers: Dict[str, str]) -> None:
+        """
+        Track accounts with their controller and evaluate them all in one batch update.
+        Accounts already tracked with the same controller are kept and only re-evaluated.
+
+        Args:
+            controllers (Dict[str, str]): Controller vault address by account address.
+        """
+        def create_account(address: str, vault_address: str) -> None:
+            if vault_address not in self.vaults:
+                self.vaults[vault_address] = self.vault_registry.get_vault(vault_address)
+            account = self.accounts.get(address)
+            if account is None or account.controller.address != vault_address:
+                self.accounts[address] = Account(address, self.vaults[vault_address],
+                                                 self.config)
+
+        # Creating an account queries its owner, do it on the executor
+        futures = [self.executor.submit(create_account, address, vault_address)
+                   for address, vault_address in controllers.items()]
+        for future, address in zip(futures, controllers):
+            try:
+                future.result()
+            except Exception as ex: # pylint: disable=broad-except
+                logger.error("AccountMonitor: Failed to add account %s: %s",
+                             address, ex, exc_info=True)
+
+        addresses = [address for address in controllers if address in self.accounts]
+        logger.info("AccountMonitor: Added %s accounts, evaluating in batch.", len(addresses))
+        for i in range(0, len(addresses), self.config.MULTICALL_BATCH_SIZE):
+            self.batch_update_account_liquidity(
+                addresses[i:i + self.config.MULTICALL_BATCH_SIZE])
+
     def update_account_liquidity(self, address: str) -> None:
         """
         Update the liquidity of a specific account.
+        If an update of the account is already in flight, the request is coalesced into
+        a single follow-up update run once the current one finishes.
+
+        Args:
+            address (str): The address of the account to update.
+        """
+        if self.begin_account_update(address):
+            self.run_account_update(address)
+
+    def begin_account_update(self, address: str) -> bool:
+        """
+        Mark an account update as in flight.
+
+        Args:
+            address (str): The address of the account to update.
+
+        Returns:
+            bool: True if the caller should run the update, False if an update is already
+            in flight, in which case that update is marked for one follow-up.
+        """
+        with self.in_flight_lock:
+            if address in self.in_flight_updates:
+                self.in_flight_updates[address] = True
+                self.coalesced_updates += 1
+                return False
+            self.in_flight_updates[address] = False
+            return True
+
+    def finish_account_update(self, address: str) -> bool:
+        """
+        Mark an account update as finished.
+
+        Args:
+            address (str): The address of the updated account.
+
+        Returns:
+            bool: True if updates were requested while in flight, in which case the account
+            stays in flight and the caller should run exactly one follow-up update.
+        """
+        with self.in_flight_lock:
+            if self.in_flight_updates.pop(address, False):
+                self.in_flight_updates[address] = False
+                self.follow_up_updates += 1
+                return True
+            return False
+
+    def run_account_update(self, address: str) -> None:
+        """
+        Run an update already marked as in flight, followed by the follow-up update
+        requested meanwhile, if any.
+
+        Args:
+            address (str): The address of the account to update.
+        """
+        self.evaluate_account_liquidity(address)
+        self.run_follow_up_updates(address)
+
+    def run_follow_up_updates(self, address: str) -> None:
+        """
+        Finish an in flight update and run the follow-up update requested meanwhile, if any.
+
+        Args:
+            address (str): The address of the updated account.
+        """
+        while self.finish_account_update(address):
+            self.evaluate_account_liquidity(address)
+
+    def evaluate_account_liquidity(self, address: str) -> None:
+        """
+        Evaluate the liquidity of an account, handle it if unhealthy and schedule its next update.
 
         Args:
             address (str): The address of the account to update.
@@ -445,125 +901,397 @@ class AccountMonitor:
                 return
 
             logger.info("AccountMonitor: Updating %s liquidity.", address)
-            prev_scheduled_time = account.time_of_next_update
 
             health_score = account.update_liquidity()
 
             if health_score < 1:
+                self.handle_unhealthy_account(account, health_score)
+
+            self.schedule_account_update(account)
+
+        except Exception as ex: # pylint: disable=broad-except
+            logger.error("AccountMonitor: Exception updating account %s: %s",
+                         address, ex, exc_info=True)
+
+    def submit_account_update(self, address: str) -> None:
+        """
+        Submit an account liquidity update to the configured execution engine.
+
+        Args:
+            address (str): The address of the account to update.
+        """
+        if self.async_engine is not None:
+            self.async_engine.submit(self.async_update_account_liquidity(address))
+        else:
+            self.executor.submit(self.update_account_liquidity, address)
+
+    async def async_update_account_liquidity(self, address: str) -> None:
+        """
+        Update the liquidity of a specific account on the async engine.
+        Same as update_account_liquidity, with unhealthy accounts handled on the engine's
+        thread pool.
+
+        Args:
+            address (str): The address of the account to update.
+        """
+        if not self.begin_account_update(address):
+            return
+
+        await self.async_evaluate_account_liquidity(address)
+        while self.finish_account_update(address):
+            await self.async_evaluate_account_liquidity(address)
+
+    async def async_evaluate_account_liquidity(self, address: str) -> None:
+        """
+        Async counterpart of evaluate_account_liquidity.
+
+        Args:
+            address (str): The address of the account to update.
+        """
+        try:
+            account = self.accounts.get(address)
+
+            if not account:
+                logger.error("AccountMonitor: %s not found in account list.", address)
+                return
+
+            logger.info("AccountMonitor: Updating %s liquidity.", address)
+
+            health_score = await self.async_engine.update_liquidity(
+                account, ACCOUNT_LIQUIDITY_IGNORED_ERRORS)
+
+            if health_score < 1:
+                await self.async_engine.run_blocking(self.handle_unhealthy_account,
+                                                     account, health_score)
+
+            self.schedule_account_update(account)
+
+        except Exception as ex: # pylint: disable=broad-except
+            logger.error("AccountMonitor: Exception updating account %s: %s",
+                         address, ex, exc_info=True)
+
+    def schedule_account_update(self, account: "Account") -> None:
+        """
+        Put the account's next update in the queue, replacing any entry it already has.
+        Accounts without a position are removed from the queue.
+
+        Args:
+            account (Account): The updated account.
+        """
+        if account.time_of_next_update == -1:
+            logger.info("AccountMonitor: %s has no position, removing from queue",
+                        account.address)
+
+        with self.condition:
+            self.update_queue.reschedule(account.address, account.time_of_next_update)
+            self.condition.notify()
+
+        if self.journal is not None:
+            self.journal.record_account(account.address, account.to_dict())
+
+    def prioritize_accounts(self, update_times: Dict[str, float]) -> None:
+        """
+        Move accounts to the front of the update queue, ahead of their scheduled update.
+
+        Args:
+            update_times (Dict[str, float]): Update time to schedule by account address.
+                Times in the past put the account ahead of accounts that are already due.
+        """
+        if not update_times:
+            return
+
+        with self.condition:
+            for address, update_time in update_times.items():
+                account = self.accounts.get(address)
+                if not account:
+                    continue
+                account.time_of_next_update = update_time
+                self.update_queue.reschedule(address, update_time)
+            self.condition.notify()
+
+    def batch_update_account_liquidity(self, addresses: List[str]) -> None:
+        """
+        Update the liquidity of a group of accounts with batched multicalls.
+        Accounts whose controller uses Pyth oracles need a simulated price update, so they are
+        sent through the regular per account update instead.
+
+        Args:
+            addresses (List[str]): The addresses of the accounts to update.
+        """
+        try:
+            batched_accounts = []
+            pyth_accounts = []
+            for address in dict.fromkeys(addresses):
+                account = self.accounts.get(address)
+                if not account:
+                    logger.error("AccountMonitor: %s not found in account list.", address)
+                    continue
+
+                account.controller.refresh_pyth_feed_ids()
+                if len(account.controller.pyth_feed_ids) > 0:
+                    pyth_accounts.append(account)
+                elif self.begin_account_update(address):
+                    batched_accounts.append(account)
+
+            if pyth_accounts:
+                # Get update data for the union of all due feeds in one request,
+                # the per account simulations are then served from the cache
                 try:
-                    if self.notify:
-                        if account.address in self.recently_posted_low_value:
-                            if (time.time() - self.recently_posted_low_value[account.address]
-                                < self.config.LOW_HEALTH_REPORT_INTERVAL
-                                and account.value_borrowed < self.config.SMALL_POSITION_THRESHOLD):
-                                logger.info("Skipping posting notification "
-                                            "for account %s, recently posted", address)
-                        else:
-                            try:
-                                post_unhealthy_account_on_slack(address, account.controller.address,
-                                                                health_score,
-                                                                account.value_borrowed, self.config)
-                                logger.info("Valut borrowed: %s", account.value_borrowed)
-                                if account.value_borrowed < self.config.SMALL_POSITION_THRESHOLD:
-                                    self.recently_posted_low_value[account.address] = time.time()
-                            except Exception as ex: # pylint: disable=broad-except
-                                logger.error("AccountMonitor: "
-                                             "Failed to post low health notification "
-                                             "for account %s to slack: %s",
-                                             address, ex, exc_info=True)
-
-                    logger.info("AccountMonitor: %s is unhealthy, "
-                                "checking liquidation profitability.",
-                                address)
-                    (result, liquidation_data, params) = account.simulate_liquidation()
-
-                    if result:
-                        if self.notify:
-                            try:
-                                logger.info("AccountMonitor: Posting liquidation notification "
-                                            "to slack for account %s.", address)
-                                post_liquidation_opportunity_on_slack(address,
-                                                                      account.controller.address,
-                                                                      liquidation_data, params, self.config)
-                            except Exception as ex: # pylint: disable=broad-except
-                                logger.error("AccountMonitor: "
-                                             "Failed to post liquidation notification "
-                                             " for account %s to slack: %s",
-                                             address, ex, exc_info=True)
-                        if self.execute_liquidation:
-                            try:
-                                tx_hash, tx_receipt = Liquidator.execute_liquidation(
-                                    liquidation_data["tx"], self.config)
-                                if tx_hash and tx_receipt:
-                                    logger.info("AccountMonitor: %s liquidated "
-                                                "on collateral %s.",
-                                                address,
-                                                liquidation_data["collateral_address"])
-                                    if self.notify:
-                                        try:
-                                            logger.info("AccountMonitor: Posting liquidation result"
-                                                        " to slack for account %s.", address)
-                                            post_liquidation_result_on_slack(address,
-                                                                            account.controller.address,
-                                                                            liquidation_data,
-                                                                            tx_hash, self.config)
-                                        except Exception as ex: # pylint: disable=broad-except
-                                            logger.error("AccountMonitor: "
-                                                "Failed to post liquidation result "
-                                                " for account %s to slack: %s",
-                                                address, ex, exc_info=True)
-
-                                # Update account health score after liquidation
-                                # Need to know how healthy the account is after liquidation
-                                # and if we need to liquidate again
-                                account.update_liquidity()
-                            except Exception as ex: # pylint: disable=broad-except
-                                logger.error("AccountMonitor: "
-                                             "Failed to execute liquidation for account %s: %s",
-                                             address, ex, exc_info=True)
-                    else:
-                        logger.info("AccountMonitor: "
-                                    "Account %s is unhealthy but not profitable to liquidate.",
-                                    address)
+                    PythUpdateCache.get_instance(self.config).prefetch(
+                        account.controller.pyth_feed_ids for account in pyth_accounts)
                 except Exception as ex: # pylint: disable=broad-except
-                    logger.error("AccountMonitor: "
-                                 "Exception simulating liquidation for account %s: %s",
-                                 address, ex, exc_info=True)
+                    logger.error("AccountMonitor: Failed to prefetch Pyth update data: %s",
+                                 ex, exc_info=True)
+                for account in pyth_accounts:
+                    self.submit_account_update(account.address)
+
+            if not batched_accounts:
+                return
 
-            next_update_time = account.time_of_next_update
+            logger.info("AccountMonitor: Batch updating liquidity for %s accounts.",
+                        len(batched_accounts))
 
-            # if next update hasn't changed, means we already have a check scheduled
-            if next_update_time == prev_scheduled_time:
-                logger.info("AccountMonitor: %s next update already scheduled for %s",
-                            address, time.strftime("%Y-%m-%d %H:%M:%S",
-                                                  time.localtime(next_update_time)))
+            try:
+                calls = []
+                for account in batched_accounts:
+                    calls.extend(account.controller.get_account_liquidity_calls(account.address))
+                results = self.multicall.aggregate(calls)
+
+                usd_quotes = {}
+                units_of_account = {account.controller.unit_of_account
+                                    for account in batched_accounts}
+                if self.config.WETH in units_of_account:
+                    usd_quotes[self.config.WETH] = get_eth_usd_quote(10**18, self.config)
+                if self.config.BTC in units_of_account:
+                    usd_quotes[self.config.BTC] = get_btc_usd_quote(10**18, self.config)
+            except Exception as ex: # pylint: disable=broad-except
+                logger.error("AccountMonitor: Batch calls failed, falling back to regular "
+                             "updates: %s", ex, exc_info=True)
+                for account in batched_accounts:
+                    self.executor.submit(self.run_account_update, account.address)
                 return
 
+            queue_entries = []
+            for i, account in enumerate(batched_accounts):
+                balance_result, liquidity_result = results[2 * i], results[2 * i + 1]
+
+                # The whole aggregate3 chunk failed, fall back to a regular update
+                if balance_result is None or liquidity_result is None:
+                    self.executor.submit(self.run_account_update, account.address)
+                    continue
+
+                try:
+                    liquidity = account.controller.decode_account_liquidity_results(
+                        account.address, balance_result, liquidity_result)
+                    health_score = account.set_liquidity(*liquidity, usd_quotes=usd_quotes)
+                    account.get_time_of_next_update()
+
+                    # Unhealthy accounts need simulation, handle them outside of the batch
+                    if health_score < 1:
+                        self.executor.submit(self.handle_batched_unhealthy_account,
+                                             account, health_score)
+                        continue
+
+                    queue_entries.append((account.time_of_next_update, account.address))
+                    if self.journal is not None:
+                        self.journal.record_account(account.address, account.to_dict())
+                except Exception as ex: # pylint: disable=broad-except
+                    logger.error("AccountMonitor: Exception updating account %s in batch: %s",
+                                 account.address, ex, exc_info=True)
+                    if self.finish_account_update(account.address):
+                        self.executor.submit(self.run_account_update, account.address)
+
             with self.condition:
-                self.update_queue.put((next_update_time, address))
+                for next_update_time, address in queue_entries:
+                    self.update_queue.reschedule(address, next_update_time)
                 self.condition.notify()
 
+            for _, address in queue_entries:
+                if self.finish_account_update(address):
+                    self.executor.submit(self.run_account_update, address)
+
+            logger.info("AccountMonitor: Batch update finished, %s accounts rescheduled.",
+                        len(queue_entries))
+        except Exception as ex: # pylint: disable=broad-except
+            logger.error("AccountMonitor: Exception in batch account update: %s",
+                         ex, exc_info=True)
+
+    def handle_batched_unhealthy_account(self, account: "Account", health_score: float) -> None:
+        """
+        Handle an unhealthy account found during a batch update, then schedule its next update.
+
+        Args:
+            account (Account): The unhealthy account.
+            health_score (float): The health score found in the batch update.
+        """
+        try:
+            self.handle_unhealthy_account(account, health_score)
+            self.schedule_account_update(account)
         except Exception as ex: # pylint: disable=broad-except
             logger.error("AccountMonitor: Exception updating account %s: %s",
+                         account.address, ex, exc_info=True)
+        self.run_follow_up_updates(account.address)
+
+    def handle_unhealthy_account(self, account: "Account", health_score: float) -> None:
+        """
+        Notify about an unhealthy account, simulate its liquidation and execute it if profitable.
+
+        Args:
+            account (Account): The unhealthy account.
+            health_score (float): The current health score of the account.
+        """
+        address = account.address
+        try:
+            if self.notify:
+                if account.address in self.recently_posted_low_value:
+                    if (time.time() - self.recently_posted_low_value[account.address]
+                        < self.config.LOW_HEALTH_REPORT_INTERVAL
+                        and account.value_borrowed < self.config.SMALL_POSITION_THRESHOLD):
+                        logger.info("Skipping posting notification "
+                                    "for account %s, recently posted", address)
+                else:
+                    try:
+                        post_unhealthy_account_on_slack(address, account.controller.address,
+                                                        health_score,
+                                                        account.value_borrowed, self.config)
+                        logger.info("Valut borrowed: %s", account.value_borrowed)
+                        if account.value_borrowed < self.config.SMALL_POSITION_THRESHOLD:
+                            self.recently_posted_low_value[account.address] = time.time()
+                    except Exception as ex: # pylint: disable=broad-except
+                        logger.error("AccountMonitor: "
+                                     "Failed to post low health notification "
+                                     "for account %s to slack: %s",
+                                     address, ex, exc_info=True)
+
+            if address in self.pending_liquidations:
+                logger.info("AccountMonitor: %s is unhealthy, but a liquidation of it is "
+                            "already pending.", address)
+                return
+
+            logger.info("AccountMonitor: %s is unhealthy, "
+                        "checking liquidation profitability.",
+                        address)
+            (result, liquidation_data, params) = account.simulate_liquidation()
+
+            if result:
+                if self.notify:
+                    try:
+                        logger.info("AccountMonitor: Posting liquidation notification "
+                                    "to slack for account %s.", address)
+                        post_liquidation_opportunity_on_slack(address,
+                                                              account.controller.address,
+                                                              liquidation_data, params, self.config)
+                    except Exception as ex: # pylint: disable=broad-except
+                        logger.error("AccountMonitor: "
+                                     "Failed to post liquidation notification "
+                                     " for account %s to slack: %s",
+                                     address, ex, exc_info=True)
+                if self.execute_liquidation:
+                    self.send_liquidation(account, liquidation_data)
+            else:
+                logger.info("AccountMonitor: "
+                            "Account %s is unhealthy but not profitable to liquidate.",
+                            address)
+        except Exception as ex: # pylint: disable=broad-except
+            logger.error("AccountMonitor: "
+                         "Exception simulating liquidation for account %s: %s",
                          address, ex, exc_info=True)
 
+    def send_liquidation(self, account: "Account", liquidation_data: Dict[str, Any]) -> None:
+        """
+        Send a profitable liquidation, unless one is already pending for the account.
+        The account stays in pending_liquidations until handle_liquidation_receipt runs.
+
+        Args:
+            account (Account): The account to liquidate.
+            liquidation_data (Dict[str, Any]): The liquidation details from the simulation.
+        """
+        address = account.address
+        with self.pending_liquidations_lock:
+            if address in self.pending_liquidations:
+                logger.info("AccountMonitor: Liquidation of %s already pending, "
+                            "not sending another one.", address)
+                return
+            self.pending_liquidations.add(address)
+
+        tx_hash = None
+        try:
+            tx_hash = Liquidator.execute_liquidation(
+                liquidation_data["tx"], self.config,
+                functools.partial(self.handle_liquidation_receipt, account, liquidation_data))
+            if tx_hash:
+                logger.info("AccountMonitor: Liquidation of %s on collateral %s "
+                            "sent in transaction %s.", address,
+                            liquidation_data["collateral_address"], tx_hash)
+        except Exception as ex: # pylint: disable=broad-except
+            logger.error("AccountMonitor: "
+                         "Failed to execute liquidation for account %s: %s",
+                         address, ex, exc_info=True)
+        finally:
+            if not tx_hash:
+                with self.pending_liquidations_lock:
+                    self.pending_liquidations.discard(address)
+
+    def handle_liquidation_receipt(self, account: "Account", liquidation_data: Dict[str, Any],
+                                   tx_hash: str, tx_receipt: Optional[Dict[str, Any]]) -> None:
+        """
+        Handle a settled liquidation transaction from the ReceiptTracker: post the result
+        and re-queue the account, since it may need to be liquidated again.
+
+        Args:
+            account (Account): The liquidated account.
+            liquidation_data (Dict[str, Any]): The liquidation details from the simulation.
+            tx_hash (str): The final transaction hash.
+            tx_receipt (Optional[Dict[str, Any]]): The receipt, None if it was not mined.
+        """
+        if tx_receipt is not None and tx_receipt["status"] == 1:
+            logger.info("AccountMonitor: %s liquidated on collateral %s.",
+                        account.address, liquidation_data["collateral_address"])
+            if self.notify:
+                try:
+                    logger.info("AccountMonitor: Posting liquidation result"
+                                " to slack for account %s.", account.address)
+                    post_liquidation_result_on_slack(account.address,
+                                                     account.controller.address,
+                                                     liquidation_data,
+                                                     tx_hash, self.config)
+                except Exception as ex: # pylint: disable=broad-except
+                    logger.error("AccountMonitor: "
+                        "Failed to post liquidation result "
+                        " for account %s to slack: %s",
+                        account.address, ex, exc_info=True)
+        else:
+            post_error_notification(f"Liquidation transaction {tx_hash} for account "
+                                    f"{account.address} failed or was not mined", self.config)
+
+        # Need to know how healthy the account is after liquidation
+        # and if we need to liquidate again
+        with self.pending_liquidations_lock:
+            self.pending_liquidations.discard(account.address)
+        self.submit_account_update(account.address)
+
     def save_state(self, local_save: bool = True) -> None:
         """
         Save the current state of the account monitor.
+        With STATE_JOURNAL_ENABLED, account changes are already journaled as they happen,
+        so only changed vaults and the last scanned block are recorded before flushing.
 
         Args:
             local_save (bool, optional): Whether to save the state locally. Defaults to True.
         """
         try:
-            state = {
-                "accounts": {address: account.to_dict()
-                             for address, account in self.accounts.items()},
-                "vaults": {address: vault.address for address, vault in self.vaults.items()},
-                "queue": list(self.update_queue.queue),
-                "last_saved_block": self.latest_block,
-            }
-
-            if local_save:
+            if local_save and self.journal is not None:
+                self.journal.record_vaults(self.vault_registry.to_dict())
+                self.journal.record_block(self.latest_block)
+                self.journal.flush()
+            elif local_save:
+                state = {
+                    "accounts": {address: account.to_dict()
+                                 for address, account in self.accounts.items()},
+                    "vaults": self.vault_registry.to_dict(),
+                    "queue": self.update_queue.items(),
+                    "last_saved_block": self.latest_block,
+                }
                 with open(self.config.SAVE_STATE_PATH, "w", encoding="utf-8") as f:
                     json.dump(state, f)
             else:
@@ -581,18 +1309,31 @@ class AccountMonitor:
     def load_state(self, save_path: str, local_save: bool = True) -> None:
         """
         Load the state of the account monitor from a file.
+        With STATE_JOURNAL_ENABLED, the state is replayed from the journal, and a legacy
+        JSON save file is only read if no journal exists yet, then migrated to a snapshot.
 
         Args:
             save_path (str): The path to the saved state file.
             local_save (bool, optional): Whether the state is saved locally. Defaults to True.
         """
         try:
-            if local_save and os.path.exists(save_path):
+            state = None
+            if local_save and self.journal is not None and self.journal.exists():
+                state = self.journal.load()
+            elif local_save and os.path.exists(save_path):
                 with open(save_path, "r", encoding="utf-8") as f:
                     state = json.load(f)
-
-                self.vaults = {address: Vault(address, self.config) for address in state["vaults"]}
-                logger.info("Loaded %s vaults: %s", len(self.vaults), list(self.vaults.keys()))
+                if self.journal is not None:
+                    self.journal.write_snapshot(state)
+                    self.journal.vaults = dict(state["vaults"])
+                    logger.info("AccountMonitor: Migrated save file %s to snapshot %s",
+                                save_path, self.journal.snapshot_path)
+
+            if state is not None:
+                # Vault metadata is restored from the save file, only vaults saved
+                # without metadata are queried
+                self.vault_registry.load(state["vaults"])
+                logger.info("Loaded %s vaults", len(state["vaults"]))
 
                 self.accounts = {address: Account.from_dict(data, self.vaults, self.config)
                                  for address, data in state["accounts"].items()}
@@ -608,7 +1349,10 @@ class AccountMonitor:
                                 time.strftime("%Y-%m-%d %H:%M:%S",
                                 time.localtime(account.time_of_next_update)))
 
-                self.rebuild_queue()
+                if self.config.WARM_RESTART_ENABLED:
+                    self.restore_queue()
+                else:
+                    self.rebuild_queue()
 
                 self.last_saved_block = state["last_saved_block"]
                 self.latest_block = self.last_saved_block
@@ -625,13 +1369,55 @@ class AccountMonitor:
         except Exception as ex: # pylint: disable=broad-except
             logger.error("AccountMonitor: Failed to load state: %s", ex, exc_info=True)
 
+    def restore_queue(self) -> None:
+        """
+        Restore the queue from the persisted schedule so monitoring can start right away,
+        then refresh every account in the background.
+        """
+        update_queue = AccountScheduler()
+        for address, account in self.accounts.items():
+            if (account.current_health_score == math.inf or
+                account.time_of_next_update == -1):
+                continue
+            update_queue.reschedule(address, account.time_of_next_update)
+
+        with self.condition:
+            self.update_queue = update_queue
+            self.condition.notify()
+
+        logger.info("AccountMonitor: Queue restored with %s accounts from saved schedule",
+                    len(update_queue))
+
+        threading.Thread(target=self.refresh_restored_accounts, daemon=True).start()
+
+    def refresh_restored_accounts(self) -> None:
+        """
+        Update all restored accounts on WARM_RESTART_WORKERS threads,
+        overdue accounts first, then by increasing health score.
+        Should be run in a standalone thread.
+        """
+        start_time = time.time()
+        accounts = sorted(self.accounts.values(),
+                          key=lambda account: (not 0 <= account.time_of_next_update <= start_time,
+                                               account.current_health_score))
+
+        def refresh(address: str) -> None:
+            if self.running:
+                self.update_account_liquidity(address)
+
+        with ThreadPoolExecutor(max_workers=self.config.WARM_RESTART_WORKERS) as executor:
+            executor.map(refresh, [account.address for account in accounts])
+
+        logger.info("AccountMonitor: Refreshed %s restored accounts in %.2f seconds",
+                    len(accounts), time.time() - start_time)
+
     def rebuild_queue(self):
         """
         Rebuild queue based on current account health
         """
         logger.info("Rebuilding queue based on current account health")
 
-        self.update_queue = queue.PriorityQueue()
+        update_queue = AccountScheduler()
         for address, account in self.accounts.items():
             try:
                 health_score = account.update_liquidity()
@@ -641,7 +1427,7 @@ class AccountMonitor:
                     continue
 
                 next_update_time = account.time_of_next_update
-                self.update_queue.put((next_update_time, address))
+                update_queue.reschedule(address, next_update_time)
                 logger.info("AccountMonitor: %s added to queue"
                             " with health score %s, next update at %s",
                             address, health_score, time.strftime("%Y-%m-%d %H:%M:%S",
@@ -650,7 +1436,45 @@ class AccountMonitor:
                 logger.error("AccountMonitor: Failed to put account %s into rebuilt queue: %s",
                              address, ex, exc_info=True)
 
-        logger.info("AccountMonitor: Queue rebuilt with %s acccounts", self.update_queue.qsize())
+        with self.condition:
+            self.update_queue = update_queue
+            self.condition.notify()
+
+        logger.info("AccountMonitor: Queue rebuilt with %s acccounts", len(self.update_queue))
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get monitoring metrics for the account monitor.
+
+        Returns:
+            Dict[str, Any]: Account count, latest scanned block, update queue metrics,
+            counts of duplicate updates avoided by coalescing, startup backfill progress,
+            swap quote cache hits, collaterals skipped by the profit prescreen, the
+            shared block context, the nonces of the liquidator EOAs, pending liquidations,
+            broadcast latencies and RPC endpoint latencies.
+        """
+        return {
+            "accounts": len(self.accounts),
+            "latest_block": self.latest_block,
+            "queue": self.update_queue.get_metrics(),
+            "updates": {
+                "in_flight": len(self.in_flight_updates),
+                "coalesced": self.coalesced_updates,
+                "follow_ups": self.follow_up_updates,
+                "pending_liquidations": len(self.pending_liquidations),
+            },
+            "backfill": self.backfill.get_metrics() if self.backfill else None,
+            "quotes": QuoteCache.get_instance(self.config).get_metrics(),
+            "prescreen": ProfitPrescreen.get_instance(self.config).get_metrics(),
+            "block_context": BlockContext.get_instance(self.config).get_metrics(),
+            "eoas": (EOAPool.get_instance(self.config).get_metrics()
+                     if self.execute_liquidation else None),
+            "receipts": ReceiptTracker.get_instance(self.config).get_metrics(),
+            "broadcast": (Broadcaster.get_instance(self.config).get_metrics()
+                          if self.config.BROADCAST_ENABLED else None),
+            "rpc": (self.config.w3.provider.get_metrics()
+                    if isinstance(self.config.w3.provider, RPCPoolProvider) else None),
+        }
 
     def get_accounts_by_health_score(self):
         """
@@ -715,7 +1539,13 @@ class AccountMonitor:
         with self.condition:
             self.condition.notify_all()
         self.executor.shutdown(wait=True)
+        if self.async_engine is not None:
+            self.async_engine.stop()
+        if self.config.PYTH_STREAM_ENABLED:
+            PythStream.get_instance(self.config).stop()
         self.save_state()
+        if self.journal is not None:
+            self.journal.close()
 
 class PullOracleHandler:
     """
@@ -726,13 +1556,13 @@ class PullOracleHandler:
 
     @staticmethod
     def get_account_values_with_pyth_batch_simulation(vault, account_address, feed_ids, config: ChainConfig):
-        update_data = PullOracleHandler.get_pyth_update_data(feed_ids)
+        update_data = PullOracleHandler.get_pyth_update_data(feed_ids, config)
         update_fee = PullOracleHandler.get_pyth_update_fee(update_data, config)
 
         liquidator = config.liquidator
 
         result = liquidator.functions.simulatePythUpdateAndGetAccountStatus(
-            [update_data], update_fee, vault.address, account_address
+            update_data, update_fee, vault.address, account_address
             ).call({
                 "value": update_fee
             })
@@ -741,13 +1571,13 @@ class PullOracleHandler:
     @staticmethod
     def check_liquidation_with_pyth_batch_simulation(vault, liquidator_address, borrower_address,
                                                      collateral_address, feed_ids, config: ChainConfig):
-        update_data = PullOracleHandler.get_pyth_update_data(feed_ids)
+        update_data = PullOracleHandler.get_pyth_update_data(feed_ids, config)
         update_fee = PullOracleHandler.get_pyth_update_fee(update_data, config)
 
         liquidator = config.liquidator
 
         result = liquidator.functions.simulatePythUpdateAndCheckLiquidation(
-            [update_data], update_fee, vault.address,
+            update_data, update_fee, vault.address,
             liquidator_address, borrower_address, collateral_address
             ).call({
                 "value": update_fee
@@ -758,85 +1588,95 @@ class PullOracleHandler:
     @staticmethod
     def get_feed_ids(vault, config: ChainConfig):
         try:
-            oracle_address = vault.oracle_address
-            oracle = create_contract_instance(oracle_address, config.ORACLE_ABI_PATH, config)
+            oracle_adapters = PullOracleHandler.get_oracle_adapters(vault, config)
+            return PullOracleHandler.get_pyth_feed_ids(vault, oracle_adapters, config)
+        except Exception as ex: # pylint: disable=broad-except
+            logger.error("PullOracleHandler: Error calling contract: %s", ex, exc_info=True)
 
-            unit_of_account = vault.unit_of_account
+    @staticmethod
+    def get_oracle_adapters(vault, config: ChainConfig) -> Dict[str, str]:
+        """
+        Resolve the oracle adapters pricing the vault's asset and its collaterals,
+        following cross adapters down to the adapters reading the underlying price sources.
 
-            collateral_vault_list = vault.get_ltv_list()
-            asset_list = [Vault(collateral_vault, config).underlying_asset_address
-                          for collateral_vault in collateral_vault_list]
-            asset_list.append(vault.underlying_asset_address)
+        Returns:
+            Dict[str, str]: Adapter name by adapter address.
+        """
+        oracle_address = vault.oracle_address
+        oracle = create_contract_instance(oracle_address, config.ORACLE_ABI_PATH, config)
 
-            pyth_feed_ids = set()
+        unit_of_account = vault.unit_of_account
 
-            for asset in asset_list:
-                (_, _, _, configured_oracle_address) = oracle.functions.resolveOracle(0, asset, unit_of_account).call()
+        collateral_vault_list = vault.get_ltv_list()
+        collateral_vaults = VaultRegistry.get_instance(config).get_vaults(collateral_vault_list)
+        asset_list = [collateral_vault.underlying_asset_address
+                      for collateral_vault in collateral_vaults.values()]
+        asset_list.append(vault.underlying_asset_address)
 
-                configured_oracle = create_contract_instance(configured_oracle_address,
-                                                             config.ORACLE_ABI_PATH, config)
+        oracle_adapters = {}
 
-                try:
-                    configured_oracle_name = configured_oracle.functions.name().call()
-                except Exception as ex: # pylint: disable=broad-except
-                    logger.info("PullOracleHandler: Error calling contract for oracle"
-                                " at %s, asset %s: %s", configured_oracle_address, asset, ex)
-                    continue
-                if configured_oracle_name == "PythOracle":
-                    logger.info("PullOracleHandler: Pyth oracle found for vault %s: "
-                                "Address - %s", vault.address, configured_oracle_address)
-                    pyth_feed_ids.add(configured_oracle.functions.feedId().call().hex())
-                elif configured_oracle_name == "CrossAdapter":
-                    pyth_ids = PullOracleHandler.resolve_cross_oracle(
-                        configured_oracle, config)
-                    pyth_feed_ids.update(pyth_ids)
+        for asset in asset_list:
+            (_, _, _, configured_oracle_address) = oracle.functions.resolveOracle(0, asset, unit_of_account).call()
 
-            return list(pyth_feed_ids)
+            configured_oracle = create_contract_instance(configured_oracle_address,
+                                                         config.ORACLE_ABI_PATH, config)
 
-        except Exception as ex: # pylint: disable=broad-except
-            logger.error("PullOracleHandler: Error calling contract: %s", ex, exc_info=True)
+            try:
+                configured_oracle_name = configured_oracle.functions.name().call()
+            except Exception as ex: # pylint: disable=broad-except
+                logger.info("PullOracleHandler: Error calling contract for oracle"
+                            " at %s, asset %s: %s", configured_oracle_address, asset, ex)
+                continue
+            if configured_oracle_name == "CrossAdapter":
+                oracle_adapters.update(PullOracleHandler.resolve_cross_oracle(
+                    configured_oracle, config))
+            else:
+                oracle_adapters[configured_oracle_address] = configured_oracle_name
+
+        return oracle_adapters
 
     @staticmethod
-    def resolve_cross_oracle(cross_oracle, config):
+    def get_pyth_feed_ids(vault, oracle_adapters: Dict[str, str], config: ChainConfig) -> List[str]:
+        """
+        Get the Pyth feed IDs read by the Pyth adapters among the resolved oracle adapters.
+        """
         pyth_feed_ids = set()
+        for adapter_address, adapter_name in oracle_adapters.items():
+            if adapter_name == "PythOracle":
+                logger.info("PullOracleHandler: Pyth oracle found for vault %s: "
+                            "Address - %s", vault.address, adapter_address)
+                adapter = create_contract_instance(adapter_address, config.ORACLE_ABI_PATH, config)
+                pyth_feed_ids.add(adapter.functions.feedId().call().hex())
+        return list(pyth_feed_ids)
 
-        oracle_base_address = cross_oracle.functions.oracleBaseCross().call()
-        oracle_base = create_contract_instance(oracle_base_address, config.ORACLE_ABI_PATH, config)
-        oracle_base_name = oracle_base.functions.name().call()
-
-        if oracle_base_name == "PythOracle":
-            pyth_feed_ids.add(oracle_base.functions.feedId().call().hex())
-        elif oracle_base_name == "CrossAdapter":
-            pyth_ids = PullOracleHandler.resolve_cross_oracle(oracle_base, config)
-            pyth_feed_ids.update(pyth_ids)
+    @staticmethod
+    def resolve_cross_oracle(cross_oracle, config) -> Dict[str, str]:
+        oracle_adapters = {}
 
-        oracle_quote_address = cross_oracle.functions.oracleCrossQuote().call()
-        oracle_quote = create_contract_instance(oracle_quote_address, config.ORACLE_ABI_PATH, config)
-        oracle_quote_name = oracle_quote.functions.name().call()
+        for oracle_address in (cross_oracle.functions.oracleBaseCross().call(),
+                               cross_oracle.functions.oracleCrossQuote().call()):
+            oracle = create_contract_instance(oracle_address, config.ORACLE_ABI_PATH, config)
+            oracle_name = oracle.functions.name().call()
 
-        if oracle_quote_name == "PythOracle":
-            pyth_feed_ids.add(oracle_quote.functions.feedId().call().hex())
-        elif oracle_quote_name == "CrossAdapter":
-            pyth_ids = PullOracleHandler.resolve_cross_oracle(oracle_quote, config)
-            pyth_feed_ids.update(pyth_ids)
-        return pyth_feed_ids
+            if oracle_name == "CrossAdapter":
+                oracle_adapters.update(PullOracleHandler.resolve_cross_oracle(oracle, config))
+            else:
+                oracle_adapters[oracle_address] = oracle_name
+        return oracle_adapters
 
     @staticmethod
-    def get_pyth_update_data(feed_ids):
-        logger.info("PullOracleHandler: Getting update data for feeds: %s", feed_ids)
-        pyth_url = "https://hermes.pyth.network/v2/updates/price/latest?"
-        for feed_id in feed_ids:
-            pyth_url += "ids[]=" + feed_id + "&"
-        pyth_url = pyth_url[:-1]
-
-        api_return_data = make_api_request(pyth_url, {}, {})
-        return "0x" + api_return_data["binary"]["data"][0]
+    def get_pyth_update_data(feed_ids, config: ChainConfig) -> List[str]:
+        """
+        Get Pyth price update data for the feeds, served from the per chain update cache.
+        """
+        return PythUpdateCache.get_instance(config).get_update_data(feed_ids)
 
     @staticmethod
-    def get_pyth_update_fee(update_data, config):
-        logger.info("PullOracleHandler: Getting update fee for data: %s", update_data)
-        pyth = create_contract_instance(config.PYTH, config.PYTH_ABI_PATH, config)
-        return pyth.functions.getUpdateFee([update_data]).call()
+    def get_pyth_update_fee(update_data, config: ChainConfig) -> int:
+        """
+        Get the Pyth update fee for update data, served from the per chain update cache.
+        """
+        return PythUpdateCache.get_instance(config).get_update_fee(update_data)
 
 class EVCListener:
     """
@@ -852,27 +1692,140 @@ class EVCListener:
         self.evc_instance = config.evc
 
         self.scanned_blocks = set()
+        self.backfill = None
+        self.event_topics = [EVC_EVENT_TOPICS[event] for event in config.EVC_LOG_EVENTS]
+        self.scan_lock = threading.Lock()
+        self.running = True
+
+        self.head_follower = HeadFollower(config, self.w3)
+        # (start block, end block, accounts) of recently scanned ranges, to re-evaluate
+        # the accounts of blocks replaced by a reorg
+        self.recent_scans = deque(maxlen=config.REORG_BUFFER_SIZE)
+
+        self.subscriber = None
+        if config.WS_ENABLED and config.WS_URL:
+            self.subscriber = WebSocketSubscriber(
+                config, config.WS_URL,
+                {"address": config.EVC, "topics": [self.event_topics]},
+                on_head=self.on_new_head, on_log=self.on_evc_log,
+                on_connect=self.scan_to_head)
 
     def start_event_monitoring(self) -> None:
         """
         Start monitoring for EVC events.
         Scans from last scanned block stored by account monitor
-        up to the current block number (minus 1 to try to account for reorgs).
+        up to the current block number minus CONFIRMATION_DEPTH, re-scanning blocks
+        replaced by reorgs. With WS_ENABLED, events are pushed through a WebSocket subscription instead,
+        and polling only runs while the subscription is disconnected.
         """
-        while True:
-            try:
-                current_block = self.w3.eth.block_number - 1
+        if self.subscriber is not None:
+            self.subscriber.start()
 
-                if self.account_monitor.latest_block < current_block:
-                    self.scan_block_range_for_account_status_check(
-                        self.account_monitor.latest_block,
-                        current_block)
+        while self.running:
+            try:
+                if self.subscriber is None or not self.subscriber.connected:
+                    self.scan_to_head()
             except Exception as ex: # pylint: disable=broad-except
                 logger.error("EVCListener: Unexpected exception in event monitoring: %s",
                              ex, exc_info=True)
 
             time.sleep(self.config.SCAN_INTERVAL)
 
+    def scan_to_head(self) -> None:
+        """
+        Scan from the last scanned block up to the current block number minus
+        CONFIRMATION_DEPTH. Also fills the blocks missed while the WebSocket subscription
+        was disconnected.
+        """
+        with self.scan_lock:
+            head = self.w3.eth.get_block("latest")
+            self.follow_head(head["number"], Web3.to_hex(head["hash"]),
+                             Web3.to_hex(head["parentHash"]), head.get("baseFeePerGas"))
+            target_block = head["number"] - self.config.CONFIRMATION_DEPTH
+
+            if self.account_monitor.latest_block < target_block:
+                self.scan_block_range_for_account_status_check(
+                    self.account_monitor.latest_block,
+                    target_block)
+
+    def follow_head(self, number: int, block_hash: str, parent_hash: str,
+                    base_fee: Optional[int] = None) -> Optional[int]:
+        """
+        Move the block context to a new head and check the head for reorgs. If blocks were
+        replaced, re-evaluate the accounts found in them and move the scanned block back to
+        the fork so they are scanned again. Must be called with the scan lock held.
+
+        Returns:
+            Optional[int]: The block the scan was moved back to, None without a reorg of
+            scanned blocks.
+        """
+        BlockContext.get_instance(self.config).on_new_head(number, base_fee)
+        fork_block = self.head_follower.update(number, block_hash, parent_hash)
+        if fork_block is None or fork_block > self.account_monitor.latest_block:
+            return None
+
+        affected_accounts = set()
+        for _, end_block, accounts in self.recent_scans:
+            if end_block >= fork_block:
+                affected_accounts.update(accounts)
+
+        logger.warning("EVCListener: Reorg replaced blocks from %s, re-scanning from there "
+                       "and re-evaluating %s accounts", fork_block, len(affected_accounts))
+        self.account_monitor.latest_block = fork_block
+        for address in affected_accounts:
+            if address in self.account_monitor.accounts:
+                self.account_monitor.submit_account_update(address)
+        return fork_block
+
+    def on_new_head(self, header: Dict[str, Any]) -> None:
+        """
+        Handle a newHeads notification. Logs of blocks before the new head have all been
+        received, so the scanned block moves up to the previous block, or CONFIRMATION_DEPTH
+        blocks behind the head if that is further back. If the head reveals a reorg, the
+        replaced blocks are scanned again from the fork up to that block instead.
+        """
+        block_number = int(header["number"], 16)
+        target_block = block_number - max(1, self.config.CONFIRMATION_DEPTH)
+        with self.scan_lock:
+            base_fee = header.get("baseFeePerGas")
+            fork_block = self.follow_head(block_number, header["hash"], header["parentHash"],
+                                          int(base_fee, 16) if base_fee else None)
+            if fork_block is None:
+                self.account_monitor.latest_block = max(self.account_monitor.latest_block,
+                                                        target_block)
+            elif fork_block <= target_block:
+                self.scan_block_range_for_account_status_check(fork_block, target_block)
+
+    def on_evc_log(self, log: Dict[str, Any]) -> None:
+        """
+        Handle an EVC log notification, updating its account on the monitor's executor.
+        Logs removed by a reorg re-evaluate their account if it is tracked.
+        """
+        block_number = int(log["blockNumber"], 16)
+        if log.get("removed"):
+            address = topic_to_address(log["topics"][1])
+            logger.info("EVCListener: EVC log for account %s in block %s removed by reorg",
+                        address, block_number)
+            if address in self.account_monitor.accounts:
+                self.account_monitor.submit_account_update(address)
+            return
+
+        account_events = decode_account_events([log])
+        if account_events:
+            logger.info("EVCListener: Received EVC log for account %s in block %s",
+                        account_events[0][0], block_number)
+            self.recent_scans.append((block_number, block_number, {account_events[0][0]}))
+            self.account_monitor.executor.submit(self.process_account_status_checks,
+                                                 account_events, set())
+
+    def stop(self) -> None:
+        """
+        Stop event monitoring and close the WebSocket subscription.
+        """
+        self.running = False
+        if self.subscriber is not None:
+            self.subscriber.stop()
+
     #pylint: disable=W0102
     def scan_block_range_for_account_status_check(self,
                                                   start_block: int,
@@ -894,40 +1847,10 @@ class EVCListener:
                 logger.info("EVCListener: Scanning blocks %s to %s for AccountStatusCheck events.",
                             start_block, end_block)
 
-                logs = self.evc_instance.events.AccountStatusCheck().get_logs(
-                    fromBlock=start_block,
-                    toBlock=end_block)
-
-                for log in logs:
-                    vault_address = log["args"]["controller"]
-                    account_address = log["args"]["account"]
-
-                    #if we've seen the account already and the status
-                    # check is not due to changing controller
-                    if account_address in seen_accounts:
-                        same_controller = self.account_monitor.accounts.get(
-                            account_address).controller.address == Web3.to_checksum_address(
-                                vault_address)
-
-                        if same_controller:
-                            logger.info("EVCListener: Account %s already seen with "
-                                        "controller %s, skipping", account_address, vault_address)
-                            continue
-                    else:
-                        seen_accounts.add(account_address)
-
-                    logger.info("EVCListener: AccountStatusCheck event found for account %s "
-                                "with controller %s, triggering monitor update.",
-                                account_address, vault_address)
-
-                    try:
-                        self.account_monitor.update_account_on_status_check_event(
-                            account_address,
-                            vault_address)
-                    except Exception as ex: # pylint: disable=broad-except
-                        logger.error("EVCListener: Exception updating account %s "
-                                     "on AccountStatusCheck event: %s",
-                                     account_address, ex, exc_info=True)
+                account_events = self.fetch_account_status_checks(start_block, end_block)
+                self.process_account_status_checks(account_events, seen_accounts)
+                self.recent_scans.append((start_block, end_block,
+                                          {account for account, _ in account_events}))
 
                 logger.info("EVCListener: Finished scanning blocks %s to %s "
                             "for AccountStatusCheck events.", start_block, end_block)
@@ -946,10 +1869,89 @@ class EVCListener:
                     time.sleep(self.config.RETRY_DELAY) # cooldown between retries
 
 
+    def fetch_account_status_checks(self, start_block: int, end_block: int
+                                    ) -> List[Tuple[str, Optional[str]]]:
+        """
+        Get the accounts touched by EVC_LOG_EVENTS events in a block range.
+        Logs are fetched with a single raw eth_getLogs request for all event topics and
+        decoded straight from the topics.
+
+        Args:
+            start_block (int): The starting block number.
+            end_block (int): The ending block number.
+
+        Returns:
+            List[Tuple[str, Optional[str]]]: (account, controller) pairs, one per account,
+            see decode_account_events.
+        """
+        logs = get_raw_logs(self.w3, self.config.EVC, self.event_topics, start_block, end_block)
+        return decode_account_events(logs)
+
+    def fetch_backfill_chunk(self, start_block: int, end_block: int
+                             ) -> Tuple[List[Tuple[str, Optional[str]]], int]:
+        """
+        Get the accounts touched by EVC_LOG_EVENTS events in a block range for the
+        LogBackfill, along with the number of raw logs so the chunk size follows the
+        provider's response size rather than the number of distinct accounts.
+
+        Returns:
+            Tuple[List[Tuple[str, Optional[str]]], int]: (account, controller) pairs as
+            returned by fetch_account_status_checks, and the number of logs fetched.
+        """
+        logs = get_raw_logs(self.w3, self.config.EVC, self.event_topics, start_block, end_block)
+        return decode_account_events(logs), len(logs)
+
+    def process_account_status_checks(self, account_events: List[Tuple[str, Optional[str]]],
+                                      seen_accounts: set) -> None:
+        """
+        Update the accounts of AccountStatusCheck logs, skipping accounts already seen
+        with the same controller.
+
+        Args:
+            account_events (List[Tuple[str, Optional[str]]]): (account, controller) pairs
+                in block order. Accounts without a controller are only re-evaluated if tracked.
+            seen_accounts (set): Accounts already seen, updated in place.
+        """
+        for account_address, vault_address in account_events:
+            if vault_address is None:
+                account = self.account_monitor.accounts.get(account_address)
+                if account is None:
+                    continue
+                vault_address = account.controller.address
+
+            #if we've seen the account already and the status
+            # check is not due to changing controller
+            if account_address in seen_accounts:
+                same_controller = self.account_monitor.accounts.get(
+                    account_address).controller.address == vault_address
+
+                if same_controller:
+                    logger.info("EVCListener: Account %s already seen with "
+                                "controller %s, skipping", account_address, vault_address)
+                    continue
+            else:
+                seen_accounts.add(account_address)
+
+            logger.info("EVCListener: AccountStatusCheck event found for account %s "
+                        "with controller %s, triggering monitor update.",
+                        account_address, vault_address)
+
+            try:
+                self.account_monitor.update_account_on_status_check_event(
+                    account_address,
+                    vault_address)
+            except Exception as ex: # pylint: disable=broad-except
+                logger.error("EVCListener: Exception updating account %s "
+                             "on AccountStatusCheck event: %s",
+                             account_address, ex, exc_info=True)
+
     def batch_account_logs_on_startup(self) -> None:
         """
         Batch process account logs on startup.
-        Goes in reverse order to build smallest queue possible with most up to date info
+        With BACKFILL_REVERSE, goes in reverse order keeping only the latest controller of
+        each account, then evaluates every account once in a batch, to build the smallest
+        queue possible with the most up to date info. Otherwise logs are processed in block
+        order, with progress checkpointed as blocks are applied.
         """
         try:
             # If the account monitor has a saved state,
@@ -959,24 +1961,47 @@ class EVCListener:
 
             current_block = self.w3.eth.block_number
 
-            batch_block_size = self.config.BATCH_SIZE
-
             logger.info("EVCListener: "
                         "Starting batch scan of AccountStatusCheck events from block %s to %s.",
                         start_block, current_block)
 
-            seen_accounts = set()
-
-            while start_block < current_block:
-                end_block = min(start_block + batch_block_size, current_block)
-
-                self.scan_block_range_for_account_status_check(start_block, end_block,
-                                                               seen_accounts=seen_accounts)
+            if self.config.BACKFILL_REVERSE:
+                # account -> controller of its most recent status check
+                latest_controllers: Dict[str, str] = {}
+
+                def collect_controllers(_: int, __: int,
+                                        account_events: List[Tuple[str, Optional[str]]]
+                                        ) -> None:
+                    for account_address, vault_address in reversed(account_events):
+                        account = self.account_monitor.accounts.get(account_address)
+                        if vault_address is None and account is not None:
+                            vault_address = account.controller.address
+                        if vault_address is not None:
+                            latest_controllers.setdefault(account_address, vault_address)
+
+                self.backfill = LogBackfill(self.config, self.fetch_backfill_chunk,
+                                            collect_controllers)
+                self.account_monitor.backfill = self.backfill
+                self.backfill.run(start_block, current_block, reverse=True)
+
+                logger.info("EVCListener: Found %s accounts with status checks, "
+                            "evaluating them in a batch.", len(latest_controllers))
+                self.account_monitor.add_accounts(latest_controllers)
+                self.account_monitor.latest_block = current_block
                 self.account_monitor.save_state()
+            else:
+                seen_accounts = set()
 
-                start_block = end_block + 1
+                def apply_logs(_: int, end_block: int,
+                               account_events: List[Tuple[str, Optional[str]]]) -> None:
+                    self.process_account_status_checks(account_events, seen_accounts)
+                    self.account_monitor.latest_block = end_block
 
-                time.sleep(self.config.BATCH_INTERVAL) # Sleep in between batches to avoid rate limiting
+                self.backfill = LogBackfill(self.config, self.fetch_backfill_chunk,
+                                            apply_logs,
+                                            lambda _: self.account_monitor.save_state())
+                self.account_monitor.backfill = self.backfill
+                self.backfill.run(start_block, current_block)
 
             logger.info("EVCListener: "
                         "Finished batch scan of AccountStatusCheck events from block %s to %s.",
@@ -997,24 +2022,298 @@ class EVCListener:
         subaccount_number = int(int(account, 16) ^ int(owner, 16))
         return owner, subaccount_number
 
-# Future feature, smart monitor to trigger manual update of an account
-# based on a large price change (or some other trigger)
 class SmartUpdateListener:
     """
-    Boiler plate listener class.
-    Intended to be implemented with some other trigger condition to update accounts.
+    Listener class triggering account updates on oracle price moves.
+
+    Keeps a mapping from price sources (Pyth feeds, Chainlink aggregators, Redstone feeds)
+    to the controller vaults whose asset or collaterals are priced from them, and polls the
+    chain for price update logs. When a source moves by more than SMART_UPDATE_MOVE_THRESHOLD,
+    exposed accounts that could fall below HS_SAFE are moved to the front of the update queue,
+    further ahead the larger the move. With PYTH_STREAM_ENABLED, Pyth prices received from the
+    Hermes stream are tracked as well, catching moves before anyone pushes them on chain.
+    With EXPOSURE_ENGINE_ENABLED, exposed accounts are first re-scored locally with fresh
+    oracle quotes and only those under EXPOSURE_HEALTH_MARGIN are queued.
     """
-    def __init__(self, account_monitor: AccountMonitor):
+    def __init__(self, account_monitor: AccountMonitor, config: ChainConfig):
+        self.config = config
+        self.w3 = config.w3
         self.account_monitor = account_monitor
 
+        self.lock = threading.Lock()
+        # price source -> addresses of the controller vaults exposed to it
+        self.exposure: Dict[PriceSource, Set[str]] = {}
+        # oracle adapter address -> price sources the adapter reads from
+        self.adapter_sources: Dict[str, List[PriceSource]] = {}
+        self.log_addresses: List[str] = []
+        self.exposed_controllers = set()
+        self.last_exposure_refresh = 0
+
+        # price source -> price the exposed accounts were last rechecked at
+        self.reference_prices: Dict[PriceSource, int] = {}
+        # price source -> largest relative move since the last trigger
+        self.pending_moves: Dict[PriceSource, float] = {}
+
+        self.exposure_engine = None
+        if config.EXPOSURE_ENGINE_ENABLED:
+            self.exposure_engine = ExposureEngine(config)
+
+        self.last_scanned_block = 0
+        self.running = True
+        self.triggered_updates = 0
+
+        if config.PYTH_STREAM_ENABLED:
+            PythStream.get_instance(config).add_listener(self.on_pyth_price)
+
+    def start_price_monitoring(self) -> None:
+        """
+        Start monitoring price updates.
+        Refreshes the exposure mapping, scans new blocks for price update logs
+        and triggers updates of exposed accounts every SMART_UPDATE_SCAN_INTERVAL.
+        """
+        while self.running:
+            try:
+                self.refresh_exposure()
+                self.sync_exposure_engine()
+                self.scan_price_updates()
+                self.trigger_exposed_updates()
+            except Exception as ex: # pylint: disable=broad-except
+                logger.error("SmartUpdateListener: Unexpected exception in price monitoring: %s",
+                             ex, exc_info=True)
+
+            time.sleep(self.config.SMART_UPDATE_SCAN_INTERVAL)
+
+    def stop(self) -> None:
+        """
+        Stop monitoring price updates.
+        """
+        self.running = False
+
+    def refresh_exposure(self) -> None:
+        """
+        Rebuild the mapping of price sources to exposed controller vaults if the set of
+        controllers changed, or every SMART_UPDATE_REFRESH_INTERVAL to pick up oracle changes.
+        """
+        controllers = {account.controller.address: account.controller
+                       for account in list(self.account_monitor.accounts.values())}
+
+        expired = (time.time() - self.last_exposure_refresh >
+                   self.config.SMART_UPDATE_REFRESH_INTERVAL)
+        if not expired and set(controllers) == self.exposed_controllers:
+            return
+        if expired:
+            self.adapter_sources = {}
+
+        exposure = {}
+        for vault in controllers.values():
+            vault.refresh_pyth_feed_ids()
+            for adapter_address, adapter_name in vault.oracle_adapters.items():
+                for source in self.get_adapter_sources(adapter_address, adapter_name):
+                    exposure.setdefault(source, set()).add(vault.address)
+
+        log_addresses = {get_source_emitter(source) for source in exposure}
+        if None in log_addresses:
+            log_addresses.discard(None)
+            if self.config.PYTH:
+                log_addresses.add(self.config.PYTH)
+
+        with self.lock:
+            self.exposure = exposure
+            self.log_addresses = sorted(log_addresses)
+        self.exposed_controllers = set(controllers)
+        self.last_exposure_refresh = time.time()
+
+        logger.info("SmartUpdateListener: Tracking %s price sources across %s controllers, "
+                    "%s log emitters", len(exposure), len(controllers), len(log_addresses))
+
+    def sync_exposure_engine(self) -> None:
+        """
+        Reload account positions into the exposure engine every EXPOSURE_SYNC_INTERVAL.
+        Accounts added in between are handled without an estimate until the next sync.
+        """
+        if self.exposure_engine is None:
+            return
+        if time.time() - self.exposure_engine.last_sync < self.config.EXPOSURE_SYNC_INTERVAL:
+            return
+
+        accounts = list(self.account_monitor.accounts.values())
+        controllers = list({account.controller.address: account.controller
+                            for account in accounts}.values())
+        self.account_monitor.vault_registry.hydrate(controllers)
+        self.exposure_engine.sync_accounts(accounts)
+
+    def get_adapter_sources(self, adapter_address: str, adapter_name: str) -> List[PriceSource]:
+        """
+        Get the price sources an oracle adapter reads from, resolved once per adapter.
+
+        Args:
+            adapter_address (str): The address of the oracle adapter.
+            adapter_name (str): The name returned by the adapter.
+
+        Returns:
+            List[PriceSource]: Price sources of the adapter, empty if the adapter does not
+            read from a source with update logs (e.g. fixed rate or exchange rate adapters).
+        """
+        if adapter_address in self.adapter_sources:
+            return self.adapter_sources[adapter_address]
+
+        sources = []
+        try:
+            adapter = create_contract_instance(adapter_address,
+                                               self.config.ORACLE_ABI_PATH, self.config)
+            if adapter_name == "PythOracle":
+                sources.append(pyth_source(adapter.functions.feedId().call().hex()))
+            elif adapter_name in ("ChainlinkOracle", "ChainlinkInfrequentOracle"):
+                sources.append(self.get_push_feed_source(adapter.functions.feed().call()))
+            elif adapter_name == "RedstoneCoreOracle":
+                sources.append(redstone_core_source(adapter_address))
+        except Exception as ex: # pylint: disable=broad-except
+            logger.warning("SmartUpdateListener: Unable to resolve price source of %s "
+                           "adapter %s: %s", adapter_name, adapter_address, ex)
+
+        self.adapter_sources[adapter_address] = sources
+        return sources
+
+    def get_push_feed_source(self, feed_address: str) -> PriceSource:
+        """
+        Get the price source of a Chainlink compatible push feed.
+        Chainlink proxies forward to an aggregator emitting AnswerUpdated, Redstone feeds
+        are updated through a price feeds adapter emitting ValueUpdate for all of its feeds.
+        """
+        feed = create_contract_instance(feed_address, self.config.PRICE_FEED_ABI_PATH,
+                                        self.config)
+        try:
+            return chainlink_source(feed.functions.aggregator().call())
+        except Exception: # pylint: disable=broad-except
+            pass
+
+        try:
+            return redstone_source(feed.functions.getPriceFeedAdapter().call(),
+                                   feed.functions.getDataFeedId().call())
+        except Exception: # pylint: disable=broad-except
+            pass
+
+        # Feeds without a proxy emit AnswerUpdated themselves
+        return chainlink_source(feed_address)
+
+    def scan_price_updates(self) -> None:
+        """
+        Scan blocks since the last scan for price update logs of the tracked sources.
+        Scanning starts at the current block, no more than BATCH_SIZE blocks are scanned at once.
+        """
+        with self.lock:
+            log_addresses = self.log_addresses
+        if not log_addresses:
+            return
+
+        current_block = self.w3.eth.block_number
+        if self.last_scanned_block == 0:
+            self.last_scanned_block = current_block
+            return
+        if current_block <= self.last_scanned_block:
+            return
+
+        start_block = max(self.last_scanned_block + 1, current_block - self.config.BATCH_SIZE)
+        logs = self.w3.eth.get_logs({
+            "fromBlock": start_block,
+            "toBlock": current_block,
+            "address": log_addresses,
+            "topics": [PRICE_UPDATE_TOPICS]
+        })
+
+        for log in logs:
+            decoded = decode_price_log(log)
+            if decoded:
+                self.record_price(*decoded)
+
+        self.last_scanned_block = current_block
+
+    def on_pyth_price(self, feed_id: str, price: int) -> None:
+        """
+        Pyth stream listener, records prices received off chain.
+        """
+        self.record_price(pyth_source(feed_id), price)
+
+    def record_price(self, source: PriceSource, price: int) -> None:
+        """
+        Record a new price for a source, flagging the source if it moved by more than
+        SMART_UPDATE_MOVE_THRESHOLD since the last trigger.
+
+        Args:
+            source (PriceSource): The price source.
+            price (int): The new raw price of the source.
+        """
+        with self.lock:
+            if source not in self.exposure:
+                return
+
+            reference_price = self.reference_prices.get(source)
+            if not reference_price:
+                self.reference_prices[source] = price
+                return
+
+            move = abs(price - reference_price) / abs(reference_price)
+            if move >= self.config.SMART_UPDATE_MOVE_THRESHOLD:
+                self.pending_moves[source] = max(self.pending_moves.get(source, 0), move)
+                self.reference_prices[source] = price
+
+    def trigger_exposed_updates(self) -> None:
+        """
+        Move accounts exposed to the flagged price moves to the front of the update queue.
+        Accounts are scheduled SMART_UPDATE_PRIORITY_WEIGHT seconds in the past per unit of
+        relative price move, so accounts hit by the largest moves are checked first.
+
+        Accounts are skipped when their estimated health score stays above
+        EXPOSURE_HEALTH_MARGIN. Without an estimate, or for controllers priced by Pyth whose
+        on chain quotes lag the move, the last known health score bounded by the move is used.
+        """
+        with self.lock:
+            moves, self.pending_moves = self.pending_moves, {}
+            if not moves:
+                return
+
+            controller_moves = {}
+            for source, move in moves.items():
+                for vault_address in self.exposure.get(source, ()):
+                    controller_moves[vault_address] = max(controller_moves.get(vault_address, 0),
+                                                          move)
+
+        health_scores = {}
+        if self.exposure_engine is not None and self.exposure_engine.last_sync:
+            self.exposure_engine.refresh_prices()
+            health_scores = self.exposure_engine.get_health_scores()
+
+        now = time.time()
+        update_times = {}
+        for address, account in list(self.account_monitor.accounts.items()):
+            move = controller_moves.get(account.controller.address)
+            if move is None or account.current_health_score == math.inf:
+                continue
+
+            estimated_health_score = health_scores.get(address, math.nan)
+            if not math.isnan(estimated_health_score) and not account.controller.pyth_feed_ids:
+                if estimated_health_score >= self.config.EXPOSURE_HEALTH_MARGIN:
+                    continue
+            # A relative price move lowers the health score by at most a factor of (1 - move)
+            elif account.current_health_score * (1 - move) >= self.config.HS_SAFE:
+                continue
+
+            update_times[address] = now - move * self.config.SMART_UPDATE_PRIORITY_WEIGHT
+
+        logger.info("SmartUpdateListener: %s price sources moved, triggering update of %s "
+                    "exposed accounts", len(moves), len(update_times))
+
+        self.account_monitor.prioritize_accounts(update_times)
+        self.triggered_updates += len(update_times)
+
     def trigger_manual_update(self, account: Account) -> None:
         """
-        Boilerplate to trigger a manual update for a specific account.
+        Trigger a manual update for a specific account.
 
         Args:
             account (Account): The account to update.
         """
-        self.account_monitor.update_account_liquidity(account)
+        self.account_monitor.update_account_liquidity(account.address)
 
 liquidation_error_slack_cooldown = {}
 
@@ -1024,9 +2323,24 @@ class Liquidator:
     This class provides static methods for simulating liquidations, calculating
     liquidation profits, and executing liquidation transactions. 
     """
+    _collateral_executors = {}
+    _collateral_executors_lock = threading.Lock()
+
     def __init__(self):
         pass
 
+    @staticmethod
+    def get_collateral_executor(config: ChainConfig) -> ThreadPoolExecutor:
+        """
+        Get the per chain executor used to evaluate collaterals concurrently,
+        sized by LIQUIDATION_COLLATERAL_WORKERS.
+        """
+        with Liquidator._collateral_executors_lock:
+            if config.CHAIN_ID not in Liquidator._collateral_executors:
+                Liquidator._collateral_executors[config.CHAIN_ID] = ThreadPoolExecutor(
+                    max_workers=config.LIQUIDATION_COLLATERAL_WORKERS)
+            return Liquidator._collateral_executors[config.CHAIN_ID]
+
     @staticmethod
     def simulate_liquidation(vault: Vault,
                              violator_address: str,
@@ -1034,6 +2348,10 @@ class Liquidator:
         """
         Simulate the liquidation of an account.
         Chooses the maximum profitable liquidation from the available collaterals, if one exists.
+        Collaterals are evaluated concurrently on the shared collateral executor, and those
+        not finished within LIQUIDATION_SIMULATION_DEADLINE seconds of submission, or that
+        ran for more than LIQUIDATION_COLLATERAL_DEADLINE seconds, are left out of the
+        decision. Simulations still queued at the deadline are cancelled.
 
         Args:
             vault (Vault): The vault associated with the account.
@@ -1043,6 +2361,9 @@ class Liquidator:
             Tuple[bool, Optional[Dict[str, Any]]]: A tuple containing a boolean indicating
             if liquidation is profitable, and a dictionary with liquidation details 
             & transaction object if profitable.
+
+        Raises:
+            TimeoutError: If every collateral simulation ran past the deadline.
         """
 
         evc_instance = config.evc
@@ -1060,21 +2381,83 @@ class Liquidator:
         }
         max_profit_params = None
 
-        collateral_vaults = {collateral: Vault(collateral, config) for collateral in collateral_list}
-
-        for collateral, collateral_vault in collateral_vaults.items():
+        if config.PRESCREEN_ENABLED:
+            # Only simulate collaterals whose profit bound covers the gas, most promising first
+            ranked = ProfitPrescreen.get_instance(config).rank_collaterals(
+                vault, violator_address, collateral_list,
+                BlockContext.get_instance(config).get()["gas_price"])
+            collateral_list = [collateral for collateral, _ in ranked]
+            if not collateral_list:
+                logger.info("Liquidator: No collateral of account %s can cover the gas cost "
+                            "of a liquidation", violator_address)
+                return (False, None, None)
+
+        collateral_vaults = VaultRegistry.get_instance(config).get_vaults(collateral_list)
+
+        # Evaluate all collaterals concurrently, bounded by the shared collateral executor.
+        # The account's deadline runs from submission, and each collateral is also limited
+        # to LIQUIDATION_COLLATERAL_DEADLINE seconds from when its simulation starts
+        executor = Liquidator.get_collateral_executor(config)
+        deadline = config.LIQUIDATION_SIMULATION_DEADLINE
+        collateral_deadline = config.LIQUIDATION_COLLATERAL_DEADLINE
+        start_times = {}
+
+        def run_simulation(collateral: str) -> Tuple[Dict[str, Any], Any]:
+            start_times[collateral] = time.monotonic()
+            return Liquidator.calculate_liquidation_profit(vault,
+                                                           violator_address,
+                                                           borrowed_asset,
+                                                           collateral_vaults[collateral],
+                                                           liquidator_contract,
+                                                           config)
+
+        account_deadline = time.monotonic() + deadline
+        futures = {}
+        for collateral in collateral_list:
+            logger.info("Liquidator: Checking liquidation for "
+                        "account %s, borrowed asset %s, collateral asset %s",
+                        violator_address, borrowed_asset, collateral)
+            futures[executor.submit(run_simulation, collateral)] = collateral
+
+        done = set()
+        timed_out = set()
+        pending = set(futures)
+        while pending:
+            now = time.monotonic()
+            if now >= account_deadline:
+                for future in pending:
+                    # Drops simulations still queued, running ones finish in the background
+                    future.cancel()
+                    logger.warning("Liquidator: Simulation for account %s with collateral %s "
+                                   "did not finish within %s seconds, skipping",
+                                   violator_address, futures[future], deadline)
+                timed_out.update(pending)
+                break
+
+            for future in list(pending):
+                started = start_times.get(futures[future])
+                if started is not None and now - started >= collateral_deadline:
+                    pending.discard(future)
+                    timed_out.add(future)
+                    logger.warning("Liquidator: Simulation for account %s with collateral %s "
+                                   "ran for more than %s seconds, skipping",
+                                   violator_address, futures[future], collateral_deadline)
+            next_deadline = min([account_deadline] + [
+                start_times[futures[future]] + collateral_deadline
+                for future in pending if futures[future] in start_times])
+            finished, _ = wait(pending, timeout=max(0, next_deadline - now),
+                               return_when=FIRST_COMPLETED)
+            done.update(finished)
+            pending -= finished
+
+        if timed_out and not done:
+            raise TimeoutError(f"All {len(timed_out)} collateral simulations for account "
+                               f"{violator_address} timed out")
+
+        for future in done:
+            collateral = futures[future]
             try:
-                logger.info("Liquidator: Checking liquidation for "
-                            "account %s, borrowed asset %s, collateral asset %s",
-                            violator_address, borrowed_asset, collateral)
-
-                liquidation_results = Liquidator.calculate_liquidation_profit(vault,
-                                                                      violator_address,
-                                                                      borrowed_asset,
-                                                                      collateral_vault,
-                                                                      liquidator_contract,
-                                                                      config)
-                profit_data, params = liquidation_results
+                profit_data, params = future.result()
 
                 if profit_data["profit"] > max_profit_data["profit"]:
                     max_profit_data = profit_data
@@ -1145,11 +2528,23 @@ class Liquidator:
                         max_repay, seized_collateral_shares)
             return ({"profit": 0}, None)
 
+        swap_amount = int(seized_collateral_assets *.999)
+        quote_cache = QuoteCache.get_instance(config)
+
+        # Skip the swap API if a recent quote for a similar amount could not cover the repay
+        estimated_amount_out = quote_cache.estimate_amount_out(collateral_asset, borrowed_asset,
+                                                               swap_amount)
+        if estimated_amount_out is not None and estimated_amount_out < max_repay:
+            logger.info("Liquidator: Cached quote estimate %s below max repay %s, "
+                        "liquidation not profitable", estimated_amount_out, max_repay)
+            return ({"profit": 0}, None)
+
+        # The swap data of this quote is executed, so it is always requested fresh
         swap_api_response = Quoter.get_swap_api_quote(
             chain_id = config.CHAIN_ID,
             token_in = collateral_asset,
             token_out = borrowed_asset,
-            amount = int(seized_collateral_assets *.999),
+            amount = swap_amount,
             min_amount_out = max_repay,
             receiver = config.SWAPPER,
             vault_in = collateral_vault_address,
@@ -1172,26 +2567,27 @@ class Liquidator:
         leftover_borrow = amount_out - max_repay
 
         if borrowed_asset != config.WETH:
-            borrow_to_eth_response = Quoter.get_swap_api_quote(
-                chain_id = config.CHAIN_ID,
-                token_in = borrowed_asset,
-                token_out = config.WETH,
-                amount = leftover_borrow,
-                min_amount_out = 0,
-                receiver = config.LIQUIDATOR_EOA,
-                vault_in = vault.address,
-                account_in = config.LIQUIDATOR_EOA,
-                account_out = config.LIQUIDATOR_EOA,
-                swapper_mode = "0",
-                slippage = config.SWAP_SLIPPAGE,
-                deadline = int(time.time()) + config.SWAP_DEADLINE,
-                is_repay = False,
-                current_debt = 0,
-                target_debt = 0,
-                skip_sweep_deposit_out = True,
-                config=config
-            )
-            leftover_borrow_in_eth = int(borrow_to_eth_response["amountOut"])
+            leftover_borrow_in_eth = quote_cache.get_amount_out(
+                borrowed_asset, config.WETH, leftover_borrow,
+                lambda: Quoter.get_swap_api_quote(
+                    chain_id = config.CHAIN_ID,
+                    token_in = borrowed_asset,
+                    token_out = config.WETH,
+                    amount = leftover_borrow,
+                    min_amount_out = 0,
+                    receiver = config.LIQUIDATOR_EOA,
+                    vault_in = vault.address,
+                    account_in = config.LIQUIDATOR_EOA,
+                    account_out = config.LIQUIDATOR_EOA,
+                    swapper_mode = "0",
+                    slippage = config.SWAP_SLIPPAGE,
+                    deadline = int(time.time()) + config.SWAP_DEADLINE,
+                    is_repay = False,
+                    current_debt = 0,
+                    target_debt = 0,
+                    skip_sweep_deposit_out = True,
+                    config=config
+                ))
         else:
             leftover_borrow_in_eth = leftover_borrow
 
@@ -1229,20 +2625,24 @@ class Liquidator:
 
         pyth_feed_ids = vault.pyth_feed_ids
 
-        suggested_gas_price = int(config.w3.eth.gas_price * 1.2)
+        # Gas price and gas estimates are shared by all simulations in a block,
+        # the nonce is assigned when the transaction is sent
+        block_context = BlockContext.get_instance(config)
+        context = block_context.get()
+        suggested_gas_price = int(context["gas_price"] * 1.2)
 
         if len(pyth_feed_ids)> 0:
             logger.info("Liquidator: executing with pyth")
-            update_data = PullOracleHandler.get_pyth_update_data(pyth_feed_ids)
+            update_data = PullOracleHandler.get_pyth_update_data(pyth_feed_ids, config)
             update_fee = PullOracleHandler.get_pyth_update_fee(update_data, config)
             liquidation_tx = liquidator_contract.functions.liquidateSingleCollateralWithPythOracle(
-                params, swap_data, [update_data]
+                params, swap_data, update_data
                 ).build_transaction({
                     "chainId": config.CHAIN_ID,
                     "from": config.LIQUIDATOR_EOA,
-                    "nonce": config.w3.eth.get_transaction_count(config.LIQUIDATOR_EOA),
                     "value": update_fee,
-                    "gasPrice": suggested_gas_price
+                    "gasPrice": suggested_gas_price,
+                    "gas": 0
                 })
         else:
             logger.info("Liquidator: executing normally")
@@ -1253,16 +2653,17 @@ class Liquidator:
                     "chainId": config.CHAIN_ID,
                     "gasPrice": suggested_gas_price,
                     "from": config.LIQUIDATOR_EOA,
-                    "nonce": config.w3.eth.get_transaction_count(config.LIQUIDATOR_EOA)
+                    "gas": 0
                 })
+        liquidation_tx["gas"] = block_context.estimate_gas(liquidation_tx)
+
         logger.info("Leftover borrow in eth: %s", leftover_borrow_in_eth)
-        logger.info("Estimated gas: %s", config.w3.eth.estimate_gas(liquidation_tx))
+        logger.info("Estimated gas: %s", liquidation_tx["gas"])
         logger.info("Suggested gas price: %s", suggested_gas_price)
         logger.info("Liquidator: Liquidation params for account %s: %s", violator_address, params)
         logger.info("Liquidator: Liquidation swap_data for account %s: %s", violator_address, swap_data)
 
-        net_profit = leftover_borrow_in_eth - (
-            config.w3.eth.estimate_gas(liquidation_tx) * suggested_gas_price)
+        net_profit = leftover_borrow_in_eth - liquidation_tx["gas"] * suggested_gas_price
 
         logger.info("Net profit: %s", net_profit)
 
@@ -1276,38 +2677,78 @@ class Liquidator:
         }, params)
 
     @staticmethod
-    def execute_liquidation(liquidation_transaction: Dict[str, Any], config: ChainConfig) -> None:
+    def execute_liquidation(liquidation_transaction: Dict[str, Any], config: ChainConfig,
+                            on_complete: Optional[Callable] = None) -> Optional[str]:
         """
-        Execute a liquidation transaction.
+        Send a liquidation transaction from the least busy EOA of the chain's pool.
+        The receipt is awaited by the ReceiptTracker in the background.
 
         Args:
             liquidation_transaction (Dict[str, Any]): The liquidation transaction details.
+            on_complete (Optional[Callable]): Called with the final transaction hash and
+                receipt (None if it was not mined in time) once the transaction is settled.
+
+        Returns:
+            Optional[str]: The transaction hash, or None if sending failed.
         """
+        pool = EOAPool.get_instance(config)
+        signer = pool.acquire()
         try:
             logger.info("Liquidator: Executing liquidation transaction %s...",
                         liquidation_transaction)
 
-            signed_tx = config.w3.eth.account.sign_transaction(liquidation_transaction,
-                                                        config.LIQUIDATOR_EOA_PRIVATE_KEY)
-            tx_hash = config.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            tx_receipt = config.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-
-            liquidator_contract = config.liquidator
-
-            result = liquidator_contract.events.Liquidation().process_receipt(
-                tx_receipt, errors=DISCARD)
-
-            logger.info("Liquidator: Liquidation details: ")
-            for event in result:
-                logger.info("Liquidator: %s", event["args"])
-
-            logger.info("Liquidator: Liquidation transaction executed successfully.")
-            return tx_hash.hex(), tx_receipt
+            tx_hash, transaction = Liquidator.send_liquidation(liquidation_transaction,
+                                                               signer, config)
         except Exception as ex: # pylint: disable=broad-except
+            pool.release(signer)
             message = f"Unexpected error in executing liquidation: {ex}"
             logger.error(message, exc_info=True)
             post_error_notification(message, config)
-            return None, None
+            return None
+
+        ReceiptTracker.get_instance(config).track(PendingLiquidation(
+            tx_hash, transaction, signer, BlockContext.get_instance(config).block_number,
+            on_complete))
+        return tx_hash
+
+    @staticmethod
+    def send_liquidation(liquidation_transaction: Dict[str, Any], signer: LiquidatorSigner,
+                         config: ChainConfig) -> Tuple[str, Dict[str, Any]]:
+        """
+        Sign a liquidation transaction with a pool EOA and a locally assigned nonce, and
+        send it. A nonce too low error resyncs the nonce and retries once.
+
+        Args:
+            liquidation_transaction (Dict[str, Any]): The liquidation transaction details.
+            signer (LiquidatorSigner): The EOA to send from.
+
+        Returns:
+            Tuple[str, Dict[str, Any]]: The transaction hash and the transaction as sent.
+        """
+        for attempt in range(2):
+            nonce = signer.nonces.allocate()
+            transaction = dict(liquidation_transaction, nonce=nonce)
+            transaction["from"] = signer.address
+            signed_tx = config.w3.eth.account.sign_transaction(transaction, signer.private_key)
+            try:
+                tx_hash = send_raw_transaction(config, signed_tx.rawTransaction)
+            except Exception as ex: # pylint: disable=broad-except
+                if is_nonce_too_low(ex):
+                    signer.nonces.discard(nonce)
+                    signer.nonces.resync()
+                    if attempt == 0:
+                        logger.warning("Liquidator: Nonce %s of %s already used, retrying",
+                                       nonce, signer.address)
+                        continue
+                else:
+                    signer.nonces.release(nonce)
+                raise
+
+            signer.nonces.mark_sent(nonce, tx_hash)
+            BlockContext.get_instance(config).invalidate()
+            logger.info("Liquidator: Sent liquidation transaction %s from %s with nonce %s",
+                        tx_hash, signer.address, nonce)
+            return tx_hash, transaction
 
 class Quoter:
     """
@@ -1363,6 +2804,7 @@ class Quoter:
             return None
 
         amount_out = int(response["data"]["amountOut"])
+        QuoteCache.get_instance(config).store(token_in, token_out, amount, amount_out)
 
         if amount_out < min_amount_out:
             logger.error("Quote too low")
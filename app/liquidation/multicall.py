@@ -0,0 +1,50 @@
+"""
+Multicall3 helpers for batching read calls into a single RPC round trip
+"""
+import logging
+
+from typing import List, Optional, Tuple
+
+from .config_loader import ChainConfig
+from .utils import create_contract_instance
+
+logger = logging.getLogger("liquidation_bot")
+
+
+class Multicall:
+    """
+    Thin wrapper around the Multicall3 aggregate3 function.
+    Calls are packed into chunks of MULTICALL_BATCH_SIZE sub-calls, each allowed to fail
+    individually so a revert on one call does not fail the rest of the batch.
+    """
+    def __init__(self, config: ChainConfig):
+        self.config = config
+        self.batch_size = int(config.MULTICALL_BATCH_SIZE)
+        self.instance = create_contract_instance(config.MULTICALL3_ADDRESS,
+                                                 config.MULTICALL3_ABI_PATH, config)
+
+    def aggregate(self, calls: List[Tuple[str, bytes]]) -> List[Optional[Tuple[bool, bytes]]]:
+        """
+        Execute a list of calls through aggregate3.
+
+        Args:
+            calls (List[Tuple[str, bytes]]): List of (target address, calldata) tuples.
+
+        Returns:
+            List[Optional[Tuple[bool, bytes]]]: A (success, return data) tuple per call, in the
+            same order as the input. If the aggregate3 call for a chunk fails as a whole, the
+            entries for that chunk are None so the caller can fall back to individual calls.
+        """
+        results = []
+        for start in range(0, len(calls), self.batch_size):
+            chunk = calls[start:start + self.batch_size]
+            try:
+                chunk_results = self.instance.functions.aggregate3(
+                    [(target, True, call_data) for target, call_data in chunk]).call()
+                results.extend((success, bytes(return_data))
+                               for success, return_data in chunk_results)
+            except Exception as ex: # pylint: disable=broad-except
+                logger.error("Multicall: aggregate3 failed for %s calls: %s",
+                             len(chunk), ex, exc_info=True)
+                results.extend([None] * len(chunk))
+        return results
@@ -0,0 +1,223 @@
+"""
+Local nonce assignment and a pool of liquidator EOAs for concurrent submissions
+"""
+import logging
+import threading
+import time
+
+from typing import Any, Dict, List, Tuple
+
+from .config_loader import ChainConfig
+
+logger = logging.getLogger("liquidation_bot")
+
+# Send errors meaning the nonce was already used on chain
+NONCE_TOO_LOW_MESSAGES = ("nonce too low", "nonce has already been used",
+                          "invalid nonce", "oldnonce")
+
+
+def is_nonce_too_low(ex: Exception) -> bool:
+    """
+    Check if a send error means the transaction's nonce was already used.
+    """
+    message = str(ex).lower()
+    return any(fragment in message for fragment in NONCE_TOO_LOW_MESSAGES)
+
+
+class NonceManager:
+    """
+    Assigns nonces for one EOA locally and in order, so several transactions can be
+    signed and sent without waiting for the previous one to be mined.
+
+    Sent transactions are tracked by nonce, and a replacement for a nonce (e.g. a speed
+    up) takes over its slot. Nonces that were allocated but never sent, and sent ones that
+    are neither mined nor in the node's pending pool after NONCE_RESYNC_INTERVAL seconds,
+    become gaps that are handed out again before any new nonce.
+
+    The local state is resynced with the chain's pending and latest transaction counts
+    every NONCE_RESYNC_INTERVAL seconds and after a nonce too low error.
+    """
+    def __init__(self, config: ChainConfig, address: str):
+        self.config = config
+        self.address = address
+        self.lock = threading.Lock()
+
+        self.next_nonce = None
+        self.gaps: List[int] = []
+        # Nonces handed out whose transaction is not sent yet
+        self.allocated = set()
+        # nonce -> (tx hash, time sent)
+        self.pending: Dict[int, Tuple[str, float]] = {}
+        self.last_sync = 0
+
+        self.resyncs = 0
+        self.gaps_filled = 0
+
+    def allocate(self) -> int:
+        """
+        Get the nonce for the next transaction, reusing the lowest gap first.
+        """
+        with self.lock:
+            if (self.next_nonce is None or
+                time.time() - self.last_sync > self.config.NONCE_RESYNC_INTERVAL):
+                self.sync()
+
+            if self.gaps:
+                self.gaps_filled += 1
+                nonce = self.gaps.pop(0)
+            else:
+                nonce = self.next_nonce
+                self.next_nonce += 1
+            self.allocated.add(nonce)
+            return nonce
+
+    def release(self, nonce: int) -> None:
+        """
+        Return an allocated nonce whose transaction was not sent, so it is reused.
+        """
+        with self.lock:
+            self.allocated.discard(nonce)
+            if nonce not in self.pending and nonce not in self.gaps:
+                self.gaps.append(nonce)
+                self.gaps.sort()
+
+    def discard(self, nonce: int) -> None:
+        """
+        Forget an allocated nonce that turned out to be used already.
+        """
+        with self.lock:
+            self.allocated.discard(nonce)
+
+    def mark_sent(self, nonce: int, tx_hash: str) -> None:
+        """
+        Record a transaction sent with the nonce. A later transaction with the same nonce
+        is a replacement and takes over the slot.
+        """
+        with self.lock:
+            self.allocated.discard(nonce)
+            replaced = self.pending.get(nonce)
+            if replaced is not None and replaced[0] != tx_hash:
+                logger.info("NonceManager: Transaction %s replaces %s with nonce %s for %s",
+                            tx_hash, replaced[0], nonce, self.address)
+            self.pending[nonce] = (tx_hash, time.time())
+
+    def resync(self) -> None:
+        """
+        Resync with the chain, e.g. after a nonce too low error.
+        """
+        with self.lock:
+            self.sync()
+
+    def sync(self) -> None:
+        """
+        Reconcile the local state with the chain's transaction counts.
+        Must be called with the lock held.
+        """
+        w3 = self.config.w3
+        mined = w3.eth.get_transaction_count(self.address, "latest")
+        chain_pending = w3.eth.get_transaction_count(self.address, "pending")
+        now = time.time()
+
+        # Mined or replaced transactions leave the pending set
+        self.pending = {nonce: sent for nonce, sent in self.pending.items() if nonce >= mined}
+        self.gaps = [nonce for nonce in self.gaps if nonce >= mined]
+
+        if self.next_nonce is None or chain_pending > self.next_nonce:
+            # First sync, or nonces were used outside of this manager
+            self.next_nonce = max(chain_pending, self.next_nonce or 0)
+            self.gaps = [nonce for nonce in self.gaps if nonce >= chain_pending]
+        else:
+            # Sent transactions the node no longer knows about were dropped
+            for nonce, (tx_hash, sent_at) in list(self.pending.items()):
+                if nonce >= chain_pending and now - sent_at > self.config.NONCE_RESYNC_INTERVAL:
+                    logger.warning("NonceManager: Transaction %s with nonce %s for %s was "
+                                   "dropped, reusing its nonce", tx_hash, nonce, self.address)
+                    del self.pending[nonce]
+            # Any nonce below the next one that is not pending, being sent or mined is a gap
+            self.gaps = sorted(nonce for nonce in range(mined, self.next_nonce)
+                               if nonce not in self.pending and nonce not in self.allocated and
+                               (nonce >= chain_pending or nonce in self.gaps))
+
+        self.last_sync = now
+        self.resyncs += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get the next nonce, pending transactions and gap counts.
+        """
+        return {
+            "next_nonce": self.next_nonce,
+            "pending": len(self.pending),
+            "gaps": len(self.gaps),
+            "gaps_filled": self.gaps_filled,
+            "resyncs": self.resyncs,
+        }
+
+
+class LiquidatorSigner:
+    """
+    A liquidator EOA with its private key and nonce manager.
+    """
+    def __init__(self, config: ChainConfig, private_key: str):
+        self.private_key = private_key
+        self.address = config.w3.eth.account.from_key(private_key).address
+        self.nonces = NonceManager(config, self.address)
+        self.in_flight = 0
+
+
+class EOAPool:
+    """
+    Per chain pool of liquidator EOAs, built from LIQUIDATOR_PRIVATE_KEY and the comma
+    separated LIQUIDATOR_PRIVATE_KEYS. Each liquidation is signed by the EOA with the
+    fewest transactions in flight, so concurrent liquidations do not queue behind a
+    single nonce.
+    """
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, config: ChainConfig):
+        self.config = config
+        self.lock = threading.Lock()
+
+        private_keys = [config.LIQUIDATOR_EOA_PRIVATE_KEY] + config.LIQUIDATOR_EOA_PRIVATE_KEYS
+        self.signers: List[LiquidatorSigner] = []
+        for private_key in dict.fromkeys(key for key in private_keys if key):
+            self.signers.append(LiquidatorSigner(config, private_key))
+        if not self.signers:
+            raise ValueError("No liquidator private key configured")
+
+        logger.info("EOAPool: Using %s liquidator EOAs: %s", len(self.signers),
+                    [signer.address for signer in self.signers])
+
+    @staticmethod
+    def get_instance(config: ChainConfig) -> "EOAPool":
+        """
+        Get the EOA pool for the chain of the given config.
+        """
+        with EOAPool._instances_lock:
+            if config.CHAIN_ID not in EOAPool._instances:
+                EOAPool._instances[config.CHAIN_ID] = EOAPool(config)
+            return EOAPool._instances[config.CHAIN_ID]
+
+    def acquire(self) -> LiquidatorSigner:
+        """
+        Take the EOA with the fewest transactions in flight.
+        """
+        with self.lock:
+            signer = min(self.signers, key=lambda signer: signer.in_flight)
+            signer.in_flight += 1
+            return signer
+
+    def release(self, signer: LiquidatorSigner) -> None:
+        """
+        Return an EOA once its transaction is confirmed or abandoned.
+        """
+        with self.lock:
+            signer.in_flight -= 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get in flight counts and nonce state per EOA.
+        """
+        return {signer.address: dict(signer.nonces.get_metrics(), in_flight=signer.in_flight)
+                for signer in self.signers}
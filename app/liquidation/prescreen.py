@@ -0,0 +1,177 @@
+"""
+Oracle based upper bound on liquidation profit, used to skip collaterals before quoting swaps
+"""
+import logging
+import threading
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from web3 import Web3
+
+from .config_loader import ChainConfig
+from .contract_registry import ContractRegistry
+from .multicall import Multicall
+
+logger = logging.getLogger("liquidation_bot")
+
+# Scale of LTVs and the max liquidation discount in the EVault config
+CONFIG_SCALE = 10**4
+# Amount of unit of account quoted to get its price in WETH
+PRICE_QUOTE_AMOUNT = 10**18
+
+
+class ProfitPrescreen:
+    """
+    Bounds the profit of liquidating each collateral of an account from a single multicall of
+    accountLiquidityFull, the liquidation LTVs, the max liquidation discount and an oracle
+    quote of the unit of account in WETH.
+
+    The liquidator can repay at most the liability, and receives collateral worth the repaid
+    value divided by (1 - discount), limited by the value of the collateral. The discount is
+    one minus the health score, capped at the vault's max liquidation discount. The bonus
+    is therefore an upper bound on the profit before swap costs, and collaterals whose bound
+    is below PRESCREEN_GAS_LIMIT gas times PRESCREEN_GAS_MARGIN are skipped.
+
+    Accounts that cannot be priced this way, for example because the oracle does not quote
+    WETH or the vault uses Pyth prices, are passed through unscreened.
+    """
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, config: ChainConfig):
+        self.config = config
+        self.multicall = Multicall(config)
+
+        self.screened = 0
+        self.skipped = 0
+        self.unpriced = 0
+
+    @staticmethod
+    def get_instance(config: ChainConfig) -> "ProfitPrescreen":
+        """
+        Get the profit prescreen for the chain of the given config.
+        """
+        with ProfitPrescreen._instances_lock:
+            if config.CHAIN_ID not in ProfitPrescreen._instances:
+                ProfitPrescreen._instances[config.CHAIN_ID] = ProfitPrescreen(config)
+            return ProfitPrescreen._instances[config.CHAIN_ID]
+
+    def rank_collaterals(self, vault: Any, account_address: str, collaterals: List[str],
+                         gas_price: int) -> List[Tuple[str, Optional[int]]]:
+        """
+        Rank the collaterals of an account by their profit bound and drop those that
+        cannot cover the gas cost of a liquidation.
+
+        Args:
+            vault (Vault): The controller vault of the account.
+            account_address (str): The address of the account.
+            collaterals (List[str]): Addresses of the account's collateral vaults.
+            gas_price (int): Gas price to value the liquidation gas cost at.
+
+        Returns:
+            List[Tuple[str, Optional[int]]]: (collateral, profit bound in WETH) of the
+            collaterals worth simulating, highest bound first. Collaterals without a bound
+            come last with None.
+        """
+        bounds = self.get_profit_bounds(vault, account_address, collaterals)
+        if bounds is None:
+            self.unpriced += 1
+            return [(collateral, None) for collateral in collaterals]
+
+        self.screened += 1
+        min_profit = int(gas_price * self.config.PRESCREEN_GAS_LIMIT *
+                         self.config.PRESCREEN_GAS_MARGIN)
+
+        ranked = []
+        for collateral in collaterals:
+            bound = bounds.get(collateral)
+            if bound is not None and bound < min_profit:
+                self.skipped += 1
+                logger.info("ProfitPrescreen: Skipping collateral %s of account %s, profit "
+                            "bound %s below gas cost %s", collateral, account_address,
+                            bound, min_profit)
+                continue
+            ranked.append((collateral, bound))
+
+        ranked.sort(key=lambda item: (item[1] is None, -(item[1] or 0)))
+        return ranked
+
+    def get_profit_bounds(self, vault: Any, account_address: str,
+                          collaterals: List[str]) -> Optional[Dict[str, int]]:
+        """
+        Get the profit bound in WETH of liquidating each collateral of the account.
+
+        Returns:
+            Optional[Dict[str, int]]: Profit bound per collateral address, or None if the
+            account could not be priced.
+        """
+        # Pyth prices are only fresh in a simulation with an update, so on chain values
+        # may understate the discount
+        if vault.pyth_feed_ids:
+            return None
+
+        account_address = Web3.to_checksum_address(account_address)
+        unit_of_account = vault.unit_of_account
+        weth = self.config.WETH
+
+        liquidity_codec = vault.get_codec("accountLiquidityFull")
+        discount_codec = vault.get_codec("maxLiquidationDiscount")
+        ltv_codec = vault.get_codec("LTVLiquidation")
+        quote_codec = ContractRegistry.get_codec(self.config.ORACLE_ABI_PATH, "getQuote")
+
+        calls = [
+            (vault.address, liquidity_codec.encode(account_address, True)),
+            (vault.address, discount_codec.encode()),
+        ] + [(vault.address, ltv_codec.encode(Web3.to_checksum_address(collateral)))
+             for collateral in collaterals]
+        if unit_of_account != weth:
+            calls.append((vault.oracle_address,
+                          quote_codec.encode(PRICE_QUOTE_AMOUNT, unit_of_account, weth)))
+
+        results = self.multicall.aggregate(calls)
+        if any(result is None or not result[0] for result in results):
+            logger.info("ProfitPrescreen: Unable to price account %s, not screening",
+                        account_address)
+            return None
+
+        (liquidity_collaterals, collateral_values, liability_value) = liquidity_codec.decode(
+            results[0][1])
+        (max_discount,) = discount_codec.decode(results[1][1])
+        ltvs = [ltv_codec.decode(data)[0] for _, data in results[2:2 + len(collaterals)]]
+        if unit_of_account != weth:
+            (price,) = quote_codec.decode(results[-1][1])
+        else:
+            price = PRICE_QUOTE_AMOUNT
+
+        if liability_value == 0:
+            return {collateral: 0 for collateral in collaterals}
+
+        # Liquidation discount in CONFIG_SCALE units, 1 - health score capped at the max
+        adjusted_collateral_value = sum(collateral_values)
+        discount = CONFIG_SCALE - adjusted_collateral_value * CONFIG_SCALE // liability_value
+        discount = max(0, min(discount, max_discount, CONFIG_SCALE - 1))
+
+        adjusted_values = {Web3.to_checksum_address(collateral): value for collateral, value
+                           in zip(liquidity_collaterals, collateral_values)}
+        bounds = {}
+        for collateral, ltv in zip(collaterals, ltvs):
+            if discount == 0 or ltv == 0:
+                bounds[collateral] = 0
+                continue
+            collateral_value = adjusted_values.get(Web3.to_checksum_address(collateral), 0)
+            collateral_value = collateral_value * CONFIG_SCALE // ltv
+            max_repay = min(liability_value,
+                            collateral_value * (CONFIG_SCALE - discount) // CONFIG_SCALE)
+            bonus = max_repay * discount // (CONFIG_SCALE - discount)
+            bounds[collateral] = bonus * price // PRICE_QUOTE_AMOUNT
+        return bounds
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get counts of screened accounts, skipped collaterals and accounts passed unscreened.
+        """
+        return {
+            "screened": self.screened,
+            "skipped": self.skipped,
+            "unpriced": self.unpriced,
+        }
@@ -0,0 +1,101 @@
+"""
+Price sources and decoding of oracle price update logs
+"""
+from typing import Any, Dict, Optional, Tuple
+
+from eth_abi import decode
+from web3 import Web3
+
+from .pyth_stream import normalize_feed_id
+
+# A price source is identified by its kind followed by the address of the contract
+# emitting its update logs, plus a feed ID where one emitter serves several feeds
+PriceSource = Tuple[str, ...]
+
+# Chainlink (and compatible) aggregators
+ANSWER_UPDATED_TOPIC = Web3.keccak(text="AnswerUpdated(int256,uint256,uint256)")
+# Redstone push price feed adapters
+VALUE_UPDATE_TOPIC = Web3.keccak(text="ValueUpdate(uint256,bytes32,uint256)")
+# Euler RedstoneCoreOracle adapters
+CACHE_UPDATED_TOPIC = Web3.keccak(text="CacheUpdated(uint256,uint256)")
+# Pyth contract
+PRICE_FEED_UPDATE_TOPIC = Web3.keccak(text="PriceFeedUpdate(bytes32,uint64,int64,uint64)")
+
+PRICE_UPDATE_TOPICS = [Web3.to_hex(topic) for topic in (ANSWER_UPDATED_TOPIC,
+                                                         VALUE_UPDATE_TOPIC,
+                                                         CACHE_UPDATED_TOPIC,
+                                                         PRICE_FEED_UPDATE_TOPIC)]
+
+
+def pyth_source(feed_id: str) -> PriceSource:
+    """
+    Price source of a Pyth feed, all updates are emitted by the chain's Pyth contract.
+    """
+    return ("pyth", normalize_feed_id(feed_id))
+
+
+def chainlink_source(aggregator_address: str) -> PriceSource:
+    """
+    Price source of a Chainlink compatible aggregator emitting AnswerUpdated.
+    """
+    return ("chainlink", Web3.to_checksum_address(aggregator_address))
+
+
+def redstone_source(adapter_address: str, data_feed_id: bytes) -> PriceSource:
+    """
+    Price source of a Redstone push feed, updated through a shared price feeds adapter.
+    """
+    return ("redstone", Web3.to_checksum_address(adapter_address), bytes(data_feed_id).hex())
+
+
+def redstone_core_source(adapter_address: str) -> PriceSource:
+    """
+    Price source of a RedstoneCoreOracle adapter, whose price cache is updated on pull.
+    """
+    return ("redstone_core", Web3.to_checksum_address(adapter_address))
+
+
+def get_source_emitter(source: PriceSource) -> Optional[str]:
+    """
+    Get the address emitting update logs for a price source, None for Pyth feeds
+    which are all emitted by the Pyth contract.
+    """
+    if source[0] == "pyth":
+        return None
+    return source[1]
+
+
+def decode_price_log(log: Dict[str, Any]) -> Optional[Tuple[PriceSource, int]]:
+    """
+    Decode a price update log into its price source and new price.
+
+    Args:
+        log (Dict[str, Any]): Raw log as returned by eth_getLogs.
+
+    Returns:
+        Optional[Tuple[PriceSource, int]]: The price source and the raw price it was updated
+        to, or None if the log is not a known price update.
+    """
+    topics = log["topics"]
+    if not topics:
+        return None
+    topic = bytes(topics[0])
+    address = log["address"]
+
+    if topic == ANSWER_UPDATED_TOPIC:
+        (current,) = decode(["int256"], bytes(topics[1]))
+        return chainlink_source(address), current
+
+    if topic == VALUE_UPDATE_TOPIC:
+        value, data_feed_id, _ = decode(["uint256", "bytes32", "uint256"], bytes(log["data"]))
+        return redstone_source(address, data_feed_id), value
+
+    if topic == CACHE_UPDATED_TOPIC:
+        price, _ = decode(["uint256", "uint256"], bytes(log["data"]))
+        return redstone_core_source(address), price
+
+    if topic == PRICE_FEED_UPDATE_TOPIC:
+        _, price, _ = decode(["uint64", "int64", "uint64"], bytes(log["data"]))
+        return pyth_source(bytes(topics[1]).hex()), price
+
+    return None
@@ -0,0 +1,204 @@
+"""
+Per chain cache of Pyth price update data and update fees
+"""
+import logging
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .config_loader import ChainConfig
+from .pyth_stream import PythStream
+from .utils import SingleFlight, create_contract_instance, make_api_request
+
+logger = logging.getLogger("liquidation_bot")
+
+# Max number of update fees kept in the fee cache
+MAX_CACHED_FEES = 256
+
+
+class PythUpdateCache:
+    """
+    Caches Hermes price update data keyed on the sorted set of feed IDs.
+    When PYTH_STREAM_ENABLED is set, update data is built from the in memory PythStream
+    and the REST path is only used for missing or stale feeds.
+    Entries are fresh for PYTH_UPDATE_TTL seconds, and a fresh entry for a superset of the
+    requested feeds is reused, so a single request for the union of all due feeds can serve
+    every vault. Concurrent requests for the same feeds share a single Hermes request,
+    and update fees are cached by update payload.
+    """
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, config: ChainConfig):
+        self.config = config
+        self.ttl = config.PYTH_UPDATE_TTL
+        self.lock = threading.Lock()
+        self.entries: Dict[Tuple[str, ...], Tuple[float, List[str]]] = {}
+        self.fees: OrderedDict = OrderedDict()
+        self.update_flight = SingleFlight()
+        self.fee_flight = SingleFlight()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_instance(config: ChainConfig) -> "PythUpdateCache":
+        """
+        Get the Pyth update cache for the chain of the given config.
+        """
+        with PythUpdateCache._instances_lock:
+            if config.CHAIN_ID not in PythUpdateCache._instances:
+                PythUpdateCache._instances[config.CHAIN_ID] = PythUpdateCache(config)
+            return PythUpdateCache._instances[config.CHAIN_ID]
+
+    def get_update_data(self, feed_ids: Iterable[str]) -> List[str]:
+        """
+        Get price update data covering all of the given feeds.
+
+        Args:
+            feed_ids (Iterable[str]): Pyth feed IDs to get update data for.
+
+        Returns:
+            List[str]: Hex encoded update data to pass to the Pyth contract.
+        """
+        key = self.get_key(feed_ids)
+        update_data = self.get_cached_update_data(key)
+        if update_data is not None:
+            return update_data
+
+        return self.update_flight.do(key, self.fetch_update_data, key)
+
+    @staticmethod
+    def get_key(feed_ids: Iterable[str]) -> Tuple[str, ...]:
+        """
+        Get the cache key of a set of feed IDs.
+        """
+        return tuple(sorted(set(feed_ids)))
+
+    def get_cached_update_data(self, key: Tuple[str, ...]) -> Optional[List[str]]:
+        """
+        Get update data for the feeds of the key from the stream or the cache,
+        without any network I/O. Returns None if a request to Hermes is needed.
+        """
+        if self.config.PYTH_STREAM_ENABLED:
+            update_data = PythStream.get_instance(self.config).get_update_data(key)
+            if update_data is not None:
+                return update_data
+
+        update_data = self.get_fresh_entry(key)
+        if update_data is not None:
+            self.hits += 1
+            return update_data
+
+        self.misses += 1
+        return None
+
+    def prefetch(self, feed_id_sets: Iterable[Iterable[str]]) -> None:
+        """
+        Fetch update data for the union of several feed ID sets in a single Hermes request,
+        so later lookups for any of the sets are served from the cache.
+
+        Args:
+            feed_id_sets (Iterable[Iterable[str]]): Feed ID sets that are about to be needed.
+        """
+        union = set()
+        for feed_ids in feed_id_sets:
+            union.update(feed_ids)
+        if not union:
+            return
+
+        key = tuple(sorted(union))
+        if (self.config.PYTH_STREAM_ENABLED and
+            PythStream.get_instance(self.config).get_update_data(key) is not None):
+            return
+        if self.get_fresh_entry(key) is None:
+            self.update_flight.do(key, self.fetch_update_data, key)
+
+    def get_fresh_entry(self, key: Tuple[str, ...]):
+        """
+        Return cached update data for the key or any fresh superset of it, None if missing.
+        """
+        now = time.time()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and now - entry[0] < self.ttl:
+                return entry[1]
+
+            requested = set(key)
+            for cached_key, (fetched_at, update_data) in self.entries.items():
+                if now - fetched_at < self.ttl and requested.issubset(cached_key):
+                    return update_data
+        return None
+
+    def fetch_update_data(self, key: Tuple[str, ...]) -> List[str]:
+        """
+        Fetch the latest update data for the feeds from Hermes and store it in the cache.
+        """
+        logger.info("PythUpdateCache: Getting update data for feeds: %s", key)
+        url = f"{self.config.PYTH_HERMES_URL}/v2/updates/price/latest"
+        api_return_data = make_api_request(url, {}, {"ids[]": list(key)})
+        if not api_return_data:
+            raise ValueError(f"Failed to get Pyth update data for feeds {key}")
+
+        update_data = ["0x" + data for data in api_return_data["binary"]["data"]]
+        self.store_update_data(key, update_data)
+        return update_data
+
+    def store_update_data(self, key: Tuple[str, ...], update_data: List[str]) -> None:
+        """
+        Store freshly fetched update data, dropping expired entries.
+        """
+        now = time.time()
+        with self.lock:
+            self.entries = {cached_key: entry for cached_key, entry in self.entries.items()
+                            if now - entry[0] < self.ttl}
+            self.entries[key] = (now, update_data)
+
+    def get_update_fee(self, update_data: List[str]) -> int:
+        """
+        Get the Pyth update fee for the given update data, cached by payload.
+
+        Args:
+            update_data (List[str]): Hex encoded update data.
+
+        Returns:
+            int: The fee to pay for the update.
+        """
+        fee = self.get_cached_update_fee(update_data)
+        if fee is not None:
+            return fee
+
+        fee = self.fee_flight.do(tuple(update_data), self.fetch_update_fee, update_data)
+        self.store_update_fee(update_data, fee)
+        return fee
+
+    def get_cached_update_fee(self, update_data: List[str]) -> Optional[int]:
+        """
+        Get the cached update fee for the update data, None if it is not cached.
+        """
+        key = tuple(update_data)
+        with self.lock:
+            if key in self.fees:
+                self.fees.move_to_end(key)
+                return self.fees[key]
+        return None
+
+    def store_update_fee(self, update_data: List[str], fee: int) -> None:
+        """
+        Store the update fee for the update data, evicting the least recently used fee.
+        """
+        with self.lock:
+            self.fees[tuple(update_data)] = fee
+            if len(self.fees) > MAX_CACHED_FEES:
+                self.fees.popitem(last=False)
+
+    def fetch_update_fee(self, update_data: List[str]) -> int:
+        """
+        Query the Pyth contract for the update fee.
+        """
+        logger.info("PythUpdateCache: Getting update fee for %s update payloads",
+                    len(update_data))
+        pyth = create_contract_instance(self.config.PYTH, self.config.PYTH_ABI_PATH, self.config)
+        return pyth.functions.getUpdateFee(update_data).call()
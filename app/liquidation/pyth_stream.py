@@ -0,0 +1,232 @@
+"""
+Streaming Hermes price update feed kept in memory
+"""
+import json
+import logging
+import threading
+import time
+
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from .config_loader import ChainConfig
+
+logger = logging.getLogger("liquidation_bot")
+
+
+def normalize_feed_id(feed_id: str) -> str:
+    """
+    Normalize a feed ID to the lowercase, unprefixed form used by Hermes.
+    """
+    return feed_id.lower().removeprefix("0x")
+
+
+class PythStream:
+    """
+    Background subscriber to the Hermes server-sent events price update stream.
+    Keeps the latest signed update blob per feed in memory, so update data for a
+    simulation or liquidation can be built without any network I/O.
+    Callers fall back to the REST path when a feed is missing or stale.
+    Price listeners are notified of every new price received.
+    """
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, config: ChainConfig):
+        self.config = config
+        self.url = f"{config.PYTH_HERMES_URL}/v2/updates/price/stream"
+        self.max_age = config.PYTH_STREAM_MAX_AGE
+
+        self.lock = threading.Lock()
+        self.feed_ids = set()
+        # feed id -> (update data, publish time, time received)
+        self.latest: Dict[str, Tuple[str, int, float]] = {}
+        self.listeners: List[Callable[[str, int], None]] = []
+
+        self.running = False
+        self.resubscribe = False
+        self.thread = None
+        self.response = None
+        self.connected = False
+        self.last_message_time = 0
+        self.reconnects = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_instance(config: ChainConfig) -> "PythStream":
+        """
+        Get the Pyth stream for the chain of the given config.
+        """
+        with PythStream._instances_lock:
+            if config.CHAIN_ID not in PythStream._instances:
+                PythStream._instances[config.CHAIN_ID] = PythStream(config)
+            return PythStream._instances[config.CHAIN_ID]
+
+    def add_feed_ids(self, feed_ids: Iterable[str]) -> None:
+        """
+        Add feeds to the subscription, starting the stream if it is not running yet.
+        The stream reconnects to subscribe to the union of all feeds if new ones are added.
+
+        Args:
+            feed_ids (Iterable[str]): Pyth feed IDs to subscribe to.
+        """
+        with self.lock:
+            new_feed_ids = {normalize_feed_id(feed_id) for feed_id in feed_ids} - self.feed_ids
+            if not new_feed_ids:
+                return
+            self.feed_ids.update(new_feed_ids)
+            response = self.response
+
+        logger.info("PythStream: Subscribing to %s new feeds, %s total",
+                    len(new_feed_ids), len(self.feed_ids))
+
+        if not self.running:
+            self.start()
+        elif response is not None:
+            # Closing the response makes the stream thread reconnect with the new feed list
+            self.resubscribe = True
+            response.close()
+
+    def add_listener(self, listener: Callable[[str, int], None]) -> None:
+        """
+        Register a callback called with (feed ID, raw price) for every new price received.
+
+        Args:
+            listener (Callable[[str, int], None]): Callback, called from the stream thread.
+        """
+        self.listeners.append(listener)
+
+    def start(self) -> None:
+        """
+        Start the background stream thread.
+        """
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background stream thread.
+        """
+        self.running = False
+        response = self.response
+        if response is not None:
+            response.close()
+
+    def run(self) -> None:
+        """
+        Keep a connection to the Hermes stream open, reconnecting with backoff on errors.
+        Connections are always at least PYTH_STREAM_RECONNECT_DELAY seconds apart, so a
+        server closing the stream right away does not cause a tight reconnect loop.
+        """
+        min_delay = self.config.PYTH_STREAM_RECONNECT_DELAY
+        backoff_delay = min_delay
+        while self.running:
+            delay = min_delay
+            try:
+                self.consume_stream()
+                backoff_delay = min_delay
+                if self.running and not self.resubscribe:
+                    logger.warning("PythStream: Stream closed by the server, reconnecting in "
+                                   "%s seconds", delay)
+            except Exception as ex: # pylint: disable=broad-except
+                if not self.running:
+                    break
+                if not self.resubscribe:
+                    delay = backoff_delay
+                    backoff_delay = min(backoff_delay * 2,
+                                        self.config.PYTH_STREAM_MAX_RECONNECT_DELAY)
+                    logger.warning("PythStream: Stream error, reconnecting in %s seconds: %s",
+                                   delay, ex)
+            finally:
+                self.connected = False
+                self.response = None
+                self.resubscribe = False
+            if not self.running:
+                break
+            time.sleep(delay)
+            self.reconnects += 1
+
+    def consume_stream(self) -> None:
+        """
+        Open the stream for the current feed list and process events until it is closed.
+        """
+        with self.lock:
+            feed_ids = sorted(self.feed_ids)
+
+        params = {"ids[]": feed_ids, "encoding": "hex", "parsed": "true"}
+        with requests.get(self.url, params=params, stream=True,
+                          timeout=(10, self.config.PYTH_STREAM_MAX_AGE * 3)) as response:
+            response.raise_for_status()
+            self.response = response
+            self.connected = True
+            logger.info("PythStream: Connected to Hermes stream for %s feeds", len(feed_ids))
+
+            for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+                if not self.running:
+                    return
+                if line and line.startswith("data:"):
+                    self.process_message(json.loads(line[len("data:"):]))
+
+    def process_message(self, message: dict) -> None:
+        """
+        Store the update blob of a stream message for every feed it contains.
+
+        Args:
+            message (dict): Decoded Hermes price update event.
+        """
+        update_data = "0x" + message["binary"]["data"][0]
+        now = time.time()
+        prices = []
+        with self.lock:
+            for parsed in message["parsed"]:
+                feed_id = normalize_feed_id(parsed["id"])
+                publish_time = parsed["price"]["publish_time"]
+                current = self.latest.get(feed_id)
+                if current is None or publish_time >= current[1]:
+                    self.latest[feed_id] = (update_data, publish_time, now)
+                    prices.append((feed_id, int(parsed["price"]["price"])))
+        self.last_message_time = now
+
+        for listener in self.listeners:
+            for feed_id, price in prices:
+                try:
+                    listener(feed_id, price)
+                except Exception as ex: # pylint: disable=broad-except
+                    logger.error("PythStream: Price listener failed for feed %s: %s",
+                                 feed_id, ex, exc_info=True)
+
+    def get_update_data(self, feed_ids: Iterable[str]) -> Optional[List[str]]:
+        """
+        Build update data for the feeds from the latest in memory blobs.
+
+        Args:
+            feed_ids (Iterable[str]): Pyth feed IDs to get update data for.
+
+        Returns:
+            Optional[List[str]]: Distinct update blobs covering all feeds,
+            or None if any feed is missing or older than PYTH_STREAM_MAX_AGE.
+        """
+        now = time.time()
+        update_data = []
+        with self.lock:
+            for feed_id in feed_ids:
+                latest = self.latest.get(normalize_feed_id(feed_id))
+                if latest is None or now - latest[2] > self.max_age:
+                    self.misses += 1
+                    return None
+                if latest[0] not in update_data:
+                    update_data.append(latest[0])
+        self.hits += 1
+        return update_data
+
+    def get_stale_feed_ids(self) -> List[str]:
+        """
+        Return subscribed feeds with no update received within PYTH_STREAM_MAX_AGE.
+        """
+        now = time.time()
+        with self.lock:
+            return [feed_id for feed_id in self.feed_ids
+                    if feed_id not in self.latest or now - self.latest[feed_id][2] > self.max_age]
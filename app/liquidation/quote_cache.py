@@ -0,0 +1,145 @@
+"""
+Per chain cache of swap API output amounts, reused across liquidation simulations
+"""
+import logging
+import math
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .config_loader import ChainConfig
+from .utils import SingleFlight
+
+logger = logging.getLogger("liquidation_bot")
+
+
+class QuoteCache:
+    """
+    Caches swap API output amounts keyed on (chain, token in, token out, amount bucket).
+
+    Buckets are QUOTE_CACHE_BUCKET_WIDTH wide in relative terms, so a cached quote is
+    reused for any amount within that distance by scaling its output amount linearly.
+    Entries are fresh for QUOTE_CACHE_TTL seconds, and concurrent requests for the same
+    bucket share a single swap API request.
+
+    Only valuation and pre-screening use the cache, quotes whose swap data is executed
+    are always requested fresh and only feed their output amount into the cache.
+    """
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, config: ChainConfig):
+        self.config = config
+        self.ttl = config.QUOTE_CACHE_TTL
+        self.log_bucket_width = math.log1p(config.QUOTE_CACHE_BUCKET_WIDTH)
+        self.max_entries = config.QUOTE_CACHE_MAX_ENTRIES
+        self.lock = threading.Lock()
+        # key -> (fetched at, amount in, amount out), least recently stored first
+        self.entries: "OrderedDict[Tuple, Tuple[float, int, int]]" = OrderedDict()
+        self.flight = SingleFlight()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_instance(config: ChainConfig) -> "QuoteCache":
+        """
+        Get the quote cache for the chain of the given config.
+        """
+        with QuoteCache._instances_lock:
+            if config.CHAIN_ID not in QuoteCache._instances:
+                QuoteCache._instances[config.CHAIN_ID] = QuoteCache(config)
+            return QuoteCache._instances[config.CHAIN_ID]
+
+    def get_key(self, token_in: str, token_out: str, amount: int) -> Tuple:
+        """
+        Get the cache key of a quote, with the amount reduced to its bucket.
+        """
+        bucket = math.floor(math.log(amount) / self.log_bucket_width)
+        return (self.config.CHAIN_ID, token_in.lower(), token_out.lower(), bucket)
+
+    def get_amount_out(self, token_in: str, token_out: str, amount: int,
+                       fetch: Callable[[], Optional[Dict[str, Any]]]) -> int:
+        """
+        Get the output amount of a swap, scaled from a cached quote in the same amount bucket
+        or fetched with the given function on a miss.
+
+        Args:
+            token_in (str): Address of the token sold.
+            token_out (str): Address of the token bought.
+            amount (int): Amount of token_in sold.
+            fetch (Callable): Function requesting a quote for the amount from the swap API,
+                returning the response data or None on failure.
+
+        Returns:
+            int: Estimated amount of token_out received.
+        """
+        if amount <= 0:
+            return 0
+
+        estimate = self.estimate_amount_out(token_in, token_out, amount)
+        if estimate is not None:
+            return estimate
+
+        key = self.get_key(token_in, token_out, amount)
+        amount_in, amount_out = self.flight.do(key, self.fetch_quote, token_in, token_out,
+                                               amount, fetch)
+        return amount_out * amount // amount_in
+
+    def estimate_amount_out(self, token_in: str, token_out: str, amount: int) -> Optional[int]:
+        """
+        Estimate the output amount of a swap from a fresh cached quote without any
+        network I/O. Returns None if there is no fresh quote in the amount's bucket.
+        """
+        if amount <= 0:
+            return 0 if amount == 0 else None
+
+        if self.config.QUOTE_CACHE_ENABLED:
+            key = self.get_key(token_in, token_out, amount)
+            with self.lock:
+                entry = self.entries.get(key)
+                if entry and time.time() - entry[0] < self.ttl:
+                    self.hits += 1
+                    return entry[2] * amount // entry[1]
+        self.misses += 1
+        return None
+
+    def fetch_quote(self, token_in: str, token_out: str, amount: int,
+                    fetch: Callable[[], Optional[Dict[str, Any]]]) -> Tuple[int, int]:
+        """
+        Request a quote through the fetch function and store its output amount.
+        """
+        response = fetch()
+        if not response:
+            raise ValueError(f"Unable to get quote for {amount} of {token_in} to {token_out}")
+
+        amount_out = int(response["amountOut"])
+        self.store(token_in, token_out, amount, amount_out)
+        return amount, amount_out
+
+    def store(self, token_in: str, token_out: str, amount: int, amount_out: int) -> None:
+        """
+        Store the output amount of a freshly requested quote, evicting the oldest entries.
+        """
+        if amount <= 0 or not self.config.QUOTE_CACHE_ENABLED:
+            return
+
+        key = self.get_key(token_in, token_out, amount)
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = (time.time(), amount, amount_out)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get cache hit and miss counts and the number of swap API requests coalesced.
+        """
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.flight.coalesced,
+        }
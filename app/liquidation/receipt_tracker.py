@@ -0,0 +1,289 @@
+"""
+Background tracking of sent liquidation transactions until they are mined
+"""
+import logging
+import threading
+import time
+
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.logs import DISCARD
+
+from .broadcaster import is_already_known, send_raw_transaction
+from .config_loader import ChainConfig
+from .nonce_manager import EOAPool, LiquidatorSigner
+
+logger = logging.getLogger("liquidation_bot")
+
+
+def batch_rpc_request(url: str, method: str, params_list: List[list]) -> Optional[List[Any]]:
+    """
+    Send one JSON-RPC batch request calling the same method with each of the params.
+
+    Returns:
+        Optional[List[Any]]: The result for each params entry in order, None for failed
+        calls. None instead of a list if the endpoint rejected the batch as a whole, as
+        providers without batch support do.
+    """
+    if not params_list:
+        return []
+    payload = [{"jsonrpc": "2.0", "id": index, "method": method, "params": params}
+               for index, params in enumerate(params_list)]
+    response = requests.post(url, json=payload, timeout=10)
+    response.raise_for_status()
+
+    items = response.json()
+    if not isinstance(items, list):
+        return None
+    results: List[Any] = [None] * len(params_list)
+    for item in items:
+        if "error" not in item:
+            results[item["id"]] = item.get("result")
+    return results
+
+
+class PendingLiquidation:
+    """
+    A sent liquidation transaction and every replacement sent for its nonce.
+    """
+    def __init__(self, tx_hash: str, transaction: Dict[str, Any], signer: LiquidatorSigner,
+                 sent_block: int, on_complete: Optional[Callable] = None):
+        self.tx_hash = tx_hash
+        self.transaction = transaction
+        self.signer = signer
+        self.on_complete = on_complete
+        self.hashes = [tx_hash]
+        self.sent_at = time.time()
+        self.sent_block = sent_block
+        self.last_sent_block = sent_block
+        self.speed_ups = 0
+
+    @property
+    def nonce(self) -> int:
+        return self.transaction["nonce"]
+
+
+class ReceiptTracker:
+    """
+    Watches all pending liquidation transactions of a chain from one background thread,
+    so executor threads return as soon as a transaction is sent.
+
+    Once per new block, the receipts of all pending transaction hashes are requested in a
+    single JSON-RPC batch, or one by one through the chain's web3 provider if RPC_URL does
+    not accept batches. Mined transactions have their Liquidation events logged, their
+    EOA returned to the pool and their completion callback run, which posts the result and
+    re-queues the account. A transaction still pending RECEIPT_SPEED_UP_BLOCKS blocks
+    after it was last sent is replaced with the same nonce and a gas price raised by
+    RECEIPT_SPEED_UP_BUMP, up to RECEIPT_MAX_SPEED_UPS times. Transactions not mined within
+    RECEIPT_TIMEOUT seconds are abandoned.
+    """
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, config: ChainConfig):
+        self.config = config
+        self.condition = threading.Condition()
+        self.pending: Dict[str, PendingLiquidation] = {}
+        self.last_block = 0
+        self.thread = None
+        self.batch_supported = True
+
+        self.confirmed = 0
+        self.reverted = 0
+        self.speed_ups = 0
+        self.timed_out = 0
+
+    @staticmethod
+    def get_instance(config: ChainConfig) -> "ReceiptTracker":
+        """
+        Get the receipt tracker for the chain of the given config.
+        """
+        with ReceiptTracker._instances_lock:
+            if config.CHAIN_ID not in ReceiptTracker._instances:
+                ReceiptTracker._instances[config.CHAIN_ID] = ReceiptTracker(config)
+            return ReceiptTracker._instances[config.CHAIN_ID]
+
+    def track(self, pending: PendingLiquidation) -> None:
+        """
+        Start tracking a sent liquidation transaction.
+        """
+        with self.condition:
+            self.pending[pending.tx_hash] = pending
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+            self.condition.notify()
+
+    def run(self) -> None:
+        """
+        Poll receipts once per new block while transactions are pending.
+        """
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+
+            try:
+                block_number = self.config.w3.eth.block_number
+                if block_number > self.last_block:
+                    self.last_block = block_number
+                    self.poll_receipts(block_number)
+            except Exception as ex: # pylint: disable=broad-except
+                logger.error("ReceiptTracker: Error polling receipts: %s", ex, exc_info=True)
+
+            time.sleep(self.config.RECEIPT_POLL_INTERVAL)
+
+    def poll_receipts(self, block_number: int) -> None:
+        """
+        Request the receipts of all pending hashes in one batch and handle the results.
+        """
+        with self.condition:
+            pending_list = list(self.pending.values())
+
+        hashes = [(pending, tx_hash) for pending in pending_list for tx_hash in pending.hashes]
+        receipts = self.get_receipts([tx_hash for _, tx_hash in hashes])
+
+        mined = {}
+        for (pending, tx_hash), receipt in zip(hashes, receipts):
+            if receipt is not None:
+                mined[pending.tx_hash] = (tx_hash, receipt)
+
+        for pending in pending_list:
+            if pending.tx_hash in mined:
+                self.complete(pending, *mined[pending.tx_hash])
+            elif time.time() - pending.sent_at > self.config.RECEIPT_TIMEOUT:
+                self.abandon(pending)
+            elif (block_number - pending.last_sent_block >= self.config.RECEIPT_SPEED_UP_BLOCKS
+                  and pending.speed_ups < self.config.RECEIPT_MAX_SPEED_UPS):
+                self.speed_up(pending, block_number)
+
+    def get_receipts(self, tx_hashes: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get the raw JSON-RPC receipts of transactions, in one batch request if RPC_URL
+        supports it, else with one request per hash.
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: The receipt of each hash, None if not mined.
+        """
+        if self.batch_supported:
+            receipts = batch_rpc_request(self.config.RPC_URL, "eth_getTransactionReceipt",
+                                         [[tx_hash] for tx_hash in tx_hashes])
+            if receipts is not None:
+                return receipts
+            logger.warning("ReceiptTracker: RPC endpoint rejected a JSON-RPC batch, "
+                           "requesting receipts one by one")
+            self.batch_supported = False
+
+        provider = self.config.w3.provider
+        return [provider.make_request("eth_getTransactionReceipt", [tx_hash]).get("result")
+                for tx_hash in tx_hashes]
+
+    def complete(self, pending: PendingLiquidation, tx_hash: str,
+                 raw_receipt: Dict[str, Any]) -> None:
+        """
+        Handle a mined transaction: log its Liquidation events, return its EOA to the pool
+        and run its completion callback.
+
+        Args:
+            pending (PendingLiquidation): The mined liquidation.
+            tx_hash (str): Hash of the mined transaction, the original or a replacement.
+            raw_receipt (Dict[str, Any]): The JSON-RPC receipt from get_receipts,
+                formatted here the way web3 formats get_transaction_receipt results.
+        """
+        self.finish(pending)
+        receipt = AttributeDict.recursive(receipt_formatter(raw_receipt))
+
+        if receipt["status"] == 1:
+            self.confirmed += 1
+            events = self.config.liquidator.events.Liquidation().process_receipt(
+                receipt, errors=DISCARD)
+            logger.info("ReceiptTracker: Liquidation transaction %s mined in block %s",
+                        tx_hash, receipt["blockNumber"])
+            for event in events:
+                logger.info("ReceiptTracker: %s", event["args"])
+        else:
+            self.reverted += 1
+            logger.error("ReceiptTracker: Liquidation transaction %s reverted in block %s",
+                         tx_hash, receipt["blockNumber"])
+
+        self.run_callback(pending, tx_hash, receipt)
+
+    def abandon(self, pending: PendingLiquidation) -> None:
+        """
+        Stop tracking a transaction that was not mined within RECEIPT_TIMEOUT seconds.
+        Its nonce is reclaimed by the nonce manager if the node dropped it.
+        """
+        self.finish(pending)
+        self.timed_out += 1
+        logger.error("ReceiptTracker: Liquidation transaction %s not mined after %s seconds, "
+                     "no longer tracking it", pending.hashes[-1], self.config.RECEIPT_TIMEOUT)
+        self.run_callback(pending, pending.hashes[-1], None)
+
+    def finish(self, pending: PendingLiquidation) -> None:
+        """
+        Remove a transaction from tracking and return its EOA to the pool.
+        """
+        with self.condition:
+            self.pending.pop(pending.tx_hash, None)
+        EOAPool.get_instance(self.config).release(pending.signer)
+
+    @staticmethod
+    def run_callback(pending: PendingLiquidation, tx_hash: str,
+                     receipt: Optional[Dict[str, Any]]) -> None:
+        """
+        Run the completion callback of a transaction with its final hash and receipt.
+        """
+        if pending.on_complete is None:
+            return
+        try:
+            pending.on_complete(tx_hash, receipt)
+        except Exception as ex: # pylint: disable=broad-except
+            logger.error("ReceiptTracker: Completion callback failed for %s: %s",
+                         tx_hash, ex, exc_info=True)
+
+    def speed_up(self, pending: PendingLiquidation, block_number: int) -> None:
+        """
+        Replace a stuck transaction with the same nonce and a higher gas price.
+        """
+        transaction = dict(pending.transaction)
+        transaction["gasPrice"] = max(
+            int(transaction["gasPrice"] * (1 + self.config.RECEIPT_SPEED_UP_BUMP)),
+            int(self.config.w3.eth.gas_price * 1.2))
+        signed_tx = self.config.w3.eth.account.sign_transaction(transaction,
+                                                                pending.signer.private_key)
+        pending.speed_ups += 1
+        pending.last_sent_block = block_number
+        try:
+            tx_hash = send_raw_transaction(self.config, signed_tx.rawTransaction)
+        except Exception as ex: # pylint: disable=broad-except
+            if is_already_known(ex):
+                return
+            logger.warning("ReceiptTracker: Failed to speed up transaction %s: %s",
+                           pending.hashes[-1], ex)
+            return
+
+        self.speed_ups += 1
+        pending.transaction = transaction
+        pending.hashes.append(tx_hash)
+        pending.signer.nonces.mark_sent(pending.nonce, tx_hash)
+        logger.warning("ReceiptTracker: Transaction %s pending for %s blocks, replaced by %s "
+                       "with gas price %s", pending.hashes[-2],
+                       self.config.RECEIPT_SPEED_UP_BLOCKS, tx_hash, transaction["gasPrice"])
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get counts of pending, confirmed, reverted, sped up and timed out transactions, and
+        whether receipts are polled in batches.
+        """
+        return {
+            "batch": self.batch_supported,
+            "pending": len(self.pending),
+            "confirmed": self.confirmed,
+            "reverted": self.reverted,
+            "speed_ups": self.speed_ups,
+            "timed_out": self.timed_out,
+        }
@@ -47,3 +47,13 @@ def get_all_positions():
         })
 
     return make_response(jsonify(response))
+
+@liquidation.route("/metrics", methods=["GET"])
+def get_metrics():
+    chain_id = int(request.args.get("chainId", 1))  # Default to mainnet if not specified
+
+    if not chain_manager or chain_id not in chain_manager.monitors:
+        return jsonify({"error": f"Monitor not initialized for chain {chain_id}"}), 500
+
+    monitor = chain_manager.monitors[chain_id]
+    return make_response(jsonify(monitor.get_metrics()))
@@ -0,0 +1,328 @@
+"""
+Pool of HTTP RPC endpoints with latency and head based routing and hedged eth_calls
+"""
+import logging
+import threading
+import time
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional
+
+from web3 import Web3
+from web3.providers.base import BaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+logger = logging.getLogger("liquidation_bot")
+
+# Methods that are always sent to the primary endpoint: transaction submission, the
+# pending nonce it depends on, and filters, which live on the node that created them
+PINNED_METHODS = {
+    "eth_sendRawTransaction",
+    "eth_sendTransaction",
+    "eth_getTransactionCount",
+    "eth_newFilter",
+    "eth_newBlockFilter",
+    "eth_getFilterChanges",
+    "eth_getFilterLogs",
+    "eth_uninstallFilter",
+}
+
+# Methods that may be hedged with a duplicate request to a second endpoint
+HEDGED_METHODS = {"eth_call"}
+
+# Methods whose answer is incomplete rather than an error on an endpoint missing the
+# requested blocks, so they are only sent to endpoints known to have them
+BLOCK_BOUND_METHODS = {"eth_getLogs", "eth_getBlockByNumber", "eth_getBlockByHash"}
+
+# Block tags resolved against the current head, "earliest" is served by any endpoint
+BLOCK_TAGS = {"latest", "pending", "safe", "finalized"}
+
+
+class EndpointHealth:
+    """
+    Rolling latency and error samples of one endpoint.
+    """
+    def __init__(self, url: str, index: int, window: int):
+        self.url = url
+        self.index = index
+        self.provider = Web3.HTTPProvider(url)
+        self.latencies = deque(maxlen=window)
+        self.errors = deque(maxlen=window)
+        self.requests = 0
+        self.lock = threading.Lock()
+
+        self.latest_block = 0
+        self.head_checked_at = 0
+        self.probing = False
+
+    def record(self, latency: Optional[float], error: bool) -> None:
+        """
+        Record the outcome of a request, with no latency sample for failed ones.
+        """
+        with self.lock:
+            self.requests += 1
+            self.errors.append(error)
+            if latency is not None:
+                self.latencies.append(latency)
+
+    def record_head(self, number: int) -> None:
+        """
+        Record a block number the endpoint reported as its head.
+        """
+        with self.lock:
+            self.latest_block = max(self.latest_block, number)
+            self.head_checked_at = time.monotonic()
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Get a latency percentile in seconds, 0 if there are no samples yet so new
+        endpoints get tried.
+        """
+        with self.lock:
+            if not self.latencies:
+                return 0.0
+            ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    @property
+    def error_rate(self) -> float:
+        with self.lock:
+            return sum(self.errors) / len(self.errors) if self.errors else 0.0
+
+    def get_name(self) -> str:
+        """
+        Get the host of the endpoint URL, leaving out paths with API keys, numbered by the
+        endpoint's position so URLs on the same host stay apart.
+        """
+        host = self.url.split("://", 1)[-1].split("/", 1)[0].split("?", 1)[0]
+        return f"{host}#{self.index}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "latest_block": self.latest_block,
+            "p50": self.percentile(0.5),
+            "p99": self.percentile(0.99),
+            "error_rate": self.error_rate,
+            "requests": self.requests,
+        }
+
+
+class RPCPoolProvider(BaseProvider):
+    """
+    web3 provider spreading reads over several HTTP endpoints of the same chain.
+
+    Each endpoint keeps its last latency_window latencies and outcomes, and the latest
+    block it reported, checked with an eth_blockNumber probe every head_probe_interval
+    seconds. Reads go to the healthy endpoint with the lowest p50 latency, where healthy
+    means an error rate below max_error_rate, among the endpoints at most max_block_lag
+    blocks behind the highest head seen, and fail over to the next endpoint right away on
+    transport errors. BLOCK_BOUND_METHODS are only sent to endpoints that reported the
+    blocks they ask for, since an endpoint that is behind answers them with missing logs
+    or blocks instead of an error.
+
+    With hedging enabled, an eth_call that has not returned after the endpoint's
+    hedge_percentile latency is duplicated to the second best endpoint, and the first
+    answer wins. Submissions and other PINNED_METHODS always use the first URL.
+    """
+    def __init__(self, urls: List[str], latency_window: int = 200,
+                 max_error_rate: float = 0.2, max_block_lag: int = 1,
+                 head_probe_interval: float = 2, hedge_enabled: bool = True,
+                 hedge_percentile: float = 0.95, hedge_min_delay: float = 0.05):
+        super().__init__()
+        self.endpoints = [EndpointHealth(url, index, latency_window)
+                          for index, url in enumerate(urls)]
+        self.primary = self.endpoints[0]
+        self.max_error_rate = max_error_rate
+        self.max_block_lag = max_block_lag
+        self.head_probe_interval = head_probe_interval
+        self.hedge_enabled = hedge_enabled
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay = hedge_min_delay
+        self.executor = ThreadPoolExecutor(max_workers=4 * len(self.endpoints))
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    @property
+    def endpoint_uri(self) -> str:
+        """
+        URL of the primary endpoint, for code that needs a single URL.
+        """
+        return self.primary.url
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return any(endpoint.provider.is_connected(show_traceback)
+                   for endpoint in self.endpoints)
+
+    @property
+    def head(self) -> int:
+        """
+        Highest block reported by any endpoint.
+        """
+        return max(endpoint.latest_block for endpoint in self.endpoints)
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        if method in PINNED_METHODS:
+            return self.request(self.primary, method, params)
+
+        self.probe_heads()
+        required_block = self.get_required_block(method, params)
+        if self.hedge_enabled and method in HEDGED_METHODS:
+            # Only hedge between endpoints that are not behind
+            current = self.rank_endpoints(required_block, True)
+            if len(current) > 1:
+                return self.hedged_request(current, method, params)
+
+        ranked = self.rank_endpoints(required_block, method in BLOCK_BOUND_METHODS)
+
+        last_error = None
+        for endpoint in ranked:
+            try:
+                return self.request(endpoint, method, params)
+            except Exception as ex: # pylint: disable=broad-except
+                last_error = ex
+                logger.warning("RPCPoolProvider: %s failed on %s, trying next endpoint: %s",
+                               method, endpoint.get_name(), ex)
+        raise last_error
+
+    def get_required_block(self, method: RPCEndpoint, params: Any) -> int:
+        """
+        Get the block an endpoint must have reported to serve a request: the block asked
+        for by BLOCK_BOUND_METHODS and eth_calls at a block number, else the highest head
+        seen minus max_block_lag.
+        """
+        current = self.head - self.max_block_lag
+        if method == "eth_getLogs":
+            log_filter = params[0] if params else {}
+            if "blockHash" in log_filter:
+                return self.head
+            return self.parse_block(log_filter.get("toBlock", "latest"), current)
+        if method == "eth_getBlockByNumber" and params:
+            return self.parse_block(params[0], current)
+        if method == "eth_getBlockByHash":
+            return self.head
+        if method == "eth_call" and len(params) > 1:
+            return self.parse_block(params[1], current)
+        return current
+
+    @staticmethod
+    def parse_block(block: Any, current: int) -> int:
+        """
+        Get the number of a block parameter, with the current block for BLOCK_TAGS and
+        a missing block, and 0 for "earliest".
+        """
+        if block is None or block in BLOCK_TAGS:
+            return current
+        if isinstance(block, int):
+            return block
+        if isinstance(block, str) and block.startswith("0x"):
+            return int(block, 16)
+        return 0
+
+    def rank_endpoints(self, required_block: int = 0,
+                       block_bound: bool = False) -> List[EndpointHealth]:
+        """
+        Order the endpoints that reported the required block by p50 latency, healthy ones
+        first. Endpoints that are behind come last, or are left out for block bound
+        methods. If no endpoint reported the block yet, the one with the highest head is
+        used.
+        """
+        current = [endpoint for endpoint in self.endpoints
+                   if endpoint.latest_block >= required_block]
+        behind = sorted((endpoint for endpoint in self.endpoints
+                         if endpoint.latest_block < required_block),
+                        key=lambda endpoint: -endpoint.latest_block)
+        ranked = sorted(current, key=lambda endpoint: (
+            endpoint.error_rate >= self.max_error_rate, endpoint.percentile(0.5)))
+        if not block_bound:
+            return ranked + behind
+        return ranked or behind[:1]
+
+    def probe_heads(self) -> None:
+        """
+        Ask endpoints whose head was not checked for head_probe_interval seconds for their
+        block number in the background.
+        """
+        now = time.monotonic()
+        for endpoint in self.endpoints:
+            with endpoint.lock:
+                if endpoint.probing or now - endpoint.head_checked_at < self.head_probe_interval:
+                    continue
+                endpoint.probing = True
+                endpoint.head_checked_at = now
+            self.executor.submit(self.probe_head, endpoint)
+
+    def probe_head(self, endpoint: EndpointHealth) -> None:
+        """
+        Request the block number of an endpoint, recorded by request().
+        """
+        try:
+            self.request(endpoint, RPCEndpoint("eth_blockNumber"), [])
+        except Exception as ex: # pylint: disable=broad-except
+            logger.debug("RPCPoolProvider: Head probe failed on %s: %s",
+                         endpoint.get_name(), ex)
+        finally:
+            endpoint.probing = False
+
+    def request(self, endpoint: EndpointHealth, method: RPCEndpoint,
+                params: Any) -> RPCResponse:
+        """
+        Send a request to one endpoint and record its latency, and its head for block
+        number and block requests. JSON-RPC errors such as reverts are valid answers, only
+        transport errors count against the endpoint.
+        """
+        start = time.monotonic()
+        try:
+            response = endpoint.provider.make_request(method, params)
+        except Exception:
+            endpoint.record(None, True)
+            raise
+        endpoint.record(time.monotonic() - start, False)
+
+        result = response.get("result")
+        if method == "eth_blockNumber" and isinstance(result, str):
+            endpoint.record_head(int(result, 16))
+        elif (method in ("eth_getBlockByNumber", "eth_getBlockByHash") and result and
+              result.get("number")):
+            endpoint.record_head(int(result["number"], 16))
+        return response
+
+    def hedged_request(self, ranked: List[EndpointHealth], method: RPCEndpoint,
+                       params: Any) -> RPCResponse:
+        """
+        Send a request to the best endpoint, and a duplicate to the second best if the
+        first has not answered within its hedge percentile latency.
+        """
+        best, second = ranked[0], ranked[1]
+        first = self.executor.submit(self.request, best, method, params)
+        delay = max(best.percentile(self.hedge_percentile), self.hedge_min_delay)
+        done, _ = wait([first], timeout=delay)
+        if done and first.exception() is None:
+            return first.result()
+
+        self.hedged += 1
+        hedge = self.executor.submit(self.request, second, method, params)
+        pending = {first, hedge}
+        last_error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        self.hedge_wins += 1
+                    return future.result()
+                last_error = future.exception()
+        raise last_error
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get latest blocks, latency percentiles and error rates per endpoint, and hedging
+        counts.
+        """
+        return {
+            "head": self.head,
+            "endpoints": {endpoint.get_name(): endpoint.to_dict()
+                          for endpoint in self.endpoints},
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+        }
@@ -0,0 +1,178 @@
+"""
+Account update scheduler with one live entry per account
+"""
+import heapq
+import itertools
+import threading
+import time
+
+from typing import Dict, List, Optional, Tuple
+
+# Rebuild the heap when stale entries outnumber live ones by this factor
+COMPACTION_FACTOR = 2
+# Smoothing factor of the scheduling lateness moving average
+LATENESS_SMOOTHING = 0.1
+
+
+class AccountScheduler:
+    """
+    Min-heap of account update times, keyed on account address.
+
+    Each account has at most one live entry. Rescheduling pushes a new heap entry tagged with
+    a fresh generation number, and entries whose generation no longer matches the account's
+    live one are dropped lazily when they reach the top of the heap, so reschedule is
+    O(log n) and peeking at the next due account never pops and re-pushes entries.
+    """
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.heap: List[Tuple[float, int, str]] = []
+        # address -> (update time, generation, time it was scheduled at) of the live entry
+        self.entries: Dict[str, Tuple[float, int, float]] = {}
+        self.generations = itertools.count()
+
+        self.popped = 0
+        self.stale_dropped = 0
+        self.last_lateness = 0.0
+        self.max_lateness = 0.0
+        self.average_lateness = 0.0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, address: str) -> bool:
+        return address in self.entries
+
+    def reschedule(self, address: str, update_time: float) -> None:
+        """
+        Schedule the next update of an account, replacing any existing entry.
+
+        Args:
+            address (str): The address of the account.
+            update_time (float): Timestamp of the update, -1 removes the account.
+        """
+        if update_time == -1:
+            self.remove(address)
+            return
+
+        with self.lock:
+            current = self.entries.get(address)
+            if current is not None and current[0] == update_time:
+                return
+
+            generation = next(self.generations)
+            self.entries[address] = (update_time, generation, time.time())
+            heapq.heappush(self.heap, (update_time, generation, address))
+
+            if len(self.heap) > COMPACTION_FACTOR * len(self.entries) + 1000:
+                self.compact()
+
+    def remove(self, address: str) -> None:
+        """
+        Remove an account from the schedule. Its heap entry is dropped lazily.
+        """
+        with self.lock:
+            self.entries.pop(address, None)
+
+    def get_scheduled_time(self, address: str) -> Optional[float]:
+        """
+        Get the scheduled update time of an account, None if it is not scheduled.
+        """
+        entry = self.entries.get(address)
+        return entry[0] if entry else None
+
+    def peek(self) -> Optional[Tuple[float, str]]:
+        """
+        Get the next scheduled (time, address) without removing it, None if empty.
+        """
+        with self.lock:
+            self.drop_stale()
+            if not self.heap:
+                return None
+            update_time, _, address = self.heap[0]
+            return update_time, address
+
+    def pop_due(self, now: Optional[float] = None, limit: Optional[int] = None) -> List[str]:
+        """
+        Remove and return the accounts due by the given time, earliest first.
+
+        Args:
+            now (Optional[float]): Timestamp to compare against, defaults to the current time.
+            limit (Optional[int]): Maximum number of accounts to return.
+
+        Returns:
+            List[str]: Addresses of the due accounts.
+        """
+        if now is None:
+            now = time.time()
+
+        due = []
+        with self.lock:
+            while self.heap and (limit is None or len(due) < limit):
+                self.drop_stale()
+                if not self.heap or self.heap[0][0] > now:
+                    break
+                _, _, address = heapq.heappop(self.heap)
+                update_time, _, scheduled_at = self.entries.pop(address)
+                due.append(address)
+                self.record_lateness(now - max(update_time, scheduled_at))
+            self.popped += len(due)
+        return due
+
+    def drop_stale(self) -> None:
+        """
+        Pop outdated entries off the top of the heap. Must be called with the lock held.
+        """
+        while self.heap:
+            update_time, generation, address = self.heap[0]
+            entry = self.entries.get(address)
+            if entry is not None and entry[:2] == (update_time, generation):
+                return
+            heapq.heappop(self.heap)
+            self.stale_dropped += 1
+
+    def compact(self) -> None:
+        """
+        Rebuild the heap from live entries only. Must be called with the lock held.
+        """
+        self.stale_dropped += len(self.heap) - len(self.entries)
+        self.heap = [(update_time, generation, address)
+                     for address, (update_time, generation, _) in self.entries.items()]
+        heapq.heapify(self.heap)
+
+    def record_lateness(self, lateness: float) -> None:
+        """
+        Record how late an update was popped compared to its scheduled time, or to the time
+        it was scheduled at for accounts prioritized with an update time in the past.
+        """
+        lateness = max(lateness, 0.0)
+        self.last_lateness = lateness
+        self.max_lateness = max(self.max_lateness, lateness)
+        self.average_lateness += LATENESS_SMOOTHING * (lateness - self.average_lateness)
+
+    def items(self) -> List[Tuple[float, str]]:
+        """
+        Get all live (time, address) entries, earliest first.
+        """
+        with self.lock:
+            return sorted((update_time, address)
+                          for address, (update_time, _, _) in self.entries.items())
+
+    def get_metrics(self) -> Dict[str, float]:
+        """
+        Get queue depth and scheduling lateness metrics.
+        """
+        now = time.time()
+        with self.lock:
+            due = sum(1 for update_time, _, _ in self.entries.values() if update_time <= now)
+            head = self.peek()
+            return {
+                "depth": len(self.entries),
+                "due": due,
+                "heap_size": len(self.heap),
+                "next_update_in": head[0] - now if head else None,
+                "popped": self.popped,
+                "stale_dropped": self.stale_dropped,
+                "last_lateness": self.last_lateness,
+                "max_lateness": self.max_lateness,
+                "average_lateness": self.average_lateness,
+            }
@@ -0,0 +1,262 @@
+"""
+Append-only journal of account monitor state with periodic snapshot compaction
+"""
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+
+from typing import Any, Dict, Iterator, Optional
+
+from .config_loader import ChainConfig
+
+logger = logging.getLogger("liquidation_bot")
+
+FSYNC_POLICIES = ("always", "interval", "never")
+
+
+class StateJournal:
+    """
+    Persists account monitor state as a snapshot plus a journal of changes since the snapshot.
+
+    Every account change is appended to the journal as one JSON line, so saving costs time
+    proportional to what changed instead of re-serializing every account. Records are full
+    upserts, so replaying them in order over the snapshot rebuilds the latest state, and
+    replaying a record twice is harmless.
+
+    Once the journal holds STATE_COMPACTION_THRESHOLD records, it is compacted in a background
+    thread: the journal is rotated, then the snapshot and the rotated journal are merged into
+    a new snapshot, optionally gzip compressed. Journal writes are flushed to disk according
+    to STATE_JOURNAL_FSYNC: on every record, at most every STATE_JOURNAL_FSYNC_INTERVAL
+    seconds, or only when the OS decides to.
+    """
+    def __init__(self, config: ChainConfig, path: str):
+        if config.STATE_JOURNAL_FSYNC not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown journal fsync policy {config.STATE_JOURNAL_FSYNC}")
+
+        self.config = config
+        self.fsync_policy = config.STATE_JOURNAL_FSYNC
+        self.fsync_interval = config.STATE_JOURNAL_FSYNC_INTERVAL
+        self.compaction_threshold = config.STATE_COMPACTION_THRESHOLD
+        self.compress = config.STATE_SNAPSHOT_COMPRESSION
+
+        base_path = path.removesuffix(".json")
+        self.snapshot_path = base_path + (".snapshot.gz" if self.compress else ".snapshot")
+        self.journal_path = base_path + ".journal"
+        self.compacting_path = self.journal_path + ".compacting"
+
+        self.lock = threading.Lock()
+        self.file = None
+        self.records = 0
+        self.last_fsync = time.time()
+        self.vaults: Dict[str, Any] = {}
+
+        self.compaction_thread: Optional[threading.Thread] = None
+        self.compactions = 0
+
+    def exists(self) -> bool:
+        """
+        Check whether any snapshot or journal was saved.
+        """
+        return any(os.path.exists(path) for path in (self.snapshot_path, self.journal_path,
+                                                     self.compacting_path))
+
+    def open(self) -> None:
+        """
+        Open the journal for appending.
+        """
+        with self.lock:
+            if self.file is None:
+                os.makedirs(os.path.dirname(self.journal_path) or ".", exist_ok=True)
+                self.file = open(self.journal_path, "a", encoding="utf-8")
+                # Terminate a record cut short by a crash, so the next one stays readable
+                if self.file.tell() > 0:
+                    with open(self.journal_path, "rb") as f:
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b"\n":
+                            self.file.write("\n")
+
+    def close(self) -> None:
+        """
+        Flush and close the journal.
+        """
+        with self.lock:
+            if self.file is not None:
+                self.sync()
+                self.file.close()
+                self.file = None
+
+    def record_account(self, address: str, data: Dict[str, Any]) -> None:
+        """
+        Record the latest state of an account.
+        """
+        self.append({"type": "account", "address": address, "data": data})
+
+    def record_vaults(self, vaults: Dict[str, Any]) -> None:
+        """
+        Record the metadata of vaults that are new or changed since they were last recorded.
+        """
+        for address, metadata in vaults.items():
+            if address not in self.vaults or self.vaults[address] != metadata:
+                self.vaults[address] = metadata
+                self.append({"type": "vault", "address": address, "metadata": metadata})
+
+    def record_block(self, block: int) -> None:
+        """
+        Record the last block up to which events were applied to the state.
+        """
+        self.append({"type": "block", "block": block})
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Append a record to the journal, syncing it to disk according to the fsync policy.
+        """
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self.lock:
+            if self.file is None:
+                return
+            self.file.write(line)
+            self.records += 1
+            if (self.fsync_policy == "always" or
+                (self.fsync_policy == "interval" and
+                 time.time() - self.last_fsync >= self.fsync_interval)):
+                self.sync()
+
+    def flush(self) -> None:
+        """
+        Write buffered records to disk, and start a compaction if the journal is large enough.
+        """
+        with self.lock:
+            if self.file is not None:
+                self.sync()
+            compact = self.records >= self.compaction_threshold
+
+        if compact:
+            self.start_compaction()
+
+    def sync(self) -> None:
+        """
+        Flush the journal file, and fsync it unless the policy leaves that to the OS.
+        Must be called with the lock held.
+        """
+        self.file.flush()
+        if self.fsync_policy != "never":
+            os.fsync(self.file.fileno())
+        self.last_fsync = time.time()
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Rebuild the saved state by replaying the journal over the snapshot.
+
+        Returns:
+            Dict[str, Any]: State in the same format as the legacy JSON save file.
+        """
+        state = self.read_snapshot()
+        records = 0
+        for path in (self.compacting_path, self.journal_path):
+            for record in self.read_journal(path):
+                self.apply(state, record)
+                records += 1
+
+        self.vaults = dict(state["vaults"])
+        self.records = records
+        logger.info("StateJournal: Loaded %s accounts from snapshot %s and %s journal records",
+                    len(state["accounts"]), self.snapshot_path, records)
+        return state
+
+    @staticmethod
+    def apply(state: Dict[str, Any], record: Dict[str, Any]) -> None:
+        """
+        Apply a journal record to a state.
+        """
+        if record["type"] == "account":
+            state["accounts"][record["address"]] = record["data"]
+        elif record["type"] == "vault":
+            state["vaults"][record["address"]] = record["metadata"]
+        elif record["type"] == "block":
+            state["last_saved_block"] = max(state["last_saved_block"], record["block"])
+
+    def read_snapshot(self) -> Dict[str, Any]:
+        """
+        Read the snapshot, or an empty state if there is none.
+        """
+        if not os.path.exists(self.snapshot_path):
+            return {"accounts": {}, "vaults": {}, "last_saved_block": 0}
+
+        if self.compress:
+            with gzip.open(self.snapshot_path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        with open(self.snapshot_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def read_journal(path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Read the records of a journal file. A record cut short by a crash is skipped.
+        """
+        if not os.path.exists(path):
+            return
+
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("StateJournal: Skipping truncated record in %s", path)
+
+    def write_snapshot(self, state: Dict[str, Any]) -> None:
+        """
+        Atomically replace the snapshot with the given state.
+        """
+        temp_path = self.snapshot_path + ".tmp"
+        if self.compress:
+            with gzip.open(temp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+                json.dump(state, f, separators=(",", ":"))
+        else:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, separators=(",", ":"))
+
+        with open(temp_path, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
+
+    def start_compaction(self) -> None:
+        """
+        Compact the journal in a background thread, unless a compaction is already running.
+        """
+        if self.compaction_thread is not None and self.compaction_thread.is_alive():
+            return
+        self.compaction_thread = threading.Thread(target=self.compact, daemon=True)
+        self.compaction_thread.start()
+
+    def compact(self) -> None:
+        """
+        Merge the journal into a new snapshot.
+        The journal is rotated first, so records keep being appended while merging.
+        """
+        start_time = time.time()
+        try:
+            with self.lock:
+                if self.file is None:
+                    return
+                # A rotated journal left over by an interrupted compaction is merged first
+                if not os.path.exists(self.compacting_path):
+                    self.sync()
+                    self.file.close()
+                    os.replace(self.journal_path, self.compacting_path)
+                    self.file = open(self.journal_path, "a", encoding="utf-8")
+                    self.records = 0
+
+            state = self.read_snapshot()
+            for record in self.read_journal(self.compacting_path):
+                self.apply(state, record)
+            self.write_snapshot(state)
+            os.remove(self.compacting_path)
+
+            self.compactions += 1
+            logger.info("StateJournal: Compacted %s accounts into %s in %.2f seconds",
+                        len(state["accounts"]), self.snapshot_path, time.time() - start_time)
+        except Exception as ex: # pylint: disable=broad-except
+            logger.error("StateJournal: Failed to compact journal: %s", ex, exc_info=True)
@@ -2,12 +2,14 @@
 Utility functions for the liquidation bot.
 """
 import logging
-import json
 import functools
+import threading
 import time
 import traceback
 import requests
 
+from collections.abc import Hashable
+from concurrent.futures import Future
 from typing import Any, Callable, Dict, Optional
 
 from web3 import Web3
@@ -15,6 +17,7 @@ from web3.contract import Contract
 from urllib.parse import urlencode
 
 from .config_loader import ChainConfig
+from .contract_registry import ContractRegistry
 
 LOGS_PATH = "logs/account_monitor_logs.log"
 
@@ -61,6 +64,7 @@ def setup_logger() -> logging.Logger:
 def create_contract_instance(address: str, abi_path: str, config: ChainConfig) -> Contract:
     """
     Create and return a contract instance.
+    Instances are cached per address and ABI by the ContractRegistry.
 
     Args:
         address (str): The address of the contract.
@@ -69,11 +73,7 @@ def create_contract_instance(address: str, abi_path: str, config: ChainConfig) -
     Returns:
         Contract: Web3 contract instance.
     """
-    with open(abi_path, "r", encoding="utf-8") as file:
-        interface = json.load(file)
-    abi = interface["abi"]
-
-    return config.w3.eth.contract(address=address, abi=abi)
+    return ContractRegistry.get_instance(config.w3).get_contract(address, abi_path)
 
 def retry_request(logger: logging.Logger,
                   max_retries: int = 3,
@@ -110,6 +110,50 @@ def retry_request(logger: logging.Logger,
         return wrapper
     return decorator
 
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into a single execution.
+    Callers arriving while a call for their key is in flight wait for and share its result.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight: Dict[Hashable, Future] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run func(*args, **kwargs) unless a call with the same key is already running,
+        in which case wait for that call and return its result (or raise its exception).
+
+        Args:
+            key (Hashable): Key identifying identical calls.
+            func (Callable): Function to run.
+
+        Returns:
+            Any: The result of the shared call.
+        """
+        with self.lock:
+            future = self.in_flight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                future = Future()
+                self.in_flight[key] = future
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as ex: # pylint: disable=broad-except
+            future.set_exception(ex)
+        finally:
+            with self.lock:
+                del self.in_flight[key]
+        return future.result()
+
 def get_spy_link(account, config: ChainConfig):
     """
     Get account owner from EVC
@@ -144,10 +188,16 @@ def make_api_request(url: str,
     return response.json()
 
 def get_eth_usd_quote(amount: int = 10**18, config: ChainConfig = None):
-    return config.eth_oracle.functions.getQuote(amount, config.MAINNET_ETH_ADDRESS, config.USD).call()
+    (quote,) = ContractRegistry.get_instance(config.mainnet_w3).call(
+        config.MAINNET_ETH_ADAPTER, ContractRegistry.get_codec(config.ORACLE_ABI_PATH, "getQuote"),
+        amount, config.MAINNET_ETH_ADDRESS, config.USD)
+    return quote
 
 def get_btc_usd_quote(amount: int = 10**18, config: ChainConfig = None):
-    return config.btc_oracle.functions.getQuote(amount, config.BTC, config.USD).call()
+    (quote,) = ContractRegistry.get_instance(config.mainnet_w3).call(
+        config.MAINNET_BTC_ADAPTER, ContractRegistry.get_codec(config.ORACLE_ABI_PATH, "getQuote"),
+        amount, config.BTC, config.USD)
+    return quote
 
 
 def global_exception_handler(exctype: type, value: BaseException, tb: Any) -> None:
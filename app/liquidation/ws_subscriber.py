@@ -0,0 +1,151 @@
+"""
+WebSocket JSON-RPC subscriber for new heads and contract logs
+"""
+import itertools
+import json
+import logging
+import threading
+import time
+
+from typing import Any, Callable, Dict, Optional
+
+from websockets.sync.client import connect
+
+from .config_loader import ChainConfig
+
+logger = logging.getLogger("liquidation_bot")
+
+
+class WebSocketSubscriber:
+    """
+    Keeps an eth_subscribe connection open for newHeads and for logs matching a filter,
+    and pushes every notification to callbacks from a background thread.
+
+    The connection is considered lost if no message arrives within WS_MESSAGE_TIMEOUT
+    seconds, and is reopened with exponential backoff. The connect callback runs after
+    every (re)subscription, before any notification is handled, so the owner can fill
+    the blocks missed while disconnected.
+    """
+    def __init__(self, config: ChainConfig, url: str, log_filter: Dict[str, Any],
+                 on_head: Callable[[Dict[str, Any]], None],
+                 on_log: Callable[[Dict[str, Any]], None],
+                 on_connect: Optional[Callable[[], None]] = None):
+        self.config = config
+        self.url = url
+        self.log_filter = log_filter
+        self.on_head = on_head
+        self.on_log = on_log
+        self.on_connect = on_connect
+
+        self.request_ids = itertools.count(1)
+        self.subscriptions: Dict[str, str] = {}
+        self.running = False
+        self.connected = False
+        self.thread = None
+        self.websocket = None
+
+        self.last_message_time = 0
+        self.reconnects = 0
+        self.heads = 0
+        self.logs = 0
+
+    def start(self) -> None:
+        """
+        Start the background subscription thread.
+        """
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background subscription thread.
+        """
+        self.running = False
+        websocket = self.websocket
+        if websocket is not None:
+            websocket.close()
+
+    def run(self) -> None:
+        """
+        Keep the subscriptions open, reconnecting with backoff on errors.
+        """
+        reconnect_delay = self.config.WS_RECONNECT_DELAY
+        while self.running:
+            try:
+                self.consume()
+            except Exception as ex: # pylint: disable=broad-except
+                if not self.running:
+                    break
+                logger.warning("WebSocketSubscriber: Connection error, reconnecting in %s "
+                               "seconds: %s", reconnect_delay, ex)
+            finally:
+                self.connected = False
+                self.websocket = None
+
+            if not self.running:
+                break
+            time.sleep(reconnect_delay)
+            # Only back off further if the last connection did not get to subscribe
+            if self.last_message_time < time.time() - reconnect_delay - 1:
+                reconnect_delay = min(reconnect_delay * 2, self.config.WS_MAX_RECONNECT_DELAY)
+            else:
+                reconnect_delay = self.config.WS_RECONNECT_DELAY
+            self.reconnects += 1
+
+    def consume(self) -> None:
+        """
+        Open the connection, subscribe and handle notifications until it is closed.
+        """
+        with connect(self.url, open_timeout=10, max_size=2**24) as websocket:
+            self.websocket = websocket
+            self.subscriptions = {
+                self.subscribe(websocket, ["newHeads"]): "newHeads",
+                self.subscribe(websocket, ["logs", self.log_filter]): "logs",
+            }
+            self.connected = True
+            self.last_message_time = time.time()
+            logger.info("WebSocketSubscriber: Subscribed to newHeads and logs")
+
+            if self.on_connect is not None:
+                self.on_connect()
+
+            while self.running:
+                message = json.loads(websocket.recv(timeout=self.config.WS_MESSAGE_TIMEOUT))
+                self.last_message_time = time.time()
+                self.handle_message(message)
+
+    def subscribe(self, websocket, params: list) -> str:
+        """
+        Send an eth_subscribe request and wait for its subscription ID.
+        """
+        request_id = next(self.request_ids)
+        websocket.send(json.dumps({"jsonrpc": "2.0", "id": request_id,
+                                   "method": "eth_subscribe", "params": params}))
+        while True:
+            response = json.loads(websocket.recv(timeout=self.config.WS_MESSAGE_TIMEOUT))
+            if response.get("id") != request_id:
+                continue
+            if "error" in response:
+                raise ValueError(f"eth_subscribe {params[0]} failed: {response["error"]}")
+            return response["result"]
+
+    def handle_message(self, message: Dict[str, Any]) -> None:
+        """
+        Dispatch a subscription notification to the head or log callback.
+        """
+        if message.get("method") != "eth_subscription":
+            return
+        params = message["params"]
+        kind = self.subscriptions.get(params["subscription"])
+
+        try:
+            if kind == "newHeads":
+                self.heads += 1
+                self.on_head(params["result"])
+            elif kind == "logs":
+                self.logs += 1
+                self.on_log(params["result"])
+        except Exception as ex: # pylint: disable=broad-except
+            logger.error("WebSocketSubscriber: Failed to handle %s notification: %s",
+                         kind, ex, exc_info=True)
@@ -0,0 +1,98 @@
+"""
+Test of the fan-out Broadcaster against several local JSON-RPC stub endpoints.
+One stub is fast, one is slow, one answers "already known" and one rejects the
+transaction, to check that the first acceptance is returned without waiting for the
+slow endpoint, that "already known" counts as accepted and that latencies are recorded.
+
+Run from the repository root:
+    python test/broadcast_test.py
+"""
+import json
+import threading
+import time
+import types
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from web3 import Web3
+
+from app.liquidation.broadcaster import Broadcaster
+
+RAW_TRANSACTION = bytes.fromhex("f86c0a8502540be400825208") + bytes(40)
+TX_HASH = Web3.to_hex(Web3.keccak(RAW_TRANSACTION))
+
+def make_stub(delay, error=None):
+    """
+    Start a stub endpoint answering eth_sendRawTransaction after a delay,
+    with the given error or the transaction hash.
+    """
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            received.append(request)
+            time.sleep(delay)
+            response = {"jsonrpc": "2.0", "id": request["id"]}
+            if error:
+                response["error"] = {"code": -32000, "message": error}
+            else:
+                response["result"] = TX_HASH
+            body = json.dumps(response).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}", received
+
+fast, fast_received = make_stub(0.05)
+slow, slow_received = make_stub(1.0)
+known, _ = make_stub(0.01, "already known")
+rejecting, _ = make_stub(0.02, "insufficient funds for gas * price + value")
+
+config = types.SimpleNamespace(BROADCAST_TIMEOUT=5)
+broadcaster = Broadcaster(config, [slow, rejecting, fast, known])
+
+# "already known" answers first and counts as accepted
+start = time.monotonic()
+assert broadcaster.send_raw_transaction(RAW_TRANSACTION) == TX_HASH
+elapsed = time.monotonic() - start
+assert elapsed < 0.5, elapsed
+time.sleep(1.2)
+
+metrics = broadcaster.get_metrics()
+assert metrics[broadcaster.get_endpoint_name(known)]["first"] == 1, metrics
+assert metrics[broadcaster.get_endpoint_name(rejecting)]["errors"] == 1, metrics
+assert metrics[broadcaster.get_endpoint_name(slow)]["last_latency"] >= 1.0, metrics
+assert fast_received[0]["params"] == [Web3.to_hex(RAW_TRANSACTION)]
+assert len(slow_received) == 1
+
+# Without the "already known" endpoint the fast one wins
+broadcaster = Broadcaster(config, [slow, rejecting, fast])
+assert broadcaster.send_raw_transaction(RAW_TRANSACTION) == TX_HASH
+assert broadcaster.get_metrics()[broadcaster.get_endpoint_name(fast)]["first"] == 1
+
+# If every endpoint rejects, the error is raised
+broadcaster = Broadcaster(config, [rejecting])
+try:
+    broadcaster.send_raw_transaction(RAW_TRANSACTION)
+    raise AssertionError("expected the rejection to be raised")
+except ValueError as ex:
+    assert "insufficient funds" in str(ex), ex
+
+# Endpoints on the same host with different API keys are reported separately
+broadcaster = Broadcaster(config, [f"{fast}/key-a", f"{fast}/key-b"])
+broadcaster.send_raw_transaction(RAW_TRANSACTION)
+time.sleep(0.2)
+assert len(broadcaster.get_metrics()) == 2, broadcaster.get_metrics()
+
+print(f"first acceptance after {elapsed * 1000:.0f} ms")
+for endpoint, stats in metrics.items():
+    print(f"{endpoint:<22}{stats}")
+print("OK")
@@ -0,0 +1,104 @@
+"""
+Microbenchmark of web3 contract calls vs ContractRegistry precompiled codecs.
+Uses a stub provider that returns canned eth_call results, so only the
+client side CPU cost of encoding, function resolution and decoding is measured.
+
+Run from the repository root:
+    python test/contract_codec_benchmark.py
+"""
+import time
+
+from eth_abi import encode
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+from app.liquidation.contract_registry import ContractRegistry, load_abi
+
+EVAULT_ABI_PATH = "contracts/EVault.json"
+ORACLE_ABI_PATH = "contracts/IOracle.json"
+
+VAULT = Web3.to_checksum_address("0xce45ef0414de3516caf1bcf937bf7f2cf67873de")
+ACCOUNT = Web3.to_checksum_address("0xa5f0f68dcc5be108126d79ded881ef2993841c2f")
+COLLATERAL = Web3.to_checksum_address("0x631d8e808f2c4177a8147eaa39a4f57c47634de8")
+USD = "0x0000000000000000000000000000000000000348"
+
+ITERATIONS = 2000
+
+class StubProvider(BaseProvider):
+    """
+    Provider returning a fixed eth_call result per function selector.
+    """
+    def __init__(self, results):
+        super().__init__()
+        self.results = results
+
+    def make_request(self, method, params):
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+        selector = params[0]["data"][:10]
+        return {"jsonrpc": "2.0", "id": 1, "result": self.results[selector]}
+
+    def is_connected(self, show_traceback=False):
+        return True
+
+def hex_result(types, values):
+    return "0x" + encode(types, values).hex()
+
+registry_codecs = {
+    "balanceOf": ContractRegistry.get_codec(EVAULT_ABI_PATH, "balanceOf"),
+    "accountLiquidity": ContractRegistry.get_codec(EVAULT_ABI_PATH, "accountLiquidity"),
+    "checkLiquidation": ContractRegistry.get_codec(EVAULT_ABI_PATH, "checkLiquidation"),
+    "convertToAssets": ContractRegistry.get_codec(EVAULT_ABI_PATH, "convertToAssets"),
+    "getQuote": ContractRegistry.get_codec(ORACLE_ABI_PATH, "getQuote"),
+}
+
+w3 = Web3(StubProvider({
+    "0x" + registry_codecs["balanceOf"].selector.hex(): hex_result(["uint256"], [10**18]),
+    "0x" + registry_codecs["accountLiquidity"].selector.hex(): hex_result(
+        ["uint256", "uint256"], [11 * 10**17, 10**18]),
+    "0x" + registry_codecs["checkLiquidation"].selector.hex(): hex_result(
+        ["uint256", "uint256"], [5 * 10**17, 6 * 10**17]),
+    "0x" + registry_codecs["convertToAssets"].selector.hex(): hex_result(["uint256"], [10**18]),
+    "0x" + registry_codecs["getQuote"].selector.hex(): hex_result(["uint256"], [3000 * 10**18]),
+}))
+
+contract_registry = ContractRegistry.get_instance(w3)
+vault = w3.eth.contract(address=VAULT, abi=load_abi(EVAULT_ABI_PATH))
+oracle = w3.eth.contract(address=VAULT, abi=load_abi(ORACLE_ABI_PATH))
+
+cases = {
+    "balanceOf": (
+        lambda: vault.functions.balanceOf(ACCOUNT).call(),
+        lambda: contract_registry.call(VAULT, registry_codecs["balanceOf"], ACCOUNT)),
+    "accountLiquidity": (
+        lambda: vault.functions.accountLiquidity(ACCOUNT, True).call(),
+        lambda: contract_registry.call(VAULT, registry_codecs["accountLiquidity"], ACCOUNT, True)),
+    "checkLiquidation": (
+        lambda: vault.functions.checkLiquidation(ACCOUNT, ACCOUNT, COLLATERAL).call(),
+        lambda: contract_registry.call(VAULT, registry_codecs["checkLiquidation"],
+                                       ACCOUNT, ACCOUNT, COLLATERAL)),
+    "convertToAssets": (
+        lambda: vault.functions.convertToAssets(10**18).call(),
+        lambda: contract_registry.call(VAULT, registry_codecs["convertToAssets"], 10**18)),
+    "getQuote": (
+        lambda: oracle.functions.getQuote(10**18, COLLATERAL, USD).call(),
+        lambda: contract_registry.call(VAULT, registry_codecs["getQuote"],
+                                       10**18, COLLATERAL, USD)),
+}
+
+def per_call_us(function):
+    function()
+    start = time.process_time()
+    for _ in range(ITERATIONS):
+        function()
+    return (time.process_time() - start) / ITERATIONS * 10**6
+
+print(f"{"function":<18}{"web3 (us)":>12}{"codec (us)":>12}{"saved (us)":>12}")
+for name, (web3_call, codec_call) in cases.items():
+    web3_result = web3_call()
+    web3_result = tuple(web3_result) if isinstance(web3_result, list) else (web3_result,)
+    assert web3_result == codec_call(), f"{name}: results differ"
+
+    web3_time = per_call_us(web3_call)
+    codec_time = per_call_us(codec_call)
+    print(f"{name:<18}{web3_time:>12.1f}{codec_time:>12.1f}{web3_time - codec_time:>12.1f}")
@@ -0,0 +1,94 @@
+"""
+Benchmark of web3 AccountStatusCheck log decoding vs raw eth_getLogs with topic decoding.
+Uses a stub provider returning a canned eth_getLogs result, so only the client side CPU
+cost of filter building, log formatting, decoding and address checksumming is measured.
+
+Run from the repository root:
+    python test/evc_log_benchmark.py
+"""
+import random
+import time
+
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+from app.liquidation.contract_registry import load_abi
+from app.liquidation.evc_logs import (ACCOUNT_STATUS_CHECK_TOPIC, decode_account_events,
+                                      get_raw_logs, topic_to_address)
+
+EVC_ABI_PATH = "contracts/EthereumVaultConnector.json"
+EVC = Web3.to_checksum_address("0x0c9a3dd6b8f28529d72d7f9ce918d493519ee383")
+
+NUM_LOGS = 20000
+NUM_ACCOUNTS = 2000
+NUM_VAULTS = 50
+ITERATIONS = 5
+
+def random_topic():
+    return "0x" + "00" * 12 + random.randbytes(20).hex()
+
+class StubProvider(BaseProvider):
+    """
+    Provider returning a fixed list of logs for every eth_getLogs request.
+    """
+    def __init__(self, logs):
+        super().__init__()
+        self.logs = logs
+
+    def make_request(self, method, params):
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+        return {"jsonrpc": "2.0", "id": 1, "result": self.logs}
+
+    def is_connected(self, show_traceback=False):
+        return True
+
+random.seed(1)
+accounts = [random_topic() for _ in range(NUM_ACCOUNTS)]
+vaults = [random_topic() for _ in range(NUM_VAULTS)]
+logs = [{
+    "address": EVC.lower(),
+    "topics": [ACCOUNT_STATUS_CHECK_TOPIC, random.choice(accounts), random.choice(vaults)],
+    "data": "0x",
+    "blockNumber": hex(1000 + i // 10),
+    "transactionHash": "0x" + random.randbytes(32).hex(),
+    "transactionIndex": hex(i % 10),
+    "blockHash": "0x" + random.randbytes(32).hex(),
+    "logIndex": hex(i % 10),
+    "removed": False,
+} for i in range(NUM_LOGS)]
+
+w3 = Web3(StubProvider(logs))
+evc = w3.eth.contract(address=EVC, abi=load_abi(EVC_ABI_PATH))
+
+def web3_decode():
+    events = evc.events.AccountStatusCheck().get_logs(fromBlock=1000, toBlock=3000)
+    return [(Web3.to_checksum_address(event["args"]["account"]),
+             Web3.to_checksum_address(event["args"]["controller"])) for event in events]
+
+def raw_decode():
+    return decode_account_events(get_raw_logs(w3, EVC, [ACCOUNT_STATUS_CHECK_TOPIC], 1000, 3000))
+
+def per_log_us(function):
+    start = time.process_time()
+    for _ in range(ITERATIONS):
+        function()
+    return (time.process_time() - start) / ITERATIONS / NUM_LOGS * 10**6
+
+# The raw path keeps the last controller per account
+expected = {}
+for account, controller in web3_decode():
+    expected.pop(account, None)
+    expected[account] = controller
+assert raw_decode() == list(expected.items()), "results differ"
+
+web3_time = per_log_us(web3_decode)
+topic_to_address.cache_clear()
+raw_cold_time = per_log_us(raw_decode)
+raw_time = per_log_us(raw_decode)
+
+print(f"{NUM_LOGS} logs, {len(expected)} distinct accounts")
+print(f"{"decoder":<24}{"per log (us)":>14}")
+print(f"{"web3 get_logs":<24}{web3_time:>14.2f}")
+print(f"{"raw (cold cache)":<24}{raw_cold_time:>14.2f}")
+print(f"{"raw":<24}{raw_time:>14.2f}")
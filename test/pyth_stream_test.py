@@ -0,0 +1,112 @@
+"""
+Test of PythStream and the PythUpdateCache REST fallback against a local Hermes stub.
+The stub streams a price update for one feed over SSE and closes the first connection
+cleanly, to check that updates are kept in memory and passed to listeners, that the
+stream reconnects no sooner than PYTH_STREAM_RECONNECT_DELAY, and that stale or never
+streamed feeds are served from the REST endpoint instead.
+
+Run from the repository root:
+    python test/pyth_stream_test.py
+"""
+import json
+import threading
+import time
+import types
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.liquidation.pyth_cache import PythUpdateCache
+from app.liquidation.pyth_stream import PythStream
+
+STREAMED_FEED = "aa" * 32
+REST_FEED = "bb" * 32
+
+connections = []
+rest_requests = []
+stopped = threading.Event()
+
+class Handler(BaseHTTPRequestHandler):
+    # Hermes streams events with chunked transfer encoding
+    protocol_version = "HTTP/1.1"
+
+    def write_chunk(self, data):
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_GET(self):
+        if self.path.startswith("/v2/updates/price/latest"):
+            rest_requests.append(self.path)
+            body = json.dumps({"binary": {"data": ["beef"]}}).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        connections.append(time.monotonic())
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        if len(connections) <= 2:
+            message = {"binary": {"data": [f"{len(connections):04x}"]},
+                       "parsed": [{"id": STREAMED_FEED,
+                                   "price": {"price": str(1000 * len(connections)),
+                                             "publish_time": len(connections)}}]}
+            self.write_chunk(f"data:{json.dumps(message)}\n\n".encode())
+        if len(connections) == 1:
+            # Clean close of the first stream
+            self.write_chunk(b"")
+            self.close_connection = True
+            return
+        stopped.wait(5)
+        self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+
+config = types.SimpleNamespace(CHAIN_ID=1,
+                               PYTH_HERMES_URL=f"http://127.0.0.1:{server.server_port}",
+                               PYTH_STREAM_ENABLED=True, PYTH_STREAM_MAX_AGE=1,
+                               PYTH_STREAM_RECONNECT_DELAY=0.3,
+                               PYTH_STREAM_MAX_RECONNECT_DELAY=1, PYTH_UPDATE_TTL=5)
+stream = PythStream.get_instance(config)
+cache = PythUpdateCache.get_instance(config)
+prices = []
+stream.add_listener(lambda feed_id, price: prices.append((feed_id, price)))
+stream.add_feed_ids(["0x" + STREAMED_FEED.upper()])
+
+deadline = time.time() + 5
+while len(prices) < 2 and time.time() < deadline:
+    time.sleep(0.01)
+
+# Both updates were received, the second one after a delayed reconnect
+assert prices == [(STREAMED_FEED, 1000), (STREAMED_FEED, 2000)], prices
+assert connections[1] - connections[0] >= config.PYTH_STREAM_RECONNECT_DELAY, connections
+assert stream.reconnects >= 1
+
+# The streamed feed is served from memory, a feed that was never streamed from REST
+assert cache.get_update_data([STREAMED_FEED]) == ["0x0002"]
+assert not rest_requests
+assert cache.get_update_data([STREAMED_FEED, REST_FEED]) == ["0xbeef"]
+assert len(rest_requests) == 1
+
+# Once the streamed update is older than PYTH_STREAM_MAX_AGE, the REST path is used
+time.sleep(config.PYTH_STREAM_MAX_AGE + 0.2)
+assert stream.get_stale_feed_ids() == [STREAMED_FEED]
+assert stream.get_update_data([STREAMED_FEED]) is None
+cache.entries.clear()
+assert cache.get_update_data([STREAMED_FEED]) == ["0xbeef"]
+assert len(rest_requests) == 2
+
+stream.stop()
+stopped.set()
+server.shutdown()
+
+gap = connections[1] - connections[0]
+print(f"{len(prices)} prices, reconnected after {gap * 1000:.0f} ms, "
+      f"{stream.hits} stream hits, {stream.misses} misses, "
+      f"{len(rest_requests)} REST requests - OK")
@@ -0,0 +1,114 @@
+"""
+Test of ReceiptTracker receipt polling against local JSON-RPC stub endpoints.
+One stub answers JSON-RPC batches, the other rejects them with a single error object like
+providers without batch support, to check that mined receipts are delivered to the
+completion callback in both cases, through one batch per block or one request per hash.
+
+Run from the repository root:
+    python test/receipt_tracker_test.py
+"""
+import json
+import threading
+import time
+import types
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from web3 import Web3
+
+from app.liquidation.nonce_manager import EOAPool
+from app.liquidation.receipt_tracker import PendingLiquidation, ReceiptTracker
+
+TX_HASH = "0x" + "ab" * 32
+PRIVATE_KEY = "0x" + "01" * 32
+
+def make_stub(accept_batches):
+    """
+    Start a stub endpoint at block 100 where TX_HASH is mined once the block reaches 101.
+    """
+    state = {"block": 100, "batches": 0, "receipt_requests": 0}
+
+    def answer(request):
+        result = None
+        if request["method"] == "eth_blockNumber":
+            result = hex(state["block"])
+        elif request["method"] == "eth_getTransactionReceipt":
+            state["receipt_requests"] += 1
+            if request["params"][0] == TX_HASH and state["block"] >= 101:
+                result = {"transactionHash": TX_HASH, "status": "0x1", "blockNumber": "0x65",
+                          "blockHash": "0x" + "22" * 32, "transactionIndex": "0x0",
+                          "from": "0x" + "11" * 20, "to": "0x" + "33" * 20,
+                          "gasUsed": "0x5208", "cumulativeGasUsed": "0x5208",
+                          "effectiveGasPrice": "0xa", "contractAddress": None, "logs": [],
+                          "logsBloom": "0x" + "00" * 256, "type": "0x0"}
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            if isinstance(request, list):
+                state["batches"] += 1
+                if accept_batches:
+                    response = [answer(item) for item in request]
+                else:
+                    response = {"jsonrpc": "2.0", "id": None,
+                                "error": {"code": -32600, "message": "batch not supported"}}
+            else:
+                response = answer(request)
+            body = json.dumps(response).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}", state
+
+def track_until_mined(chain_id, accept_batches):
+    """
+    Track TX_HASH on a new stub and return the callback results and the stub state.
+    """
+    url, state = make_stub(accept_batches)
+    config = types.SimpleNamespace(
+        CHAIN_ID=chain_id, RPC_URL=url, w3=Web3(Web3.HTTPProvider(url)),
+        liquidator=types.SimpleNamespace(events=types.SimpleNamespace(
+            Liquidation=lambda: types.SimpleNamespace(
+                process_receipt=lambda receipt, errors: list(receipt.logs)))),
+        RECEIPT_POLL_INTERVAL=0.05, RECEIPT_TIMEOUT=600, RECEIPT_SPEED_UP_BLOCKS=100,
+        RECEIPT_MAX_SPEED_UPS=0, RECEIPT_SPEED_UP_BUMP=0.125,
+        LIQUIDATOR_EOA_PRIVATE_KEY=PRIVATE_KEY, LIQUIDATOR_EOA_PRIVATE_KEYS=[],
+        NONCE_RESYNC_INTERVAL=60)
+
+    pool = EOAPool.get_instance(config)
+    signer = pool.acquire()
+    completed = []
+    tracker = ReceiptTracker.get_instance(config)
+    tracker.track(PendingLiquidation(TX_HASH, {"nonce": 0, "gasPrice": 10}, signer, 100,
+                                     lambda tx_hash, receipt: completed.append(
+                                         (tx_hash, receipt["status"], receipt.blockNumber))))
+
+    time.sleep(0.2)
+    state["block"] = 101
+    deadline = time.time() + 5
+    while not completed and time.time() < deadline:
+        time.sleep(0.02)
+
+    assert completed == [(TX_HASH, 1, 101)], completed
+    assert signer.in_flight == 0
+    assert tracker.get_metrics()["confirmed"] == 1
+    return tracker, state
+
+tracker, state = track_until_mined(1001, accept_batches=True)
+assert tracker.batch_supported and state["batches"] >= 2, state
+batch_state = dict(state)
+
+tracker, state = track_until_mined(1002, accept_batches=False)
+# The first rejected batch switches the tracker to single requests for good
+assert not tracker.batch_supported and state["batches"] == 1, state
+assert state["receipt_requests"] >= 2, state
+
+print(f"batch endpoint {batch_state}, no batch endpoint {state} - OK")
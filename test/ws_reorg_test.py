@@ -0,0 +1,95 @@
+"""
+Test of EVCListener head handling over a local WebSocket JSON-RPC stub.
+After the scan on connect, the stub pushes heads 100 to 103, then a head 104 built on a
+different branch from block 101, to check that the scanned block stays CONFIRMATION_DEPTH
+behind the head and that the reorged blocks are scanned again from the fork instead of
+being skipped.
+
+Run from the repository root:
+    python test/ws_reorg_test.py
+"""
+import json
+import threading
+import time
+import types
+
+from websockets.sync.server import serve
+
+from app.liquidation.liquidation_bot import EVCListener
+
+def block_hash(number, branch="a"):
+    return "0x" + f"{number:x}{branch}".rjust(64, "0")
+
+def header(number, branch="a", parent_branch=None):
+    return {"number": hex(number), "hash": block_hash(number, branch),
+            "parentHash": block_hash(number - 1, parent_branch or branch),
+            "baseFeePerGas": hex(7)}
+
+# The node's canonical chain once the reorg happened
+canonical = {100: block_hash(100), 101: block_hash(101, "b"), 102: block_hash(102, "b"),
+             103: block_hash(103, "b"), 104: block_hash(104, "b")}
+heads = [header(100), header(101), header(102), header(103), header(104, "b"),
+         header(105, "b")]
+received = []
+
+def handler(websocket):
+    """
+    Answer subscriptions, then push the heads one by one.
+    """
+    for index in range(2):
+        request = json.loads(websocket.recv())
+        websocket.send(json.dumps({"jsonrpc": "2.0", "id": request["id"],
+                                   "result": f"0x{index + 1:x}"}))
+    for head in heads:
+        websocket.send(json.dumps({"jsonrpc": "2.0", "method": "eth_subscription",
+                                   "params": {"subscription": "0x1", "result": head}}))
+    try:
+        websocket.recv()
+    except Exception: # pylint: disable=broad-except
+        pass
+
+class Eth:
+    def get_block(self, number):
+        # The scan on connect sees block 99 as the head
+        if number == "latest":
+            return {"number": 99, "hash": bytes.fromhex(block_hash(99)[2:]),
+                    "parentHash": bytes.fromhex(block_hash(98)[2:])}
+        return {"hash": bytes.fromhex(canonical[number][2:])}
+
+scans = []
+account_monitor = types.SimpleNamespace(latest_block=99, accounts={},
+                                        submit_account_update=lambda address: None)
+
+with serve(handler, "127.0.0.1", 0) as server:
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    config = types.SimpleNamespace(
+        CHAIN_ID=1, w3=types.SimpleNamespace(eth=Eth()), evc=None, EVC="0x" + "00" * 20,
+        EVC_LOG_EVENTS=["AccountStatusCheck"], REORG_BUFFER_SIZE=16, CONFIRMATION_DEPTH=2,
+        WS_ENABLED=True, WS_URL=f"ws://127.0.0.1:{server.socket.getsockname()[1]}",
+        WS_RECONNECT_DELAY=0.1, WS_MAX_RECONNECT_DELAY=1, WS_MESSAGE_TIMEOUT=5,
+        BLOCK_CONTEXT_MAX_AGE=12)
+
+    listener = EVCListener(account_monitor, config)
+    listener.fetch_account_status_checks = lambda start, end: scans.append((start, end)) or []
+    on_new_head = listener.on_new_head
+
+    def record_head(head):
+        on_new_head(head)
+        received.append((int(head["number"], 16), account_monitor.latest_block))
+
+    listener.subscriber.on_head = record_head
+    listener.subscriber.start()
+
+    deadline = time.time() + 10
+    while len(received) < len(heads) and time.time() < deadline:
+        time.sleep(0.05)
+    listener.stop()
+    server.shutdown()
+
+# Up to head 103 the scanned block trails the head by CONFIRMATION_DEPTH
+assert received[:4] == [(100, 99), (101, 99), (102, 100), (103, 101)], received
+# Head 104 replaces blocks from 101, which are scanned again up to 104 - CONFIRMATION_DEPTH
+assert scans == [(101, 102)], scans
+assert received[4:] == [(104, 102), (105, 103)], received
+assert listener.head_follower.get_metrics()["reorgs"] == 1
+print(f"scanned blocks per head {received}, re-scans {scans} - OK")
@@ -0,0 +1,85 @@
+"""
+Test of WebSocketSubscriber against a local WebSocket JSON-RPC stub.
+The stub accepts eth_subscribe for newHeads and logs, pushes a few heads and an
+AccountStatusCheck log, then drops the connection to check the subscriber reconnects,
+resubscribes and calls the connect callback again so missed blocks can be filled.
+
+Run from the repository root:
+    python test/ws_subscriber_test.py
+"""
+import json
+import threading
+import time
+import types
+
+from websockets.sync.server import serve
+
+from app.liquidation.evc_logs import ACCOUNT_STATUS_CHECK_TOPIC, decode_account_events
+from app.liquidation.ws_subscriber import WebSocketSubscriber
+
+EVC = "0x0c9a3dd6b8f28529d72d7f9ce918d493519ee383"
+ACCOUNT_TOPIC = "0x" + "00" * 12 + "11" * 20
+CONTROLLER_TOPIC = "0x" + "00" * 12 + "22" * 20
+
+connections = []
+
+def handler(websocket):
+    """
+    Answer subscriptions, push two heads and a log, then close on the first connection.
+    """
+    connections.append(websocket)
+    subscription_ids = {}
+    for _ in range(2):
+        request = json.loads(websocket.recv())
+        kind = request["params"][0]
+        subscription_ids[kind] = f"0x{len(subscription_ids) + 1:x}"
+        if kind == "logs":
+            assert request["params"][1]["topics"] == [[ACCOUNT_STATUS_CHECK_TOPIC]]
+        websocket.send(json.dumps({"jsonrpc": "2.0", "id": request["id"],
+                                   "result": subscription_ids[kind]}))
+
+    def notify(kind, result):
+        websocket.send(json.dumps({"jsonrpc": "2.0", "method": "eth_subscription",
+                                   "params": {"subscription": subscription_ids[kind],
+                                              "result": result}}))
+
+    block = 100 if len(connections) == 1 else 200
+    notify("newHeads", {"number": hex(block)})
+    notify("logs", {"address": EVC, "blockNumber": hex(block),
+                    "topics": [ACCOUNT_STATUS_CHECK_TOPIC, ACCOUNT_TOPIC, CONTROLLER_TOPIC],
+                    "data": "0x"})
+    notify("newHeads", {"number": hex(block + 1)})
+
+    if len(connections) == 1:
+        return
+    try:
+        websocket.recv()
+    except Exception: # pylint: disable=broad-except
+        pass
+
+config = types.SimpleNamespace(WS_RECONNECT_DELAY=0.1, WS_MAX_RECONNECT_DELAY=1,
+                               WS_MESSAGE_TIMEOUT=5)
+heads, logs, connects = [], [], []
+
+with serve(handler, "127.0.0.1", 0) as server:
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"ws://127.0.0.1:{server.socket.getsockname()[1]}"
+
+    subscriber = WebSocketSubscriber(config, url,
+                                     {"address": EVC, "topics": [[ACCOUNT_STATUS_CHECK_TOPIC]]},
+                                     on_head=lambda head: heads.append(int(head["number"], 16)),
+                                     on_log=logs.append,
+                                     on_connect=lambda: connects.append(time.time()))
+    subscriber.start()
+
+    deadline = time.time() + 10
+    while len(heads) < 4 and time.time() < deadline:
+        time.sleep(0.05)
+    subscriber.stop()
+    server.shutdown()
+
+assert heads == [100, 101, 200, 201], heads
+assert len(connects) == 2 and subscriber.reconnects >= 1, (connects, subscriber.reconnects)
+assert [decode_account_events([log]) for log in logs] == [
+    [("0x" + "11" * 20, "0x" + "22" * 20)]] * 2, logs
+print(f"heads {heads}, {len(logs)} logs, {len(connects)} connections - OK")